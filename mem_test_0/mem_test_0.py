@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+import pathlib
+import tkinter as tk
+import pygubu
+
+PROJECT_PATH = pathlib.Path(__file__).parent
+PROJECT_UI = PROJECT_PATH / "mem_test_0.ui"
+
+
+class MemTest0App:
+    def __init__(self, master=None):
+        self.builder = pygubu.Builder()
+        self.builder.add_from_file(PROJECT_UI)
+        self.mainwindow = self.builder.get_object('mainwindow', master)
+        self.builder.connect_callbacks(self)
+
+    def on_button_click(self):
+        print("on_button_click triggered")
+
+    def run(self):
+        self.mainwindow.mainloop()
+
+
+if __name__ == '__main__':
+    app = MemTest0App()
+    app.run()
@@ -1,24 +1,17 @@
 #!/usr/bin/env python3
 """Project analysis for AI insights"""
-from defusedxml import ElementTree as ET
-from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 from collections import Counter
+from .snapshot import ProjectSnapshot
 
 
-def analyze_project(project_name: str) -> Dict:
+def analyze_project(project_name: str, snapshot: Optional[ProjectSnapshot] = None) -> Dict:
     """Analyze project structure and complexity"""
-    from .registry import Registry
-
-    registry = Registry()
-    project_path = registry.get_project(project_name)
-
-    if not project_path:
+    if snapshot is None:
+        snapshot = ProjectSnapshot.load(project_name)
+    if snapshot is None:
         return {"error": f"Project '{project_name}' not found"}
 
-    ui_file = Path(project_path) / f"{project_name}.ui"
-    py_file = Path(project_path) / f"{project_name}.py"
-
     analysis = {
         "project": project_name,
         "complexity": 0.0,
@@ -29,11 +22,11 @@ def analyze_project(project_name: str) -> Dict:
         "suggestions": [],
     }
 
-    if ui_file.exists():
-        _analyze_ui(ui_file, analysis)
+    if snapshot.nodes:
+        _analyze_ui(snapshot, analysis)
 
-    if py_file.exists():
-        _analyze_code(py_file, analysis)
+    if snapshot.code is not None:
+        _analyze_code(snapshot.code, analysis)
 
     _calculate_complexity(analysis)
     _generate_suggestions(analysis)
@@ -41,47 +34,26 @@ def analyze_project(project_name: str) -> Dict:
     return analysis
 
 
-def _analyze_ui(ui_file: Path, analysis: Dict) -> None:
-    """Analyze UI file"""
-    try:
-        tree = ET.parse(ui_file)
-        root = tree.getroot()
-
-        widgets = root.findall(".//object[@id]")
-        analysis["widget_count"] = len(widgets)
-
-        widget_types: Counter[str] = Counter()
-        layouts = set()
-        callbacks = set()
-
-        for obj in widgets:
-            widget_class = obj.get("class", "")
-            widget_types[widget_class] += 1
-
-            layout = obj.find("layout")
-            if layout is not None:
-                layouts.add(layout.get("manager", ""))
-
-            for prop in obj.findall("property[@name='command']"):
-                if prop.text:
-                    callbacks.add(prop.text)
+def _analyze_ui(snapshot: ProjectSnapshot, analysis: Dict) -> None:
+    """Analyze parsed UI widgets"""
+    widget_types: Counter[str] = Counter()
+    layouts = set()
 
-        analysis["widget_types"] = dict(widget_types)
-        analysis["layout_patterns"] = list(layouts)
-        analysis["callback_count"] = len(callbacks)
+    for node in snapshot.nodes.values():
+        widget_types[node.cls] += 1
+        if node.layout is not None:
+            layouts.add(node.layout.get("manager", ""))
 
-    except Exception:
-        pass
+    analysis["widget_count"] = len(snapshot.nodes)
+    analysis["widget_types"] = dict(widget_types)
+    analysis["layout_patterns"] = list(layouts)
+    analysis["callback_count"] = len(snapshot.callbacks)
 
 
-def _analyze_code(py_file: Path, analysis: Dict) -> None:
+def _analyze_code(content: str, analysis: Dict) -> None:
     """Analyze Python code"""
-    try:
-        content = py_file.read_text()
-        analysis["code_lines"] = len(content.splitlines())
-        analysis["has_docstrings"] = '"""' in content or "'''" in content
-    except Exception:
-        pass
+    analysis["code_lines"] = len(content.splitlines())
+    analysis["has_docstrings"] = '"""' in content or "'''" in content
 
 
 def _calculate_complexity(analysis: Dict) -> None:
@@ -1,107 +1,288 @@
 #!/usr/bin/env python3
 """AI context generation for enhanced Amazon Q integration"""
 import json
+import hashlib
+import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
+from .snapshot import ProjectSnapshot
 
+logger = logging.getLogger(__name__)
+
+# Sections are packed into the token budget in this order
+SECTION_PRIORITY = ("metrics", "callbacks", "widgets", "history")
+DEFAULT_TOKEN_BUDGET = 2000
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budget packing"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def get_token_budget() -> int:
+    """Get context token budget from config or default"""
+    from .config import Config
 
-def generate_context(project_name: str) -> Dict:
-    """Generate rich AI context for project"""
-    from .registry import Registry
-    from .db import get_session, SQLALCHEMY_AVAILABLE
-
-    registry = Registry()
-    project_path = registry.get_project(project_name)
-
-    if not project_path:
-        return {"error": f"Project '{project_name}' not found"}
-
-    context: Dict = {
-        "project": project_name,
-        "path": project_path,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "widgets": [],
-        "callbacks": [],
-        "history": [],
-        "metrics": {},
-    }
-
-    # Get widget info from UI file
-    ui_file = Path(project_path) / f"{project_name}.ui"
-    if ui_file.exists():
-        widgets, callbacks = _parse_ui_file(ui_file)
-        context["widgets"] = widgets
-        context["callbacks"] = callbacks
-        metrics_dict: Dict = context["metrics"]
-        metrics_dict["widget_count"] = len(widgets)
-        metrics_dict["callback_count"] = len(callbacks)
-
-    # Get history from database if available
-    if SQLALCHEMY_AVAILABLE:
-        session = get_session()
-        if session:
-            try:
-                from .db.operations import get_workflow_events
-
-                events = get_workflow_events(session, project_name, limit=10)
-                history_list: List = [
-                    {"action": e.action, "description": e.description, "timestamp": e.timestamp.isoformat()}
-                    for e in events
-                ]
-                context["history"] = history_list
-            finally:
-                session.close()
-
-    return context
-
-
-def _parse_ui_file(ui_file: Path) -> Tuple[List[Dict[str, str]], List[str]]:
-    """Parse UI file for widgets and callbacks"""
     try:
-        from defusedxml.ElementTree import parse
-        tree = parse(ui_file)
-        root = tree.getroot()
+        budget = int(Config().get("ai_context_token_budget", DEFAULT_TOKEN_BUDGET))
+        return budget if budget > 0 else DEFAULT_TOKEN_BUDGET
+    except (ValueError, TypeError):
+        return DEFAULT_TOKEN_BUDGET
+
+
+class ContextBuilder:
+    """Builds project context section by section, reusing cached sections.
+
+    Each section is stored with the fingerprint of its inputs (UI file stat
+    for widgets/callbacks/metrics, latest events for history) so unchanged
+    sections are not recomputed, and the fingerprints last handed to the
+    assistant are remembered so only changed sections need to be emitted.
+    """
+
+    def __init__(self, project_name: str, cache_dir: Optional[Path] = None):
+        from .cache import CACHE_DIR
+
+        self.project_name = project_name
+        self.cache_file = (cache_dir or CACHE_DIR) / f"context_{project_name}.json"
+        self._state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load cached sections and emitted fingerprints"""
+        try:
+            state = json.loads(self.cache_file.read_text())
+            if isinstance(state, dict):
+                state.setdefault("sections", {})
+                state.setdefault("emitted", {})
+                return state
+        except (OSError, ValueError) as e:
+            logger.debug(f"No context cache for {self.project_name}: {e}")
+        return {"sections": {}, "emitted": {}}
 
-        widgets: List[Dict[str, str]] = []
-        callbacks = set()
+    def _save_state(self) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(json.dumps(self._state))
+        except OSError as e:
+            logger.warning(f"Failed to save context cache: {e}")
 
-        for obj in root.findall(".//object[@id]"):
-            widget_id = obj.get("id")
-            widget_class = obj.get("class")
-            if widget_id and widget_class:
-                widgets.append({"id": widget_id, "class": widget_class})
+    def _section(self, name: str, fingerprint: str, compute: Callable[[], Any]) -> Any:
+        """Return cached section data or compute and cache it"""
+        cached = self._state["sections"].get(name)
+        if cached and cached.get("fingerprint") == fingerprint:
+            return cached["data"]
+        data = compute()
+        self._state["sections"][name] = {"fingerprint": fingerprint, "data": data}
+        return data
+
+    def build(self, snapshot: Optional[ProjectSnapshot] = None) -> Dict:
+        """Build full context, recomputing only sections whose inputs changed.
+
+        Args:
+            snapshot: Already parsed project to reuse instead of re-reading files
+
+        Returns:
+            Context dict; "fingerprints" maps section name to input fingerprint
+            and "changed" lists sections that differ from the last emitted context.
+        """
+        if snapshot is not None:
+            project_path: Optional[str] = str(snapshot.path)
+        else:
+            from .registry import Registry
+
+            project_path = Registry().get_project(self.project_name)
+        if not project_path:
+            return {"error": f"Project '{self.project_name}' not found"}
+
+        ui_file = Path(project_path) / f"{self.project_name}.ui"
+        ui_fingerprint = _file_fingerprint(ui_file)
+
+        def parse_ui_section() -> Tuple[List[Dict[str, Any]], List[str]]:
+            if snapshot is not None:
+                return _summarize_nodes(snapshot.nodes)
+            return _parse_ui_file(ui_file)
+
+        widgets: List[Dict[str, Any]] = []
+        callbacks: List[str] = []
+        if ui_fingerprint != "missing":
+            widgets, callbacks = self._section("ui", ui_fingerprint, parse_ui_section)
+        history = _load_history(self.project_name)
+        history_fingerprint = hashlib.sha256(json.dumps(history, sort_keys=True).encode()).hexdigest()[:16]
+
+        fingerprints = {
+            "metrics": ui_fingerprint,
+            "callbacks": ui_fingerprint,
+            "widgets": ui_fingerprint,
+            "history": history_fingerprint,
+        }
+        emitted = self._state["emitted"]
+        metrics = {}
+        if ui_fingerprint != "missing":
+            metrics = {"widget_count": len(widgets), "callback_count": len(callbacks)}
+        context: Dict = {
+            "project": self.project_name,
+            "path": project_path,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "widgets": widgets,
+            "callbacks": callbacks,
+            "history": history,
+            "metrics": metrics,
+            "fingerprints": fingerprints,
+            "changed": [name for name in SECTION_PRIORITY if emitted.get(name) != fingerprints[name]],
+        }
+        self._save_state()
+        return context
+
+    def mark_emitted(self, context: Dict) -> None:
+        """Remember the section fingerprints handed to the assistant.
+
+        After format_for_ai only the sections it wrote in full are marked;
+        sections cut by the token budget are sent again next time.
+        """
+        fingerprints = context.get("fingerprints", {})
+        sent = context.get("emitted_sections", list(fingerprints))
+        self._state["emitted"].update({name: fingerprints[name] for name in sent if name in fingerprints})
+        self._save_state()
+
+
+def _file_fingerprint(path: Path) -> str:
+    """Cheap fingerprint of a file from its stat"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return "missing"
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
 
-            for prop in obj.findall("property[@name='command']"):
-                if prop.text:
-                    callbacks.add(prop.text)
 
-        return widgets, list(callbacks)
+def _load_history(project_name: str, limit: int = 10) -> List[Dict[str, str]]:
+    """Load recent workflow events from the database if available"""
+    from .db import session_scope, SQLALCHEMY_AVAILABLE
+
+    if not SQLALCHEMY_AVAILABLE:
+        return []
+    with session_scope() as session:
+        if session is None:
+            return []
+        from .db.operations import get_workflow_events
+
+        events = get_workflow_events(session, project_name, limit=limit)
+        return [
+            {"action": e.action, "description": e.description, "timestamp": e.timestamp.isoformat()} for e in events
+        ]
+
+
+def generate_context(project_name: str, snapshot: Optional[ProjectSnapshot] = None) -> Dict:
+    """Generate rich AI context for project"""
+    return ContextBuilder(project_name).build(snapshot)
+
+
+def _summarize_nodes(nodes: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Widgets and callbacks of a parsed UI tree"""
+    widgets: List[Dict[str, Any]] = []
+    callbacks = set()
+
+    for node in nodes.values():
+        if node.cls:
+            widgets.append({"id": node.id, "class": node.cls, "parent": node.parent})
+        command = node.properties.get("command")
+        if command:
+            callbacks.add(command)
+
+    return widgets, sorted(callbacks)
+
+
+def _parse_ui_file(ui_file: Path) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Parse UI file for widgets and callbacks"""
+    try:
+        from .uidiff import parse_ui
+
+        return _summarize_nodes(parse_ui(ui_file))
     except Exception:
         return [], []
 
 
-def format_for_ai(context: Dict) -> str:
-    """Format context for AI consumption"""
-    lines = [
-        f"# Project: {context['project']}",
-        f"Path: {context['path']}",
-        "",
-        f"## Widgets ({context['metrics'].get('widget_count', 0)})",
-    ]
+def _render_sections(context: Dict) -> Dict[str, List[str]]:
+    """Render each section as heading plus item lines"""
+    sections: Dict[str, List[str]] = {}
+    metrics = context.get("metrics", {})
 
-    for widget in context.get("widgets", [])[:10]:
-        lines.append(f"- {widget['id']}: {widget['class']}")
+    if metrics:
+        sections["metrics"] = ["## Metrics"] + [f"- {key}: {value}" for key, value in metrics.items()]
 
     if context.get("callbacks"):
-        lines.append(f"\n## Callbacks ({len(context['callbacks'])})")
-        for cb in context["callbacks"]:
-            lines.append(f"- {cb}")
+        sections["callbacks"] = [f"## Callbacks ({len(context['callbacks'])})"] + [
+            f"- {cb}" for cb in context["callbacks"]
+        ]
+
+    widgets = context.get("widgets", [])
+    if widgets:
+        depth: Dict[Optional[str], int] = {None: 0}
+        lines = [f"## Widgets ({metrics.get('widget_count', len(widgets))})"]
+        for widget in widgets:
+            level = depth.get(widget.get("parent"), 0)
+            depth[widget["id"]] = level + 1
+            lines.append(f"{'  ' * level}- {widget['id']}: {widget['class']}")
+        sections["widgets"] = lines
 
     if context.get("history"):
-        lines.append("\n## Recent History")
-        for event in context["history"][:5]:
-            lines.append(f"- {event['action']}: {event['description']}")
+        sections["history"] = ["## Recent History"] + [
+            f"- {event['action']}: {event['description']}" for event in context["history"]
+        ]
+
+    return sections
+
+
+def format_for_ai(context: Dict, token_budget: Optional[int] = None, only_changed: bool = False) -> str:
+    """Format context for AI consumption.
+
+    Sections are added in SECTION_PRIORITY order until the token budget is
+    used up; a section that does not fit is cut at the last whole line.
+    The sections written in full (or with nothing to show) are recorded in
+    context["emitted_sections"] for ContextBuilder.mark_emitted.
+
+    Args:
+        context: Result of generate_context
+        token_budget: Maximum estimated tokens (default: from config)
+        only_changed: Emit only sections listed in context["changed"]
+    """
+    budget = token_budget if token_budget is not None else get_token_budget()
+    lines = [f"# Project: {context['project']}", f"Path: {context['path']}"]
+    used = sum(estimate_tokens(line) for line in lines)
+
+    sections = _render_sections(context)
+    changed = set(context.get("changed", SECTION_PRIORITY))
+    skipped = []
+    emitted = []
+
+    for name in SECTION_PRIORITY:
+        if name not in sections:
+            emitted.append(name)
+            continue
+        if only_changed and name not in changed:
+            skipped.append(name)
+            continue
+
+        heading, *items = sections[name]
+        cost = estimate_tokens(heading) + 1
+        if used + cost > budget:
+            break
+        lines.extend(["", heading])
+        used += cost
+        for i, item in enumerate(items):
+            cost = estimate_tokens(item)
+            if used + cost > budget:
+                lines.append(f"- ... {len(items) - i} more")
+                used = budget
+                break
+            lines.append(item)
+            used += cost
+        else:
+            emitted.append(name)
+
+    context["emitted_sections"] = emitted
+    if skipped:
+        lines.extend(["", f"Unchanged since last context: {', '.join(skipped)}"])
 
     return "\n".join(lines)
 
@@ -109,23 +290,27 @@ def format_for_ai(context: Dict) -> str:
 def main():
     """CLI entry point"""
     import sys
+    import argparse
 
-    if len(sys.argv) < 2:
-        print("Usage: pygubu-ai-context <project>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(prog="pygubu-ai-context", description="Generate AI context for a project")
+    parser.add_argument("project", help="Project name")
+    parser.add_argument("--budget", type=int, metavar="TOKENS", help="Token budget (default: from config or 2000)")
+    parser.add_argument("--delta", action="store_true", help="Only emit sections changed since the last context")
+    args = parser.parse_args()
 
-    project_name = sys.argv[1]
-    context = generate_context(project_name)
+    builder = ContextBuilder(args.project)
+    context = builder.build()
 
     if "error" in context:
         print(f"Error: {context['error']}")
         sys.exit(1)
 
     # Output formatted context
-    print(format_for_ai(context))
+    print(format_for_ai(context, token_budget=args.budget, only_changed=args.delta))
+    builder.mark_emitted(context)
 
     # Also save JSON for programmatic use
-    output_file = Path.home() / ".amazonq" / "prompts" / f"{project_name}-context.json"
+    output_file = Path.home() / ".amazonq" / "prompts" / f"{args.project}-context.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with open(output_file, "w") as f:
         json.dump(context, f, indent=2)
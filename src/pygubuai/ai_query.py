@@ -1,34 +1,46 @@
 #!/usr/bin/env python3
 """Natural language queries for project analysis"""
 import re
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+from .snapshot import ProjectSnapshot
 
 
-def query_project(project_name: str, query: str) -> str:
+def query_project(project_name: str, query: str, snapshot: Optional[ProjectSnapshot] = None) -> str:
     """Answer natural language queries about project"""
+    return query_batch(project_name, [query], snapshot)[0]
+
+
+def query_batch(project_name: str, queries: List[str], snapshot: Optional[ProjectSnapshot] = None) -> List[str]:
+    """Answer many queries against one parse of the project.
+
+    Args:
+        project_name: Registered project name
+        queries: Natural language queries
+        snapshot: Already loaded project (default: load once here)
+
+    Returns:
+        One answer per query, in order
+    """
     from .ai_analyzer import analyze_project
     from .ai_context import generate_context
 
-    analysis = analyze_project(project_name)
-    context = generate_context(project_name)
+    if snapshot is None:
+        snapshot = ProjectSnapshot.load(project_name)
+    if snapshot is None:
+        return [f"Error: Project '{project_name}' not found"] * len(queries)
 
-    if "error" in analysis:
-        return f"Error: {analysis['error']}"
+    analysis = analyze_project(project_name, snapshot)
+    context = generate_context(project_name, snapshot)
 
-    query_lower = query.lower()
+    return [_answer(analysis, context, query) for query in queries]
 
-    patterns = [
-        (r"how many (widgets?|buttons?|entries?|labels?)", _count_widgets),
-        (r"what (callbacks?|handlers?|events?)", _list_callbacks),
-        (r"(unused|missing) (callbacks?|handlers?)", _find_unused),
-        (r"complexity|complex", _get_complexity),
-        (r"suggestions?|improvements?|recommendations?", _get_suggestions),
-        (r"layout|manager", _get_layout_info),
-        (r"widget types?|what widgets", _list_widget_types),
-    ]
 
-    for pattern, handler in patterns:
-        if re.search(pattern, query_lower):
+def _answer(analysis: Dict, context: Dict, query: str) -> str:
+    """Dispatch a query to the first matching handler"""
+    query_lower = query.lower()
+
+    for pattern, handler in QUERY_PATTERNS:
+        if pattern.search(query_lower):
             return handler(analysis, context, query_lower)
 
     return "I don't understand that query. Try: 'How many widgets?', 'What callbacks?', 'Show complexity'"
@@ -106,20 +118,56 @@ def _list_widget_types(analysis: Dict, context: Dict, query: str) -> str:
     return "\n".join(lines)
 
 
+QUERY_PATTERNS: List[Tuple[Pattern[str], Callable[[Dict, Dict, str], str]]] = [
+    (re.compile(pattern), handler)
+    for pattern, handler in (
+        (r"how many (widgets?|buttons?|entries?|labels?)", _count_widgets),
+        (r"what (callbacks?|handlers?|events?)", _list_callbacks),
+        (r"(unused|missing) (callbacks?|handlers?)", _find_unused),
+        (r"complexity|complex", _get_complexity),
+        (r"suggestions?|improvements?|recommendations?", _get_suggestions),
+        (r"layout|manager", _get_layout_info),
+        (r"widget types?|what widgets", _list_widget_types),
+    )
+]
+
+
 def main():
     """CLI entry point"""
     import sys
 
     if len(sys.argv) < 3:
         print("Usage: pygubu-ai-query <project> '<query>'")
+        print("       pygubu-ai-query <project> --batch [file|-]")
         print("\nExample queries:")
         print("  'How many widgets?'")
         print("  'What callbacks are defined?'")
         print("  'Show complexity'")
         print("  'What are the suggestions?'")
+        print("\n--batch answers one query per line from a file or stdin")
         sys.exit(1)
 
     project_name = sys.argv[1]
+
+    if sys.argv[2] == "--batch":
+        source = sys.argv[3] if len(sys.argv) > 3 else "-"
+        try:
+            if source == "-":
+                lines = sys.stdin.read().splitlines()
+            else:
+                with open(source, encoding="utf-8") as f:
+                    lines = f.read().splitlines()
+        except OSError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+        queries = [line.strip() for line in lines if line.strip()]
+        for query, answer in zip(queries, query_batch(project_name, queries)):
+            print(f"Q: {query}")
+            print(answer)
+            print()
+        return
+
     query = " ".join(sys.argv[2:])
 
     result = query_project(project_name, query)
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 """AI-powered refactoring suggestions"""
+import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, asdict, field, replace
+from .ai_analyzer import analyze_project
+from .snapshot import ProjectSnapshot
 
 
 @dataclass
@@ -17,18 +21,88 @@ class Suggestion:
     auto_fixable: bool
 
 
-def analyze_refactoring_opportunities(project_name: str) -> List[Suggestion]:
-    """Analyze project for refactoring opportunities"""
-    from .registry import Registry
-    from .ai_analyzer import analyze_project
+IMPACT_WEIGHTS = {"high": 3, "medium": 2, "low": 1}
 
-    registry = Registry()
-    project_path = registry.get_project(project_name)
 
-    if not project_path:
+@dataclass
+class FleetSummary:
+    """Suggestions across many projects.
+
+    Columnar layout: one column per suggestion id holding the indexes of
+    the projects it applies to, and a parallel column of each project's
+    description (which quotes that project's counts). details holds the
+    project-independent fields, with an empty description.
+    """
+
+    projects: List[str] = field(default_factory=list)
+    columns: Dict[str, List[int]] = field(default_factory=dict)
+    descriptions: Dict[str, List[str]] = field(default_factory=dict)
+    details: Dict[str, Suggestion] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def add(self, project_name: str, suggestions: List[Suggestion]) -> None:
+        """Append one project's suggestions"""
+        index = len(self.projects)
+        self.projects.append(project_name)
+        for suggestion in suggestions:
+            self.columns.setdefault(suggestion.id, []).append(index)
+            self.descriptions.setdefault(suggestion.id, []).append(suggestion.description)
+            if suggestion.id not in self.details:
+                self.details[suggestion.id] = replace(suggestion, description="")
+
+    def projects_for(self, suggestion_id: str) -> List[str]:
+        """Projects a suggestion applies to"""
+        return [self.projects[i] for i in self.columns.get(suggestion_id, [])]
+
+    def descriptions_for(self, suggestion_id: str) -> Dict[str, str]:
+        """Each project's description of a suggestion"""
+        return dict(zip(self.projects_for(suggestion_id), self.descriptions.get(suggestion_id, [])))
+
+    def rank(self, top: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """Rank suggestions by fleet-wide impact.
+
+        Returns:
+            (suggestion id, project count, score) sorted by score, where score
+            is the project count weighted by the suggestion's impact
+        """
+        ranked = []
+        for suggestion_id, indexes in self.columns.items():
+            weight = IMPACT_WEIGHTS.get(self.details[suggestion_id].impact, 1)
+            ranked.append((suggestion_id, len(indexes), len(indexes) * weight))
+        ranked.sort(key=lambda r: (-r[2], -r[1], r[0]))
+        return ranked[:top] if top else ranked
+
+    def to_dict(self) -> Dict:
+        """Serializable form of the summary"""
+        return {
+            "projects": self.projects,
+            "suggestions": {
+                suggestion_id: {
+                    **asdict(self.details[suggestion_id]),
+                    "projects": self.projects_for(suggestion_id),
+                    "descriptions": self.descriptions_for(suggestion_id),
+                }
+                for suggestion_id in self.columns
+            },
+            "ranking": [{"id": sid, "projects": count, "score": score} for sid, count, score in self.rank()],
+            "errors": self.errors,
+        }
+
+
+def analyze_refactoring_opportunities(
+    project_name: str, snapshot: Optional[ProjectSnapshot] = None
+) -> List[Suggestion]:
+    """Analyze project for refactoring opportunities"""
+    if snapshot is None:
+        snapshot = ProjectSnapshot.load(project_name)
+    if snapshot is None:
         return []
 
-    analysis = analyze_project(project_name)
+    return _suggestions_for(analyze_project(project_name, snapshot))
+
+
+def _suggestions_for(analysis: Dict) -> List[Suggestion]:
+    """Run every check against a project analysis"""
     suggestions = []
 
     suggestions.extend(_check_widget_consolidation(analysis))
@@ -40,6 +114,56 @@ def analyze_refactoring_opportunities(project_name: str) -> List[Suggestion]:
     return suggestions
 
 
+def _analyze_fleet_project(item: Tuple[str, str]) -> Tuple[str, List[Suggestion], Optional[str]]:
+    """Process pool worker: analyze one project directory"""
+    name, path = item
+    try:
+        snapshot = ProjectSnapshot.from_path(name, path)
+        return name, _suggestions_for(analyze_project(name, snapshot)), None
+    except Exception as e:
+        return name, [], str(e)
+
+
+def analyze_fleet(projects: Optional[Dict[str, str]] = None, jobs: Optional[int] = None) -> FleetSummary:
+    """Analyze many projects in a process pool.
+
+    Args:
+        projects: Project name to path (default: all registered projects)
+        jobs: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        FleetSummary with results streamed in as each project finishes
+    """
+    if projects is None:
+        from .registry import Registry
+
+        projects = Registry().list_projects()
+
+    summary = FleetSummary()
+    items = sorted(projects.items())
+    if not items:
+        return summary
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(items) == 1:
+        results = map(_analyze_fleet_project, items)
+        _collect(summary, results)
+        return summary
+
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        _collect(summary, executor.map(_analyze_fleet_project, items, chunksize=chunksize))
+    return summary
+
+
+def _collect(summary: FleetSummary, results: Iterable[Tuple[str, List[Suggestion], Optional[str]]]) -> None:
+    for name, suggestions, error in results:
+        if error:
+            summary.errors[name] = error
+        else:
+            summary.add(name, suggestions)
+
+
 def _check_widget_consolidation(analysis: Dict) -> List[Suggestion]:
     """Check for widget consolidation opportunities"""
     suggestions = []
@@ -229,14 +353,64 @@ def save_suggestions(project_name: str, suggestions: List[Suggestion]):
     return output_file
 
 
+def save_fleet_summary(summary: FleetSummary) -> Path:
+    """Save fleet summary to file"""
+    output_dir = Path.home() / ".amazonq" / "prompts"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    output_file = output_dir / "fleet-suggestions.json"
+    with open(output_file, "w") as f:
+        json.dump(summary.to_dict(), f, indent=2)
+
+    return output_file
+
+
+def _fleet_main(args: List[str]) -> None:
+    """Handle pygubu-ai-refactor --all [--jobs N] [--top N]"""
+    import sys
+
+    jobs = None
+    top = 10
+    try:
+        if "--jobs" in args:
+            jobs = int(args[args.index("--jobs") + 1])
+        if "--top" in args:
+            top = int(args[args.index("--top") + 1])
+    except (IndexError, ValueError):
+        print("Error: --jobs and --top require a number")
+        sys.exit(1)
+
+    summary = analyze_fleet(jobs=jobs)
+    if not summary.projects and not summary.errors:
+        print("No projects registered")
+        return
+
+    print(f"Fleet refactoring summary ({len(summary.projects)} projects):\n")
+    for i, (suggestion_id, count, score) in enumerate(summary.rank(top), 1):
+        sug = summary.details[suggestion_id]
+        print(f"{i}. [{sug.category.upper()}] {sug.title}")
+        print(f"   {count} projects | Impact: {sug.impact} | Effort: {sug.effort} | Score: {score}")
+
+    for name, error in sorted(summary.errors.items()):
+        print(f"Warning: {name}: {error}")
+
+    output_file = save_fleet_summary(summary)
+    print(f"\nSummary saved to: {output_file}")
+
+
 def main():
     """CLI entry point"""
     import sys
 
     if len(sys.argv) < 2:
         print("Usage: pygubu-ai-refactor <project>")
+        print("       pygubu-ai-refactor --all [--jobs N] [--top N]")
         sys.exit(1)
 
+    if sys.argv[1] == "--all":
+        _fleet_main(sys.argv[2:])
+        return
+
     project_name = sys.argv[1]
     suggestions = analyze_refactoring_opportunities(project_name)
 
@@ -1,28 +1,484 @@
 """Backup and rollback functionality"""
 
+import hashlib
+import json
+import os
 import shutil
 import logging
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from pathlib import Path
+from stat import S_ISREG
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from filelock import FileLock
+except ImportError:
+    FileLock = None  # type: ignore[assignment,misc]
 
 logger = logging.getLogger(__name__)
 
+BACKUP_DIR_NAME = ".pygubuai_backups"
+MANIFEST_VERSION = 1
+# Never part of a snapshot: VCS metadata, caches and the backup store itself
+DEFAULT_EXCLUDES = frozenset({".git", ".hg", ".svn", "__pycache__", ".venv", BACKUP_DIR_NAME})
+CHUNK_SIZE = 1024 * 1024
 
-def create_backup(project_path: Path) -> Optional[Path]:
-    """Create backup of project directory"""
-    if not project_path.exists():
+
+@dataclass
+class RetentionPolicy:
+    """Snapshots to keep: the newest keep_last, plus the newest snapshot of
+    each of the last `hourly` hours, `daily` days and `weekly` ISO weeks
+    that have one. Zero disables a rule.
+    """
+
+    keep_last: int = 10
+    hourly: int = 24
+    daily: int = 7
+    weekly: int = 4
+
+    @classmethod
+    def from_config(cls) -> "RetentionPolicy":
+        from .config import Config
+
+        configured = Config().get("backup_retention", {})
+        if not isinstance(configured, dict):
+            return cls()
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: int(value) for key, value in configured.items() if key in names})
+
+    def select(self, entries: List[Dict[str, Any]]) -> Set[str]:
+        """Ids of catalog entries to keep"""
+        newest_first = sorted(entries, key=lambda e: e["created"], reverse=True)
+        keep = {entry["id"] for entry in newest_first[: self.keep_last]}
+        for count, bucket in (
+            (self.hourly, lambda d: d.strftime("%Y-%m-%d %H")),
+            (self.daily, lambda d: d.strftime("%Y-%m-%d")),
+            (self.weekly, lambda d: d.isocalendar()[:2]),
+        ):
+            seen: Set[Any] = set()
+            for entry in newest_first:
+                if len(seen) >= count:
+                    break
+                key = bucket(datetime.fromisoformat(entry["created"]))
+                if key not in seen:
+                    seen.add(key)
+                    keep.add(entry["id"])
+        return keep
+
+
+class SnapshotStore:
+    """Content-addressed store of project snapshots.
+
+    File contents are kept once under objects/<hash[:2]>/<hash>, shared by
+    every snapshot; a snapshot is a small JSON manifest under snapshots/
+    mapping relative paths to content hash, size, mode and mtime.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+        self.catalog_dir = self.root / "catalog"
+        self.refs_file = self.root / "refs.json"
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _store_object(self, source: Path) -> Tuple[str, bool]:
+        """Hash a file while copying it into the store.
+
+        Returns:
+            (content hash, True if a new object was written)
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_name = tempfile.mkstemp(dir=self.objects_dir, prefix=".tmp-")
+        try:
+            with open(source, "rb") as src, os.fdopen(fd, "wb") as tmp:
+                for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    tmp.write(chunk)
+            target = self.object_path(digest.hexdigest())
+            if target.exists():
+                return digest.hexdigest(), False
+            target.parent.mkdir(exist_ok=True)
+            os.replace(tmp_name, target)
+            return digest.hexdigest(), True
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    @contextmanager
+    def _locked(self):
+        """Serialize catalog, reference count and object deletions across processes"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        if FileLock is None:
+            yield
+            return
+        with FileLock(str(self.root / ".lock"), timeout=30):
+            yield
+
+    def catalog(self, project_name: str) -> List[Dict[str, Any]]:
+        """Catalog entries of a project, oldest first.
+
+        Entries hold id, created, files, size, new_bytes and parent. A store
+        written before the catalog existed is indexed once, here.
+        """
+        entries = self._read_catalog(project_name)
+        if entries is not None:
+            return entries
+        with self._locked():
+            entries = self._read_catalog(project_name)
+            if entries is None:
+                entries = self._index_existing(project_name)
+                self._save_catalog(project_name, entries)
+        return entries
+
+    def _read_catalog(self, project_name: str) -> Optional[List[Dict[str, Any]]]:
+        path = self.catalog_dir / f"{project_name}.json"
+        try:
+            entries: List[Dict[str, Any]] = json.loads(path.read_text())
+            return entries
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable backup catalog {path}: {e}")
+            return None
+
+    def _save_catalog(self, project_name: str, entries: List[Dict[str, Any]]) -> None:
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(self.catalog_dir / f"{project_name}.json", entries)
+
+    def _index_existing(self, project_name: str) -> List[Dict[str, Any]]:
+        """Catalog entries for manifests and legacy copies made without a catalog"""
+        entries = []
+        if self.snapshots_dir.exists():
+            for path in self.snapshots_dir.glob(f"{project_name}_*.json"):
+                try:
+                    manifest = load_manifest(path)
+                except (OSError, ValueError):
+                    continue
+                if manifest.get("project") == project_name:
+                    entries.append(_catalog_entry(path.stem, manifest, 0))
+        if self.root.exists():
+            for item in self.root.iterdir():
+                stamp = item.name[len(project_name) + 1 :]
+                if item.is_dir() and item.name.startswith(f"{project_name}_") and stamp[:8].isdigit():
+                    try:
+                        created = datetime.strptime(stamp, "%Y%m%d_%H%M%S").replace(tzinfo=timezone.utc)
+                    except ValueError:
+                        continue
+                    entries.append(
+                        {"id": item.name, "created": created.isoformat(), "legacy": True, "files": 0, "size": 0}
+                    )
+        entries.sort(key=lambda e: e["created"])
+        for previous, entry in zip([None] + entries, entries):
+            entry["parent"] = previous["id"] if previous else None
+        if not self.refs_file.exists() and entries:
+            self._rebuild_refs()
+        return entries
+
+    def _load_refs(self) -> Dict[str, int]:
+        try:
+            refs: Dict[str, int] = json.loads(self.refs_file.read_text())
+            return refs
+        except FileNotFoundError:
+            return self._rebuild_refs()
+
+    def _rebuild_refs(self) -> Dict[str, int]:
+        """Count object references from every manifest (only needed once per store)"""
+        refs: Dict[str, int] = {}
+        if self.snapshots_dir.exists():
+            for path in self.snapshots_dir.glob("*.json"):
+                try:
+                    hashes = [entry["hash"] for entry in load_manifest(path)["files"].values()]
+                except (OSError, ValueError, KeyError):
+                    continue
+                for digest in hashes:
+                    refs[digest] = refs.get(digest, 0) + 1
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_json(self.refs_file, refs)
+        return refs
+
+    def snapshot_path(self, entry: Dict[str, Any]) -> Path:
+        """Manifest file, or directory for legacy copies, of a catalog entry"""
+        if entry.get("legacy"):
+            return self.root / entry["id"]
+        return self.snapshots_dir / f"{entry['id']}.json"
+
+    def latest(self, project_name: str) -> Optional[Dict[str, Any]]:
+        """Most recent manifest of a project"""
+        for entry in reversed(self.catalog(project_name)):
+            if not entry.get("legacy"):
+                return load_manifest(self.snapshot_path(entry))
+        return None
+
+    def snapshots(self, project_name: str) -> List[Path]:
+        """Snapshot paths of a project from the catalog, newest first"""
+        return [self.snapshot_path(entry) for entry in reversed(self.catalog(project_name))]
+
+    def prune(
+        self,
+        project_name: str,
+        policy: Optional[RetentionPolicy] = None,
+        dry_run: bool = False,
+        include_legacy: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Delete snapshots the retention policy does not keep.
+
+        Objects no longer referenced by any snapshot are deleted too, using
+        the store's reference counts rather than scanning other snapshots.
+        Legacy full copies are left alone unless include_legacy is set, so
+        only an explicit prune removes them.
+
+        Returns:
+            Catalog entries removed (or that would be, with dry_run)
+        """
+        policy = policy or RetentionPolicy.from_config()
+        entries = self.catalog(project_name)
+        keep = self._keep(entries, policy, include_legacy)
+        removed = [entry for entry in entries if entry["id"] not in keep]
+        if dry_run or not removed:
+            return removed
+
+        with self._locked():
+            entries = self._read_catalog(project_name) or []
+            keep = self._keep(entries, policy, include_legacy)
+            removed = [entry for entry in entries if entry["id"] not in keep]
+            released: List[str] = []
+            for entry in removed:
+                path = self.snapshot_path(entry)
+                if entry.get("legacy"):
+                    shutil.rmtree(path, ignore_errors=True)
+                    continue
+                try:
+                    released.extend(e["hash"] for e in load_manifest(path)["files"].values())
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not read {path} while pruning: {e}")
+                path.unlink(missing_ok=True)
+
+            kept = [entry for entry in entries if entry["id"] in keep]
+            for previous, entry in zip([None] + kept, kept):
+                entry["parent"] = previous["id"] if previous else None
+            self._save_catalog(project_name, kept)
+            self._release(released)
+
+        logger.info(f"Pruned {len(removed)} backups of {project_name}")
+        return removed
+
+    @staticmethod
+    def _keep(entries: List[Dict[str, Any]], policy: RetentionPolicy, include_legacy: bool) -> Set[str]:
+        if include_legacy:
+            return policy.select(entries)
+        legacy = {entry["id"] for entry in entries if entry.get("legacy")}
+        return legacy | policy.select([entry for entry in entries if entry["id"] not in legacy])
+
+    def _release(self, hashes: Iterable[str]) -> None:
+        """Drop references and delete objects nobody references any more"""
+        refs = self._load_refs()
+        for digest in hashes:
+            count = refs.get(digest, 0) - 1
+            if count > 0:
+                refs[digest] = count
+                continue
+            refs.pop(digest, None)
+            self.object_path(digest).unlink(missing_ok=True)
+        _write_json(self.refs_file, refs)
+
+    def create(
+        self, project_path: Path, excludes=DEFAULT_EXCLUDES, policy: Optional[RetentionPolicy] = None
+    ) -> Path:
+        """Snapshot a project directory, storing only content not seen before.
+
+        Files whose size and mtime match the previous snapshot reuse its hash
+        without being read. The retention policy (default: from config) is
+        applied to the project's catalog afterwards, sparing legacy copies.
+        """
+        project_path = Path(project_path)
+        previous = self.latest(project_path.name)
+        known = previous["files"] if previous else {}
+
+        files: Dict[str, Dict[str, Any]] = {}
+        dirs: List[str] = []
+        new_objects = 0
+        new_bytes = 0
+        for rel, path, info in _walk(project_path, excludes, dirs):
+            entry = {"size": info.st_size, "mode": info.st_mode & 0o7777, "mtime_ns": info.st_mtime_ns}
+            old = known.get(rel)
+            if (
+                old
+                and old["size"] == entry["size"]
+                and old["mtime_ns"] == entry["mtime_ns"]
+                and self.object_path(old["hash"]).exists()
+            ):
+                entry["hash"] = old["hash"]
+            else:
+                entry["hash"], written = self._store_object(path)
+                if written:
+                    new_objects += 1
+                    new_bytes += info.st_size
+            files[rel] = entry
+
+        created = datetime.now(timezone.utc)
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "project": project_path.name,
+            "source": str(project_path),
+            "created": created.isoformat(),
+            "files": files,
+            "dirs": dirs,
+        }
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.snapshots_dir / f"{project_path.name}_{created.strftime('%Y%m%d_%H%M%S_%f')}.json"
+        self.catalog(project_path.name)
+        with self._locked():
+            entries = self._read_catalog(project_path.name) or []
+            refs = self._load_refs()
+            for rel, entry in files.items():
+                # A prune may have deleted a reused object before we held the lock
+                if not self.object_path(entry["hash"]).exists():
+                    entry["hash"], _ = self._store_object(project_path / rel)
+                refs[entry["hash"]] = refs.get(entry["hash"], 0) + 1
+            _write_json(manifest_path, manifest)
+            _write_json(self.refs_file, refs)
+
+            catalog_entry = _catalog_entry(manifest_path.stem, manifest, new_bytes)
+            catalog_entry["parent"] = entries[-1]["id"] if entries else None
+            self._save_catalog(project_path.name, entries + [catalog_entry])
+        logger.info(
+            f"Snapshot {manifest_path.name}: {len(files)} files, {new_objects} new objects ({new_bytes} bytes)"
+        )
+        self.prune(project_path.name, policy)
+        return manifest_path
+
+    def restore(self, manifest_path: Path, target_path: Path, excludes=DEFAULT_EXCLUDES) -> Dict[str, int]:
+        """Make target_path match a snapshot, touching only files that differ.
+
+        Returns:
+            Counts of "restored", "unchanged" and "removed" files
+        """
+        manifest = load_manifest(manifest_path)
+        files = manifest["files"]
+        target_path = Path(target_path)
+        target_path.mkdir(parents=True, exist_ok=True)
+        stats = {"restored": 0, "unchanged": 0, "removed": 0}
+
+        present = {rel: (path, info) for rel, path, info in _walk(target_path, excludes, [])}
+        for rel, (path, _) in present.items():
+            if rel not in files:
+                path.unlink()
+                stats["removed"] += 1
+
+        for rel_dir in manifest.get("dirs", []):
+            (target_path / rel_dir).mkdir(parents=True, exist_ok=True)
+
+        for rel, entry in files.items():
+            current = present.get(rel)
+            if current is not None and _matches(current[0], current[1], entry):
+                stats["unchanged"] += 1
+                continue
+            destination = target_path / rel
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            tmp = destination.with_name(f".{destination.name}.restore-tmp")
+            shutil.copyfile(self.object_path(entry["hash"]), tmp)
+            os.chmod(tmp, entry["mode"])
+            os.replace(tmp, destination)
+            os.utime(destination, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            stats["restored"] += 1
+
+        _remove_empty_dirs(target_path, set(manifest.get("dirs", [])), excludes)
+        return stats
+
+
+def _catalog_entry(snapshot_id: str, manifest: Dict[str, Any], new_bytes: int) -> Dict[str, Any]:
+    files = manifest.get("files", {})
+    return {
+        "id": snapshot_id,
+        "created": manifest["created"],
+        "files": len(files),
+        "size": sum(entry["size"] for entry in files.values()),
+        "new_bytes": new_bytes,
+    }
+
+
+def _walk(root: Path, excludes, dirs: List[str]) -> Iterator[Tuple[str, Path, os.stat_result]]:
+    """Regular files under root as (posix relative path, path, stat), recording directories"""
+    for current, subdirs, filenames in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if d not in excludes)
+        base = Path(current)
+        for name in subdirs:
+            dirs.append((base / name).relative_to(root).as_posix())
+        for name in sorted(filenames):
+            if name in excludes:
+                continue
+            path = base / name
+            info = path.lstat()
+            if not S_ISREG(info.st_mode):
+                continue
+            yield path.relative_to(root).as_posix(), path, info
+
+
+def _matches(path: Path, info: os.stat_result, entry: Dict[str, Any]) -> bool:
+    """True if a working file already has the snapshot content"""
+    if info.st_size != entry["size"]:
+        return False
+    if info.st_mtime_ns == entry["mtime_ns"]:
+        return True
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest() == entry["hash"]
+
+
+def _remove_empty_dirs(root: Path, keep, excludes) -> None:
+    for current, subdirs, filenames in os.walk(root, topdown=False):
+        path = Path(current)
+        if path == root or any(part in excludes for part in path.relative_to(root).parts):
+            continue
+        if path.relative_to(root).as_posix() not in keep and not any(path.iterdir()):
+            path.rmdir()
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, indent=1, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def _manifest_project(path: Path) -> Optional[str]:
+    try:
+        project = json.loads(path.read_text()).get("project")
+        return project if isinstance(project, str) else None
+    except (OSError, ValueError):
         return None
 
-    backup_dir = project_path.parent / ".pygubuai_backups"
-    backup_dir.mkdir(exist_ok=True)
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    backup_name = f"{project_path.name}_{timestamp}"
-    backup_path = backup_dir / backup_name
+def load_manifest(manifest_path: Path) -> Dict[str, Any]:
+    """Read a snapshot manifest"""
+    data: Dict[str, Any] = json.loads(Path(manifest_path).read_text())
+    return data
+
+
+def get_store(project_path: Path) -> SnapshotStore:
+    """Store shared by all projects in the same parent directory"""
+    return SnapshotStore(project_path.parent / BACKUP_DIR_NAME)
+
+
+def create_backup(project_path: Path) -> Optional[Path]:
+    """Create backup of project directory.
+
+    Returns:
+        Path of the snapshot manifest, or None on failure
+    """
+    if not project_path.exists():
+        return None
 
     try:
-        shutil.copytree(project_path, backup_path)
+        backup_path = get_store(project_path).create(project_path)
         logger.info(f"Backup created: {backup_path}")
         return backup_path
     except Exception as e:
@@ -31,15 +487,22 @@ def create_backup(project_path: Path) -> Optional[Path]:
 
 
 def restore_backup(backup_path: Path, target_path: Path) -> bool:
-    """Restore project from backup"""
+    """Restore project from a snapshot manifest or a legacy backup directory"""
     if not backup_path.exists():
         logger.error(f"Backup not found: {backup_path}")
         return False
 
     try:
-        if target_path.exists():
-            shutil.rmtree(target_path)
-        shutil.copytree(backup_path, target_path)
+        if backup_path.is_dir():
+            if target_path.exists():
+                shutil.rmtree(target_path)
+            shutil.copytree(backup_path, target_path)
+        else:
+            store = SnapshotStore(backup_path.parent.parent)
+            stats = store.restore(backup_path, target_path)
+            logger.info(
+                f"Restored {stats['restored']} files, removed {stats['removed']}, {stats['unchanged']} unchanged"
+            )
         logger.info(f"Restored from: {backup_path}")
         return True
     except Exception as e:
@@ -48,16 +511,116 @@ def restore_backup(backup_path: Path, target_path: Path) -> bool:
 
 
 def list_backups(project_name: str, backup_dir: Optional[Path] = None) -> list:
-    """List available backups for project"""
+    """List available backups for project from its catalog, newest first.
+
+    The backup directory defaults to the one next to the registered project.
+    """
     if backup_dir is None:
-        backup_dir = Path.cwd() / ".pygubuai_backups"
+        from .registry import Registry
+
+        project_path = Registry().get_project(project_name)
+        backup_dir = get_store(Path(project_path)).root if project_path else Path.cwd() / BACKUP_DIR_NAME
 
     if not backup_dir.exists():
         return []
 
-    backups = []
-    for item in backup_dir.iterdir():
-        if item.is_dir() and item.name.startswith(f"{project_name}_"):
-            backups.append(item)
+    return SnapshotStore(backup_dir).snapshots(project_name)
+
+
+def _format_size(size: float) -> str:
+    if size < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KB", "MB"):
+        size /= 1024
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} GB"
+
+
+def main():
+    """CLI entry point"""
+    import argparse
+    import sys
+
+    from .registry import Registry
+
+    parser = argparse.ArgumentParser(prog="pygubu-backup", description="Manage project snapshot backups")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    create_parser = subparsers.add_parser("create", help="Snapshot a project")
+    create_parser.add_argument("project", help="Project name")
+
+    list_parser = subparsers.add_parser("list", help="List snapshots of a project")
+    list_parser.add_argument("project", help="Project name")
+
+    prune_parser = subparsers.add_parser("prune", help="Apply a retention policy")
+    prune_parser.add_argument("project", help="Project name")
+    defaults = RetentionPolicy.from_config()
+    for name in ("keep_last", "hourly", "daily", "weekly"):
+        prune_parser.add_argument(
+            f"--{name.replace('_', '-')}", type=int, default=getattr(defaults, name), metavar="N"
+        )
+    prune_parser.add_argument("--dry-run", action="store_true", help="Show what would be removed")
+
+    restore_parser = subparsers.add_parser("restore", help="Restore a snapshot")
+    restore_parser.add_argument("project", help="Project name")
+    restore_parser.add_argument("snapshot", nargs="?", help="Snapshot id (default: latest)")
+    restore_parser.add_argument("--target", help="Directory to restore into (default: project directory)")
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    project_path = Registry().get_project(args.project)
+    if not project_path:
+        print(f"Error: Project '{args.project}' not found")
+        sys.exit(1)
+    project_path = Path(project_path)
+    store = get_store(project_path)
+
+    if args.command == "create":
+        manifest = create_backup(project_path)
+        if manifest is None:
+            print("Error: Backup failed")
+            sys.exit(1)
+        print(f"OK Snapshot {manifest.stem}")
+
+    elif args.command == "list":
+        entries = store.catalog(args.project)
+        if not entries:
+            print(f"No backups for {args.project}")
+            return
+        for entry in reversed(entries):
+            kind = " (legacy)" if entry.get("legacy") else ""
+            print(
+                f"  {entry['id']}  {entry['created'][:19]}  {entry['files']} files  "
+                f"{_format_size(entry['size'])}  +{_format_size(entry.get('new_bytes', 0))}{kind}"
+            )
+
+    elif args.command == "prune":
+        policy = RetentionPolicy(args.keep_last, args.hourly, args.daily, args.weekly)
+        removed = store.prune(args.project, policy, dry_run=args.dry_run, include_legacy=True)
+        verb = "Would remove" if args.dry_run else "Removed"
+        for entry in removed:
+            print(f"  {verb} {entry['id']}")
+        print(f"OK {verb} {len(removed)} backups")
+
+    elif args.command == "restore":
+        entries = store.catalog(args.project)
+        if args.snapshot:
+            matches = [entry for entry in entries if entry["id"] == args.snapshot]
+        else:
+            matches = entries[-1:]
+        if not matches:
+            print(f"Error: Snapshot not found: {args.snapshot or 'no backups'}")
+            sys.exit(1)
+        target = Path(args.target) if args.target else project_path
+        if not restore_backup(store.snapshot_path(matches[0]), target):
+            print("Error: Restore failed")
+            sys.exit(1)
+        print(f"OK Restored {matches[0]['id']} to {target}")
+
 
-    return sorted(backups, key=lambda x: x.name, reverse=True)
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 from defusedxml import ElementTree as ET
 from pathlib import Path
 from typing import List, Dict, Union, Any
+from .git_integration import GitBatch
 from .registry import Registry
 from .theme import apply_theme
 from .validate_project import validate_project
@@ -50,21 +51,36 @@ def rename_widget(project_name: str, old_id: str, new_id: str) -> bool:
     return True
 
 
-def batch_update_theme(theme_name: str, projects: Union[List[str], None] = None) -> Dict[str, bool]:
-    """Apply theme to multiple projects"""
+def batch_update_theme(
+    theme_name: str, projects: Union[List[str], None] = None, commit: bool = False
+) -> Dict[str, bool]:
+    """Apply theme to multiple projects
+
+    Args:
+        theme_name: Theme to apply
+        projects: Project names (default: all registered projects)
+        commit: Commit the updated UI files, one commit per git repository
+    """
     registry = Registry()
+    all_projects = registry.list_projects()
 
     if projects is None:
-        projects = list(registry.list_projects().keys())
+        projects = list(all_projects.keys())
 
     results = {}
+    changes = GitBatch()
     for project in projects:
         try:
             apply_theme(project, theme_name, backup=True)
             results[project] = True
+            if commit:
+                changes.add(Path(all_projects[project]) / f"{project}.ui")
         except Exception:
             results[project] = False
 
+    if commit and len(changes):
+        changes.commit(f"Apply {theme_name} theme")
+
     return results
 
 
@@ -91,7 +107,7 @@ def main():
         print("Usage: pygubu-batch <command> [args]")
         print("\nCommands:")
         print("  rename-widget <project> <old_id> <new_id>")
-        print("  update-theme <theme> [projects...]")
+        print("  update-theme <theme> [projects...] [--commit]")
         print("  validate [projects...]")
         print("\nExamples:")
         print("  pygubu-batch rename-widget myapp btn_old btn_new")
@@ -118,11 +134,12 @@ def main():
 
     elif command == "update-theme":
         if len(sys.argv) < 3:
-            print("Usage: pygubu-batch update-theme <theme> [projects...]")
+            print("Usage: pygubu-batch update-theme <theme> [projects...] [--commit]")
             sys.exit(1)
 
         theme = sys.argv[2]
-        project_list = sys.argv[3:] if len(sys.argv) > 3 else None
+        commit = "--commit" in sys.argv[3:]
+        project_list = [arg for arg in sys.argv[3:] if arg != "--commit"] or None
 
         if RICH_AVAILABLE:
             console = Console()
@@ -132,7 +149,7 @@ def main():
                 SpinnerColumn(), TextColumn("[progress.description]{task.description}"), BarColumn(), console=console
             ) as progress:
                 task = progress.add_task("Processing...", total=None)
-                results = batch_update_theme(theme, project_list)
+                results = batch_update_theme(theme, project_list, commit=commit)
                 progress.update(task, completed=True)
 
             success = sum(1 for v in results.values() if v)
@@ -145,7 +162,7 @@ def main():
             console.print(f"\n[bold]Completed: {success} succeeded, {failed} failed[/bold]")
         else:
             print(f"\nApplying theme '{theme}' to projects...\n")
-            results = batch_update_theme(theme, project_list)
+            results = batch_update_theme(theme, project_list, commit=commit)
 
             success = sum(1 for v in results.values() if v)
             failed = len(results) - success
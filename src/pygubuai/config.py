@@ -26,6 +26,12 @@ class Config:
         "ai_context_dir": "~/.amazonq/prompts",
         "default_window_size": {"width": 600, "height": 400},
         "default_padding": 20,
+        "ai_context_token_budget": 2000,
+        "metrics_retention_days": {"raw": 7, "minute": 2, "hour": 90},
+        "record_events_to_db": False,
+        "event_queue_size": 1000,
+        "event_queue_policy": "drop_oldest",
+        "backup_retention": {"keep_last": 10, "hourly": 24, "daily": 7, "weekly": 4},
     }
 
     ENV_PREFIX = "PYGUBUAI_"
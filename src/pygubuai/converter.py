@@ -1,28 +1,551 @@
 """Convert tkinter code to pygubu format"""
 
+import argparse
+import ast
+import hashlib
+import json
+import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .cache import CACHE_DIR
+from .generator import generate_ui_tree_xml
+
+logger = logging.getLogger(__name__)
+
+# Bump when conversion output changes so cached results are not reused
+CONVERTER_VERSION = 1
+CONVERTER_CACHE_DIR = CACHE_DIR / "converter"
+
+TK_WIDGETS = {
+    "Button",
+    "Canvas",
+    "Checkbutton",
+    "Entry",
+    "Frame",
+    "Label",
+    "LabelFrame",
+    "Listbox",
+    "Menu",
+    "Menubutton",
+    "Message",
+    "OptionMenu",
+    "PanedWindow",
+    "Radiobutton",
+    "Scale",
+    "Scrollbar",
+    "Spinbox",
+    "Text",
+    "Tk",
+    "Toplevel",
+}
+TTK_WIDGETS = {
+    "Button",
+    "Checkbutton",
+    "Combobox",
+    "Entry",
+    "Frame",
+    "Label",
+    "LabelFrame",
+    "Labelframe",
+    "Menubutton",
+    "Notebook",
+    "PanedWindow",
+    "Panedwindow",
+    "Progressbar",
+    "Radiobutton",
+    "Scale",
+    "Scrollbar",
+    "Separator",
+    "Sizegrip",
+    "Spinbox",
+    "Treeview",
+}
+# Class names that differ between tkinter and pygubu
+CLASS_ALIASES = {"tk.Tk": "tk.Toplevel", "ttk.LabelFrame": "ttk.Labelframe", "ttk.PanedWindow": "ttk.Panedwindow"}
+WINDOW_CLASSES = {"tk.Tk", "tk.Toplevel"}
+VARIABLE_TYPES = {"StringVar": "string", "IntVar": "int", "DoubleVar": "double", "BooleanVar": "boolean"}
+LAYOUT_METHODS = {"pack", "grid", "place"}
+CONFIG_METHODS = {"config", "configure"}
+CALLBACK_OPTIONS = {"command", "postcommand", "validatecommand", "invalidcommand", "xscrollcommand", "yscrollcommand"}
+
+
+@dataclass
+class ConvertedWidget:
+    cls: str
+    id: str
+    properties: Dict[str, str] = field(default_factory=dict)
+    layout: Optional[Dict[str, Any]] = None
+    children: List["ConvertedWidget"] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"class": self.cls, "id": self.id, "properties": self.properties}
+        if self.layout:
+            data["layout"] = self.layout
+        data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+class _ModuleConverter(ast.NodeVisitor):
+    """Collect widget constructions, layout calls and options in source order"""
+
+    def __init__(self):
+        self.modules: Dict[str, str] = {}  # local name -> "tk" or "ttk"
+        self.classes: Dict[str, str] = {}  # local name -> "tk.Button"
+        self.widgets: Dict[str, ConvertedWidget] = {}  # target expression -> widget
+        self.variables: Dict[str, str] = {}  # target expression -> pygubu variable type
+        self.parents: Dict[int, Optional[ConvertedWidget]] = {}  # id(widget) -> parent widget
+        self.order: List[ConvertedWidget] = []
+        self.callbacks: List[str] = []
+        self.warnings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    # Imports
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            local = alias.asname or alias.name
+            if alias.name in ("tkinter", "Tkinter"):
+                self.modules[local] = "tk"
+            elif alias.name in ("tkinter.ttk", "ttk"):
+                if alias.asname:
+                    self.modules[alias.asname] = "ttk"
+                else:
+                    self.modules.setdefault("tkinter", "tk")
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        if module in ("tkinter", "Tkinter"):
+            prefix, names = "tk", TK_WIDGETS
+        elif module in ("tkinter.ttk", "ttk"):
+            prefix, names = "ttk", TTK_WIDGETS
+        else:
+            return
+        for alias in node.names:
+            if alias.name == "*":
+                self.classes.update({name: f"{prefix}.{name}" for name in names})
+                if prefix == "tk":
+                    self.classes.update({name: f"tk.{name}" for name in VARIABLE_TYPES})
+            elif alias.name == "ttk":
+                self.modules[alias.asname or "ttk"] = "ttk"
+            elif alias.name in names or alias.name in VARIABLE_TYPES:
+                self.classes[alias.asname or alias.name] = f"{prefix}.{alias.name}"
+
+    # Statements
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        if isinstance(node.value, ast.Call):
+            target = _expr_key(node.targets[0])
+            call = node.value
+            var_type = self._variable_type(call.func)
+            if var_type and target:
+                self.variables[target] = var_type
+                return
+            if self._widget_class(call.func):
+                self._add_widget(call, target)
+                return
+            if self._chained_widget_call(call):
+                return
+        if len(node.targets) == 1 and isinstance(node.targets[0], ast.Subscript):
+            self._set_item(node.targets[0], node.value)
+            return
+        self.generic_visit(node)
+
+    def visit_Expr(self, node: ast.Expr) -> None:
+        if isinstance(node.value, ast.Call):
+            call = node.value
+            if self._widget_class(call.func):
+                self._add_widget(call, None)
+                return
+            if self._chained_widget_call(call):
+                return
+            if isinstance(call.func, ast.Attribute):
+                widget = self.widgets.get(_expr_key(call.func.value) or "")
+                if widget is not None:
+                    self._apply_method(widget, call.func.attr, call)
+                    return
+        self.generic_visit(node)
+
+    # Widgets
+
+    def _variable_type(self, func: ast.expr) -> Optional[str]:
+        name = self._resolve_class(func)
+        return VARIABLE_TYPES.get(name.split(".")[-1]) if name else None
+
+    def _widget_class(self, func: ast.expr) -> Optional[str]:
+        name = self._resolve_class(func)
+        if name is None:
+            return None
+        prefix, cls = name.split(".", 1)
+        if cls in (TK_WIDGETS if prefix == "tk" else TTK_WIDGETS):
+            return CLASS_ALIASES.get(name, name)
+        return None
+
+    def _resolve_class(self, func: ast.expr) -> Optional[str]:
+        if isinstance(func, ast.Name):
+            return self.classes.get(func.id)
+        if isinstance(func, ast.Attribute):
+            owner = func.value
+            if isinstance(owner, ast.Name) and owner.id in self.modules:
+                return f"{self.modules[owner.id]}.{func.attr}"
+            # tkinter.ttk.Button after a plain "import tkinter.ttk"
+            if isinstance(owner, ast.Attribute) and owner.attr == "ttk" and _expr_key(owner.value) in self.modules:
+                return f"ttk.{func.attr}"
+        return None
+
+    def _chained_widget_call(self, call: ast.Call) -> bool:
+        """Handle tk.Button(root, ...).pack(...) where the widget is never named"""
+        func = call.func
+        if not (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Call)):
+            return False
+        if func.attr not in LAYOUT_METHODS or not self._widget_class(func.value.func):
+            return False
+        # x = Button(...).pack() binds x to None, so the widget stays anonymous
+        widget = self._add_widget(func.value, None)
+        self._apply_method(widget, func.attr, call)
+        return True
+
+    def _add_widget(self, call: ast.Call, target: Optional[str]) -> ConvertedWidget:
+        cls = self._widget_class(call.func) or "tk.Frame"
+        widget = ConvertedWidget(cls=cls, id=self._new_id(target, cls))
+
+        parent = call.args[0] if call.args else None
+        options = list(call.keywords)
+        for keyword in call.keywords:
+            if keyword.arg == "master":
+                parent = keyword.value
+                options.remove(keyword)
+        # The parent is whatever its name is bound to at this point in the source
+        self.parents[id(widget)] = self.widgets.get(_expr_key(parent) or "") if parent is not None else None
+        self._set_options(widget, options)
+
+        if target:
+            self.widgets[target] = widget
+        self.order.append(widget)
+        return widget
+
+    def _new_id(self, target: Optional[str], cls: str) -> str:
+        base = target.split(".")[-1] if target else cls.split(".")[-1].lower()
+        count = self._ids.get(base, 0) + 1
+        self._ids[base] = count
+        if target and count == 1:
+            return base
+        return f"{base}{count}"
+
+    def _apply_method(self, widget: ConvertedWidget, method: str, call: ast.Call) -> None:
+        if method in LAYOUT_METHODS:
+            properties = {}
+            for keyword in call.keywords:
+                value = self._literal(keyword.value, f"{widget.id}.{method}({keyword.arg}=...)")
+                if keyword.arg and value is not None:
+                    properties[keyword.arg] = value
+            widget.layout = {"manager": method, "properties": properties}
+        elif method in CONFIG_METHODS:
+            self._set_options(widget, call.keywords)
+        elif method == "title" and call.args and widget.cls in WINDOW_CLASSES:
+            title = self._literal(call.args[0], f"{widget.id}.title()")
+            if title is not None:
+                widget.properties["title"] = title
+        elif method == "geometry" and call.args and widget.cls in WINDOW_CLASSES:
+            geometry = self._literal(call.args[0], f"{widget.id}.geometry()")
+            if geometry is not None:
+                widget.properties["geometry"] = geometry
+
+    def _set_item(self, target: ast.Subscript, value: ast.expr) -> None:
+        """Handle widget["text"] = "..." """
+        widget = self.widgets.get(_expr_key(target.value) or "")
+        key = target.slice
+        if widget is not None and isinstance(key, ast.Constant) and isinstance(key.value, str):
+            self._set_options(widget, [ast.keyword(arg=key.value, value=value)])
+
+    def _set_options(self, widget: ConvertedWidget, keywords: Iterable[ast.keyword]) -> None:
+        for keyword in keywords:
+            if keyword.arg is None:
+                self.warnings.append(f"{widget.id}: **kwargs options are not converted")
+                continue
+            value = self._option_value(widget, keyword.arg, keyword.value)
+            if value is not None:
+                widget.properties[keyword.arg] = value
+
+    def _option_value(self, widget: ConvertedWidget, option: str, node: ast.expr) -> Optional[str]:
+        if option in CALLBACK_OPTIONS:
+            if isinstance(node, (ast.Name, ast.Attribute)):
+                name = _expr_key(node).split(".")[-1]
+                if name not in self.callbacks:
+                    self.callbacks.append(name)
+                return name
+            self.warnings.append(f"{widget.id}: {option} is not a named callback, skipped")
+            return None
+        if option in ("variable", "textvariable", "listvariable"):
+            key = _expr_key(node)
+            if key:
+                return f"{self.variables.get(key, 'string')}:{key.split('.')[-1]}"
+        return self._literal(node, f"{widget.id}.{option}")
+
+    def _literal(self, node: ast.expr, where: str) -> Optional[str]:
+        """Option value as pygubu text, or None if it is computed at runtime"""
+        if isinstance(node, ast.Constant) and node.value is not None:
+            if isinstance(node.value, bool):
+                return "true" if node.value else "false"
+            return str(node.value)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+            return f"-{node.operand.value}"
+        if isinstance(node, ast.Tuple):
+            parts = [self._literal(elt, where) for elt in node.elts]
+            if all(part is not None for part in parts):
+                return " ".join(parts)  # type: ignore[arg-type]
+            return None
+        # tk.LEFT, tk.END, BOTH after "from tkinter import *"
+        name = node.attr if isinstance(node, ast.Attribute) else node.id if isinstance(node, ast.Name) else None
+        if name and name.isupper():
+            return name.lower()
+        self.warnings.append(f"{where}: computed value not converted")
+        return None
+
+    # Tree
+
+    def build_tree(self) -> List[ConvertedWidget]:
+        """Nest widgets under their parents; unknown parents go to one main window"""
+        roots: List[ConvertedWidget] = []
+        orphans: List[ConvertedWidget] = []
+        for widget in self.order:
+            parent = self.parents[id(widget)]
+            if widget.cls in WINDOW_CLASSES:
+                roots.append(widget)
+            elif parent is not None:
+                parent.children.append(widget)
+            else:
+                orphans.append(widget)
+
+        if orphans:
+            if roots:
+                roots[0].children.extend(orphans)
+            else:
+                roots.append(ConvertedWidget(cls="tk.Toplevel", id=self._new_id("mainwindow", ""), children=orphans))
+        for widget in self.order:
+            if widget.cls not in WINDOW_CLASSES and widget.layout is None:
+                self.warnings.append(f"{widget.id}: no pack/grid/place call, widget will not be shown")
+        return roots
+
+
+def _expr_key(node: Optional[ast.expr]) -> Optional[str]:
+    """Dotted name for Name/Attribute chains like self.frame.ok"""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return None
+
+
+def convert_source(source: str, filename: str = "<string>") -> Dict[str, Any]:
+    """Convert tkinter construction code to a pygubu widget tree.
+
+    Args:
+        source: Python source code
+        filename: Name used in error messages
+
+    Returns:
+        Dict with "widgets" (tree of widget dicts), "callbacks", "warnings"
+        and "error" (None unless the source could not be parsed)
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        return {"widgets": [], "callbacks": [], "warnings": [], "error": f"{type(e).__name__}: {e}"}
+
+    converter = _ModuleConverter()
+    converter.visit(tree)
+    roots = converter.build_tree() if converter.order else []
+    return {
+        "widgets": [root.to_dict() for root in roots],
+        "callbacks": converter.callbacks,
+        "warnings": converter.warnings,
+        "error": None,
+    }
+
+
+def source_key(data: bytes) -> str:
+    """Cache key for a source file: its content plus the converter version"""
+    return hashlib.sha256(f"v{CONVERTER_VERSION}:".encode() + data).hexdigest()
+
+
+def _cache_file(cache_dir: Path, key: str) -> Path:
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def _load_cached(cache_dir: Optional[Path], key: str) -> Optional[Dict[str, Any]]:
+    if cache_dir is None:
+        return None
+    try:
+        return json.loads(_cache_file(cache_dir, key).read_text())  # type: ignore[no-any-return]
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(cache_dir: Optional[Path], key: str, result: Dict[str, Any]) -> None:
+    if cache_dir is None:
+        return
+    path = _cache_file(cache_dir, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(result))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Could not cache conversion {key}: {e}")
+
+
+def _convert_worker(item: Tuple[str, str]) -> Dict[str, Any]:
+    """Process pool worker: convert one file's source"""
+    filename, source = item
+    return convert_source(source, filename)
+
+
+@dataclass
+class ConversionSummary:
+    converted: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    no_widgets: List[Path] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    warnings: Dict[str, List[str]] = field(default_factory=dict)
+    cached: int = 0
+
+
+def convert_files(
+    files: Dict[Path, Path], jobs: Optional[int] = None, cache_dir: Optional[Path] = CONVERTER_CACHE_DIR
+) -> ConversionSummary:
+    """Convert many files, reusing cached results for unchanged sources.
+
+    Sources are hashed in this process; only cache misses are parsed, in a
+    process pool. Output files whose content would not change are left
+    untouched so repeated runs do not rewrite the tree.
+
+    Args:
+        files: Source .py path to output .ui path
+        jobs: Worker processes (default: CPU count; 1 runs in-process)
+        cache_dir: Per-file result cache, keyed by source hash (None disables it)
+
+    Returns:
+        ConversionSummary
+    """
+    summary = ConversionSummary()
+    results: Dict[Path, Dict[str, Any]] = {}
+    misses: List[Tuple[Path, str, str]] = []
+
+    for source_path in sorted(files):
+        try:
+            data = source_path.read_bytes()
+        except OSError as e:
+            summary.errors[str(source_path)] = str(e)
+            continue
+        key = source_key(data)
+        cached = _load_cached(cache_dir, key)
+        if cached is not None:
+            summary.cached += 1
+            results[source_path] = cached
+        else:
+            misses.append((source_path, key, data.decode("utf-8", errors="replace")))
+
+    items = [(str(path), source) for path, _, source in misses]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(items) <= 1:
+        converted = [_convert_worker(item) for item in items]
+    else:
+        chunksize = max(1, len(items) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+            converted = list(executor.map(_convert_worker, items, chunksize=chunksize))
+
+    for (source_path, key, _), result in zip(misses, converted):
+        _store_cached(cache_dir, key, result)
+        results[source_path] = result
+
+    for source_path, result in sorted(results.items()):
+        _write_result(source_path, files[source_path], result, summary)
+    return summary
+
+
+def _write_result(source_path: Path, output_path: Path, result: Dict[str, Any], summary: ConversionSummary) -> None:
+    if result["error"]:
+        summary.errors[str(source_path)] = result["error"]
+        return
+    if result["warnings"]:
+        summary.warnings[str(source_path)] = result["warnings"]
+    if not result["widgets"]:
+        summary.no_widgets.append(source_path)
+        return
+
+    xml = generate_ui_tree_xml(result["widgets"])
+    try:
+        if output_path.exists() and output_path.read_text(encoding="utf-8") == xml:
+            summary.unchanged.append(output_path)
+            return
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(xml, encoding="utf-8")
+        summary.converted.append(output_path)
+    except OSError as e:
+        summary.errors[str(source_path)] = str(e)
+
+
+def convert_directory(
+    source_dir: Path,
+    output_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    cache_dir: Optional[Path] = CONVERTER_CACHE_DIR,
+) -> ConversionSummary:
+    """Convert every .py file under source_dir, mirroring the tree into output_dir"""
+    output_dir = output_dir or source_dir
+    excluded = {"__pycache__", ".git", ".venv", "venv"}
+    files = {
+        path: output_dir / path.relative_to(source_dir).with_suffix(".ui")
+        for path in source_dir.rglob("*.py")
+        if not excluded.intersection(path.relative_to(source_dir).parts)
+    }
+    return convert_files(files, jobs=jobs, cache_dir=cache_dir)
 
 
 def main():
     """CLI entry point for tkinter-to-pygubu converter"""
-    if len(sys.argv) != 2:
-        print("Usage: tkinter-to-pygubu <file>.py")
-        print("\nConverts legacy tkinter code to pygubu format")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        prog="tkinter-to-pygubu", description="Convert legacy tkinter code to pygubu .ui files"
+    )
+    parser.add_argument("path", help="Python file or directory of tkinter modules")
+    parser.add_argument("-o", "--output", help="Output .ui file, or directory when converting a directory")
+    parser.add_argument("-j", "--jobs", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the conversion cache")
+    args = parser.parse_args()
 
-    filepath = Path(sys.argv[1])
-    if not filepath.exists():
-        print(f"Error: {filepath} not found")
+    path = Path(args.path)
+    if not path.exists():
+        print(f"Error: {path} not found")
         sys.exit(1)
 
-    print(f"Converting {filepath.name} to Pygubu format...")
-    print("\nWARNING  This is a placeholder implementation.")
-    print("Full conversion requires parsing tkinter widget creation code.")
-    print("\nSuggested approach:")
-    print("1. Manually recreate UI in pygubu-designer")
-    print("2. Copy business logic to new pygubu app class")
-    print("3. Connect callbacks via builder.connect_callbacks()")
+    cache_dir = None if args.no_cache else CONVERTER_CACHE_DIR
+    output = Path(args.output) if args.output else None
+    if path.is_dir():
+        summary = convert_directory(path, output, jobs=args.jobs, cache_dir=cache_dir)
+    else:
+        summary = convert_files({path: output or path.with_suffix(".ui")}, jobs=1, cache_dir=cache_dir)
+
+    for name, warnings in sorted(summary.warnings.items()):
+        for warning in warnings:
+            print(f"Warning: {name}: {warning}")
+    for name, error in sorted(summary.errors.items()):
+        print(f"Error: {name}: {error}")
+
+    total = len(summary.converted) + len(summary.unchanged) + len(summary.no_widgets) + len(summary.errors)
+    print(
+        f"\nProcessed {total} files ({summary.cached} cached): {len(summary.converted)} written, "
+        f"{len(summary.unchanged)} unchanged, {len(summary.no_widgets)} without widgets, {len(summary.errors)} errors"
+    )
+    if summary.errors:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
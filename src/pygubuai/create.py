@@ -1,17 +1,22 @@
 """Project creation with error handling"""
 
+import os
 import sys
+import json
+import time
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from . import __version__
 from .errors import PygubuAIError, validate_pygubu
 from .utils import validate_project_name, ensure_directory
 from .widgets import detect_widgets, get_callbacks
-from .generator import generate_base_ui_xml_structure, generate_python_app_structure, generate_readme_content
-from .git_integration import init_git_repo
+from .generator import generate_python_app_structure, generate_readme_content, write_base_ui
+from .git_integration import init_git_repo, init_git_repos
 from .interactive import interactive_create
 from .registry import Registry
 
@@ -54,18 +59,7 @@ def create_project(
             create_from_template(name, template, dry_run=dry_run, init_git=init_git)
             return
 
-        widgets = detect_widgets(description)
-        callbacks = get_callbacks(widgets)
-
-        ui_file = base / f"{name}.ui"
-        ui_file.write_text(generate_base_ui_xml_structure(name, widgets))
-
-        py_file = base / f"{name}.py"
-        py_file.write_text(generate_python_app_structure(name, callbacks))
-        py_file.chmod(0o755)
-
-        readme = base / "README.md"
-        readme.write_text(generate_readme_content(name, description, f"{name}.ui"))
+        write_project_files(base, name, description)
 
         # Initialize git if requested
         if init_git:
@@ -88,6 +82,186 @@ def create_project(
         sys.exit(1)
 
 
+def write_project_files(base: Path, name: str, description: str) -> None:
+    """Write the .ui, .py and README for a project described in natural language"""
+    widgets = detect_widgets(description)
+    callbacks = get_callbacks(widgets)
+
+    ui_file = base / f"{name}.ui"
+    with open(ui_file, "w", encoding="utf-8") as f:
+        write_base_ui(f, name, widgets)
+
+    py_file = base / f"{name}.py"
+    py_file.write_text(generate_python_app_structure(name, callbacks))
+    py_file.chmod(0o755)
+
+    readme = base / "README.md"
+    readme.write_text(generate_readme_content(name, description, f"{name}.ui"))
+
+
+@dataclass
+class ProjectResult:
+    """Outcome of creating one project in a bulk run"""
+
+    name: str
+    path: Path
+    ok: bool = False
+    seconds: float = 0.0
+    git: Optional[bool] = None
+    error: Optional[str] = None
+
+
+def load_manifest(manifest: Path) -> List[Dict[str, Any]]:
+    """Read project specs from a JSON-lines manifest.
+
+    Each line is an object with "name" and "description", and optionally
+    "template" and "tags". Blank lines are ignored.
+
+    Raises:
+        ValueError: If a line is not valid JSON or misses a required field
+    """
+    specs = []
+    with open(manifest, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                spec = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{manifest}:{line_number}: invalid JSON ({e.msg})")
+            if not isinstance(spec, dict) or not spec.get("name"):
+                raise ValueError(f"{manifest}:{line_number}: each line needs an object with a 'name'")
+            if not spec.get("description") and not spec.get("template"):
+                raise ValueError(f"{manifest}:{line_number}: '{spec['name']}' needs a description or template")
+            specs.append(spec)
+    return specs
+
+
+def create_projects_bulk(
+    specs: List[Dict[str, Any]],
+    parent: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    init_git: bool = False,
+    skip_validation: bool = False,
+) -> List[ProjectResult]:
+    """Create many projects concurrently and register them together.
+
+    Project files are written on a thread pool. Templates are compiled once
+    up front, successful projects are added to the registry in a single
+    write, and git repositories are initialized as one parallel batch.
+
+    Args:
+        specs: Project specs (see load_manifest)
+        parent: Directory to create projects in (default: current directory)
+        jobs: Worker threads (default: min(32, CPU count + 4))
+        init_git: Initialize a repository with an initial commit per project
+        skip_validation: Skip the pygubu installation check
+
+    Returns:
+        One ProjectResult per spec, in spec order, with the time taken
+    """
+    from .template import compile_template, write_project
+
+    if not skip_validation:
+        validate_pygubu()
+    parent = parent or Path.cwd()
+
+    compiled = {}
+    template_errors = {}
+    for template_name in {spec["template"] for spec in specs if spec.get("template")}:
+        try:
+            compiled[template_name] = compile_template(template_name)
+        except PygubuAIError as e:
+            template_errors[template_name] = e.message
+
+    seen = set()
+    duplicates = set()
+    for index, spec in enumerate(specs):
+        if spec.get("name") in seen:
+            duplicates.add(index)
+        seen.add(spec.get("name"))
+
+    def create_one(item: Tuple[int, Dict[str, Any]]) -> ProjectResult:
+        index, spec = item
+        start = time.perf_counter()
+        result = ProjectResult(name=spec.get("name", ""), path=parent / spec.get("name", ""))
+        try:
+            if index in duplicates:
+                raise ValueError("duplicate project name in this run")
+            name = result.name = validate_project_name(result.name)
+            result.path = parent / name
+            template_name = spec.get("template")
+            if template_name in template_errors:
+                raise PygubuAIError(template_errors[template_name])
+            base = ensure_directory(result.path)
+            if template_name:
+                write_project(base, name, compiled[template_name])
+            else:
+                write_project_files(base, name, spec["description"])
+            result.ok = True
+        except PygubuAIError as e:
+            result.error = e.message
+        except (OSError, ValueError) as e:
+            result.error = str(e)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as executor:
+        results = list(executor.map(create_one, enumerate(specs)))
+
+    created = [(spec, result) for spec, result in zip(specs, results) if result.ok]
+    if init_git and created:
+        start = time.perf_counter()
+        initialized = init_git_repos([result.path for _, result in created], jobs=jobs)
+        share = (time.perf_counter() - start) / len(created)
+        for _, result in created:
+            result.git = initialized.get(result.path.resolve(), False)
+            result.seconds += share
+
+    if created:
+        Registry().add_projects(
+            {
+                "name": result.name,
+                "path": str(result.path),
+                "description": spec.get("description") or spec.get("template", ""),
+                "tags": spec.get("tags") or [],
+            }
+            for spec, result in created
+        )
+    return results
+
+
+def _bulk_main(manifest: Path, jobs: Optional[int], init_git: bool) -> None:
+    """Handle pygubu-create --from-manifest"""
+    try:
+        specs = load_manifest(manifest)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if not specs:
+        print(f"No projects in {manifest}")
+        return
+
+    start = time.perf_counter()
+    try:
+        results = create_projects_bulk(specs, jobs=jobs, init_git=init_git)
+    except PygubuAIError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        status = "OK" if result.ok else "FAILED"
+        git = "" if result.git is None else (" git" if result.git else " git FAILED")
+        detail = f" - {result.error}" if result.error else ""
+        print(f"  {status:6} {result.name:30} {result.seconds * 1000:8.1f} ms{git}{detail}")
+
+    failed = sum(1 for r in results if not r.ok)
+    print(f"\nCreated {len(results) - failed} of {len(results)} projects in {elapsed:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
 def main(args=None):
     """CLI entry point"""
     logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -98,7 +272,8 @@ def main(args=None):
             "  pygubu-create login 'login form with username and password'\n"
             "  pygubu-create todo 'todo app with entry, button, and list'\n"
             "  pygubu-create --interactive\n"
-            "  pygubu-create myapp 'app' --dry-run --git"
+            "  pygubu-create myapp 'app' --dry-run --git\n"
+            "  pygubu-create --from-manifest fleet.jsonl --jobs 8"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -110,10 +285,16 @@ def main(args=None):
     parser.add_argument("--git", action="store_true", help="Initialize git repository")
     parser.add_argument("--template", "-t", help="Use template (login, crud, settings, etc.)")
     parser.add_argument("--tags", help="Comma-separated tags for project")
+    parser.add_argument(
+        "--from-manifest", metavar="FILE", help="Create every project listed in a JSON-lines manifest"
+    )
+    parser.add_argument("--jobs", "-j", type=int, help="Worker threads for --from-manifest")
 
     parsed_args = parser.parse_args(args)
 
-    if parsed_args.interactive:
+    if parsed_args.from_manifest:
+        _bulk_main(Path(parsed_args.from_manifest), parsed_args.jobs, parsed_args.git)
+    elif parsed_args.interactive:
         config = interactive_create()
         create_project(
             config["name"],
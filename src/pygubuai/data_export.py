@@ -1,14 +1,73 @@
 """Data export functionality for PygubuAI projects"""
 
+import ast
+import importlib.util
 from pathlib import Path
 from typing import List, Union, Optional
+from xml.etree.ElementTree import SubElement
+
 from defusedxml import ElementTree as ET
 from .registry import Registry
 from .utils import validate_path
 
+# Detected without importing; pyarrow is slow to import
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Format: (file dialog label, extension)
+EXPORT_FORMATS = {
+    "csv": ("CSV files", ".csv"),
+    "json": ("JSON files", ".json"),
+    "jsonl": ("JSON Lines files", ".jsonl"),
+    "parquet": ("Parquet files", ".parquet"),
+}
+
+# Class members written by the generator; replaced when export code is regenerated
+GENERATED_MEMBERS = {
+    "EXPORT_CHUNK_SIZE",
+    "EXPORT_IN_BACKGROUND",
+    "on_export",
+    "start_export",
+    "_export_step",
+    "_export_writer_loop",
+    "_finish_export",
+    "_on_export_progress",
+    "_on_export_done",
+    "_iter_export_rows",
+    "_count_export_rows",
+    "_get_export_data",
+    "_open_export_writer",
+    "_export_csv",
+    "_export_json",
+}
+
+
+def default_formats() -> List[str]:
+    """Formats offered when none are requested; Parquet only with pyarrow installed"""
+    return ["csv", "json", "parquet"] if PYARROW_AVAILABLE else ["csv", "json"]
+
+
+def add_export_capability(
+    project_name: str,
+    formats: List[str],
+    widget_id: Union[str, None] = None,
+    background: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> bool:
+    """Add export capability to project
+
+    Args:
+        project_name: Registered project
+        formats: Any of "csv", "json", "jsonl" and "parquet"
+        widget_id: Treeview to export (default: a stub to fill in)
+        background: Write files from a background thread
+        chunk_size: Rows read per event-loop turn
+    """
+    unknown = [f for f in formats if f not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(unknown)}. Use: {', '.join(EXPORT_FORMATS)}")
 
-def add_export_capability(project_name: str, formats: List[str], widget_id: Union[str, None] = None) -> bool:
-    """Add export capability to project"""
     registry = Registry()
     project_path = registry.get_project(project_name)
     if not project_path:
@@ -20,7 +79,7 @@ def add_export_capability(project_name: str, formats: List[str], widget_id: Unio
     _add_export_button(str(validated_path), project_name, formats)
 
     # Generate export code
-    _generate_export_code(str(validated_path), project_name, formats, widget_id)
+    _generate_export_code(str(validated_path), project_name, formats, widget_id, background, chunk_size)
 
     return True
 
@@ -36,101 +95,308 @@ def _add_export_button(project_path: str, project_name: str, formats: List[str])
 
     # Find main frame
     frame = root.find(".//object[@id='mainframe']")
-    if frame is None:
+    if frame is None or frame.find(".//object[@id='export_button']") is not None:
         return
 
     # Add export button
-    button = ET.SubElement(frame, "object", {"class": "ttk.Button", "id": "export_button"})
-    text_prop = ET.SubElement(button, "property", {"name": "text"})
+    button = SubElement(frame, "object", {"class": "ttk.Button", "id": "export_button"})
+    text_prop = SubElement(button, "property", {"name": "text"})
     text_prop.text = "Export"
-    cmd_prop = ET.SubElement(button, "property", {"name": "command"})
+    cmd_prop = SubElement(button, "property", {"name": "command"})
     cmd_prop.text = "on_export"
 
     # Layout
-    layout = ET.SubElement(button, "layout", {"manager": "pack"})
-    side_prop = ET.SubElement(layout, "property", {"name": "side"})
+    layout = SubElement(button, "layout", {"manager": "pack"})
+    side_prop = SubElement(layout, "property", {"name": "side"})
     side_prop.text = "bottom"
 
     tree.write(ui_file, encoding="utf-8", xml_declaration=True)
 
 
-def _generate_export_code(project_path: str, project_name: str, formats: List[str], widget_id: Optional[str]) -> None:
+def _generate_export_code(
+    project_path: str,
+    project_name: str,
+    formats: List[str],
+    widget_id: Optional[str],
+    background: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
     """Generate export callback code"""
     py_file = Path(project_path) / f"{project_name}.py"
     if not py_file.exists():
         return
 
     code = py_file.read_text()
+    export_method = _create_export_method(formats, widget_id, background, chunk_size)
+    py_file.write_text(insert_export_code(code, export_method))
+
+
+def insert_export_code(code: str, export_method: str) -> str:
+    """Place export_method in the app class, before run() or at the class end.
+
+    The app class is found with ast, so formatting elsewhere is untouched.
+    Export code generated earlier is removed first, so regenerating with
+    other options replaces it rather than duplicating it.
+
+    Raises:
+        ValueError: If the code cannot be parsed or has no class
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        raise ValueError(f"Cannot parse application code: {e}")
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    if not classes:
+        raise ValueError("No application class found")
+    app = next((cls for cls in classes if "connect_callbacks" in ast.unparse(cls)), classes[0])
+
+    lines = code.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    removed = set()
+    anchor = None
+    for node in app.body:
+        first = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])]) - 1
+        names = [getattr(node, "name", None)]
+        if isinstance(node, ast.Assign):
+            names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        if isinstance(node, ast.FunctionDef) and node.name == "run":
+            anchor = first
+        elif set(names) & GENERATED_MEMBERS:
+            # Take the blank lines before the member with it
+            while first > 0 and not lines[first - 1].strip():
+                first -= 1
+            removed.update(range(first, node.end_lineno))
+
+    if anchor is None:
+        anchor, block = app.end_lineno, f"\n{export_method}\n"
+    else:
+        block = f"{export_method}\n\n"
+    result = [line for index, line in enumerate(lines[:anchor]) if index not in removed]
+    result.append(block)
+    result.extend(line for index, line in enumerate(lines[anchor:], anchor) if index not in removed)
+    return "".join(result)
+
+
+_EXPORT_DRIVER = '''
+    def start_export(self, filename):
+        """Stream rows to filename, reading one chunk per event-loop turn"""
+        import queue
+        import threading
+
+        rows = self._iter_export_rows()
+        state = {"filename": filename, "rows": rows, "done": 0, "error": None, "queue": None, "thread": None}
+        try:
+            state["total"] = self._count_export_rows()
+            state["write"], state["close"] = self._open_export_writer(filename, next(rows, []))
+        except Exception as e:
+            self._on_export_done(filename, 0, e)
+            return
+        try:
+            state["progressbar"] = self.builder.get_object("export_progress")
+        except Exception:
+            state["progressbar"] = None
+        if self.EXPORT_IN_BACKGROUND:
+            state["queue"] = queue.Queue(maxsize=4)
+            state["thread"] = threading.Thread(target=self._export_writer_loop, args=(state,), daemon=True)
+            state["thread"].start()
+        self._export_state = state
+        self.mainwindow.after_idle(self._export_step, state)
+
+    def _export_step(self, state):
+        """Read one chunk on the Tk thread, write it (or queue it), reschedule"""
+        import itertools
 
-    # Generate export method
-    export_method = _create_export_method(formats, widget_id)
-
-    # Insert before run() method
-    if "def run(self):" in code:
-        code = code.replace("def run(self):", f"{export_method}\n\n    def run(self):")
-        py_file.write_text(code)
-
-
-def _create_export_method(formats: List[str], widget_id: Union[str, None] = None) -> str:
-    """Create export method code"""
-    method = '''    def on_export(self):
+        try:
+            chunk = [] if state["error"] else list(itertools.islice(state["rows"], self.EXPORT_CHUNK_SIZE))
+            if chunk:
+                if state["queue"] is not None:
+                    state["queue"].put(chunk)
+                else:
+                    state["write"](chunk)
+                state["done"] += len(chunk)
+                self._on_export_progress(state)
+                self.mainwindow.after(1, self._export_step, state)
+                return
+        except Exception as e:
+            state["error"] = e
+        if state["queue"] is not None:
+            state["queue"].put(None)
+        self._finish_export(state)
+
+    def _export_writer_loop(self, state):
+        """Background thread: write queued chunks until the end marker"""
+        while True:
+            chunk = state["queue"].get()
+            if chunk is None:
+                break
+            if state["error"] is None:
+                try:
+                    state["write"](chunk)
+                except Exception as e:
+                    state["error"] = e
+
+    def _finish_export(self, state):
+        """Close the file once the writer thread has drained its queue"""
+        if state["thread"] is not None and state["thread"].is_alive():
+            self.mainwindow.after(50, self._finish_export, state)
+            return
+        try:
+            state["close"]()
+        except Exception as e:
+            state["error"] = state["error"] or e
+        self._export_state = None
+        self._on_export_done(state["filename"], state["done"], state["error"])
+
+    def _on_export_progress(self, state):
+        """Update the 'export_progress' Progressbar, if the UI has one"""
+        bar = state["progressbar"]
+        if bar is not None and state["total"]:
+            bar["maximum"] = state["total"]
+            bar["value"] = min(state["done"], state["total"])
+
+    def _on_export_done(self, filename, rows, error):
+        """Report the outcome of an export"""
+        from tkinter import messagebox
+
+        if error is not None:
+            messagebox.showerror("Export failed", f"Could not export to {filename}: {error}")
+        else:
+            messagebox.showinfo("Export complete", f"Exported {rows} rows to {filename}")'''
+
+_WRITER_HEADER = '''
+    def _open_export_writer(self, filename, header):
+        """Open an incremental writer for the file's format: (write_chunk, close)"""
+        lower = filename.lower()
+        record = (lambda row: dict(zip(header, row))) if header else list'''
+
+_WRITERS = {
+    "csv": '''
+        if lower.endswith(".csv"):
+            import csv
+
+            f = open(filename, "w", newline="", encoding="utf-8")
+            writer = csv.writer(f)
+            if header:
+                writer.writerow(header)
+            return writer.writerows, f.close''',
+    "json": '''
+        if lower.endswith(".json"):
+            import json
+
+            f = open(filename, "w", encoding="utf-8")
+            f.write("[")
+            separator = "\\n  "
+
+            def write_json(rows):
+                nonlocal separator
+                for row in rows:
+                    f.write(separator + json.dumps(record(row), default=str))
+                    separator = ",\\n  "
+
+            def close_json():
+                f.write("\\n]\\n" if separator != "\\n  " else "]\\n")
+                f.close()
+
+            return write_json, close_json''',
+    "jsonl": '''
+        if lower.endswith(".jsonl"):
+            import json
+
+            f = open(filename, "w", encoding="utf-8")
+
+            def write_jsonl(rows):
+                f.writelines(json.dumps(record(row), default=str) + "\\n" for row in rows)
+
+            return write_jsonl, f.close''',
+    "parquet": '''
+        if lower.endswith(".parquet"):
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+
+            schema = pa.schema([(str(name), pa.string()) for name in header])
+            parquet = pq.ParquetWriter(filename, schema)
+
+            def write_parquet(rows):
+                columns = [
+                    pa.array([None if i >= len(row) else str(row[i]) for row in rows], pa.string())
+                    for i in range(len(header))
+                ]
+                parquet.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+            return write_parquet, parquet.close''',
+}
+
+
+def _create_export_method(
+    formats: List[str],
+    widget_id: Union[str, None] = None,
+    background: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> str:
+    """Create export method code
+
+    The generated code never materialises the table: rows come from a
+    generator, are read on the Tk thread one chunk per after() turn so
+    the mainloop stays responsive, and are written incrementally, either
+    directly or by a background thread fed through a bounded queue.
+    """
+    formats = [f for f in EXPORT_FORMATS if f in formats] or default_formats()
+    filetypes = ", ".join(f'("{EXPORT_FORMATS[f][0]}", "*{EXPORT_FORMATS[f][1]}")' for f in formats)
+    rows_code = generate_treeview_export(widget_id) if widget_id else _STUB_ROWS
+
+    method = f'''    EXPORT_CHUNK_SIZE = {chunk_size}
+    EXPORT_IN_BACKGROUND = {background}
+
+    def on_export(self):
         """Export data"""
         from tkinter import filedialog
-        import csv
-        import json
 
+        if getattr(self, "_export_state", None):
+            return  # An export is already running
         filename = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json"), ("All files", "*.*")]
+            defaultextension="{EXPORT_FORMATS[formats[0]][1]}",
+            filetypes=[{filetypes}, ("All files", "*.*")],
         )
-        if not filename:
-            return
-
-        # Get data from widget
-        data = self._get_export_data()
+        if filename:
+            self.start_export(filename)
+{_EXPORT_DRIVER}
 
-        # Export based on format
-        if filename.endswith('.csv'):
-            self._export_csv(data, filename)
-        elif filename.endswith('.json'):
-            self._export_json(data, filename)
+{rows_code}
+{_WRITER_HEADER}'''
+    for fmt in formats:
+        method += _WRITERS[fmt]
+    method += '''
+        raise ValueError(f"Unsupported export format: {filename}")'''
 
-    def _get_export_data(self):
-        """Get data to export"""
-        # TODO: Implement based on widget type
-        return []
+    return method
 
-    def _export_csv(self, data, filename):
-        """Export to CSV"""
-        with open(filename, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerows(data)
 
-    def _export_json(self, data, filename):
-        """Export to JSON"""
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)'''
+_STUB_ROWS = '''    def _iter_export_rows(self):
+        """Yield the header, then one list per row"""
+        # TODO: Implement based on widget type
+        yield from ()
 
-    return method
+    def _count_export_rows(self):
+        """Number of rows, for progress (None if unknown)"""
+        return None'''
 
 
 def generate_treeview_export(widget_id: str) -> str:
     """Generate Treeview export code"""
-    return f'''    def _get_export_data(self):
-        """Get data from Treeview"""
+    return f'''    def _iter_export_rows(self):
+        """Yield the Treeview's columns, then its rows one at a time"""
         tree = self.builder.get_object('{widget_id}')
-        data = []
-
-        # Get columns
-        columns = tree['columns']
-        data.append(list(columns))
-
-        # Get rows
+        yield list(tree['columns'])
         for item in tree.get_children():
-            values = tree.item(item)['values']
-            data.append(list(values))
+            yield list(tree.item(item, 'values'))
 
-        return data'''
+    def _count_export_rows(self):
+        """Number of rows, for progress"""
+        return len(self.builder.get_object('{widget_id}').get_children())'''
 
 
 def main():
@@ -140,22 +406,27 @@ def main():
     if len(sys.argv) < 3:
         print("Usage: pygubu-export <command> <project> [options]")
         print("Commands:")
-        print("  add <project> --format csv,json,pd")
+        print("  add <project> [--format csv,json,jsonl,parquet] [--widget TREEVIEW_ID]")
+        print("                [--background] [--chunk-size N]")
         print("  add-button <project>")
         sys.exit(1)
 
     command = sys.argv[1]
     project = sys.argv[2]
 
-    if command == "add":
-        formats = ["csv", "json"]
-        if "--format" in sys.argv:
-            idx = sys.argv.index("--format")
+    def option(name):
+        if name in sys.argv:
+            idx = sys.argv.index(name)
             if idx + 1 < len(sys.argv):
-                formats = sys.argv[idx + 1].split(",")
+                return sys.argv[idx + 1]
+        return None
 
+    if command == "add":
+        formats = option("--format")
+        formats = formats.split(",") if formats else default_formats()
         try:
-            add_export_capability(project, formats)
+            chunk_size = int(option("--chunk-size") or DEFAULT_CHUNK_SIZE)
+            add_export_capability(project, formats, option("--widget"), "--background" in sys.argv, chunk_size)
             print(f"OK Added export capability to '{project}'")
             print(f"  Formats: {', '.join(formats)}")
         except Exception as e:
@@ -2,6 +2,8 @@
 """Database management CLI"""
 import sys
 import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 from .utils import validate_path
 
 try:
@@ -15,7 +17,7 @@ except ImportError:
 
 def init_database():
     """Initialize database"""
-    from .db import init_db, get_db_path, SQLALCHEMY_AVAILABLE
+    from .db import init_db, close_db, get_db_path, SQLALCHEMY_AVAILABLE
 
     if not SQLALCHEMY_AVAILABLE:
         print("Error: SQLAlchemy not installed")
@@ -29,7 +31,10 @@ def init_database():
         response = input("Reinitialize? (y/N): ")
         if response.lower() != "y":
             return False
-        db_path.unlink()
+        close_db()
+        for path in (db_path, db_path.with_name(db_path.name + "-wal"), db_path.with_name(db_path.name + "-shm")):
+            if path.exists():
+                path.unlink()
 
     if init_db():
         print(f"OK Database initialized at {db_path}")
@@ -37,108 +42,177 @@ def init_database():
     return False
 
 
+def _load_workflow_events(name: str, path: str, limit: int = 100) -> List[Dict[str, Any]]:
+    """Read a project's JSON workflow history as bulk-insert rows"""
+    project_path = validate_path(path, must_exist=True, must_be_dir=True)
+    workflow_file = project_path / ".pygubu-workflow.json"
+    if not workflow_file.exists():
+        return []
+
+    with open(workflow_file) as f:
+        workflow_data = json.load(f)
+
+    events = []
+    history = workflow_data.get("history", workflow_data.get("changes", []))
+    for event in history[:limit]:
+        try:
+            timestamp = datetime.fromisoformat(event["timestamp"]) if event.get("timestamp") else None
+        except (TypeError, ValueError):
+            timestamp = None
+        events.append(
+            {
+                "project_name": name,
+                "action": event.get("action", "file_changed"),
+                "description": event.get("description", event.get("file", "")),
+                "timestamp": timestamp,
+            }
+        )
+    return events
+
+
 def migrate_from_json():
     """Migrate data from JSON to database"""
-    from .db import init_db, get_session, SQLALCHEMY_AVAILABLE
-    from .db.operations import create_project, add_workflow_event
+    from .db import session_scope, SQLALCHEMY_AVAILABLE
+    from .db.operations import create_project, add_workflow_events_bulk
     from .registry import Registry
 
     if not SQLALCHEMY_AVAILABLE:
         print("Error: SQLAlchemy not installed")
         return False
 
-    init_db()
-    session = get_session()
-    if not session:
-        return False
-
     try:
-        registry = Registry()
-        projects = registry.list_projects_with_metadata()
+        with session_scope() as session:
+            if session is None:
+                return False
+
+            registry = Registry()
+            projects = registry.list_projects_with_metadata()
 
-        print(f"Migrating {len(projects)} projects...")
+            print(f"Migrating {len(projects)} projects...")
 
-        for name, metadata in projects.items():
-            path = metadata.get("path") if isinstance(metadata, dict) else metadata
-            description = metadata.get("description", "") if isinstance(metadata, dict) else ""
+            events: List[Dict[str, Any]] = []
+            for name, metadata in projects.items():
+                path = metadata.get("path") if isinstance(metadata, dict) else metadata
+                description = metadata.get("description", "") if isinstance(metadata, dict) else ""
 
-            project = create_project(session, name, path, description)
-            if project:
-                print(f"  OK {name}")
+                project = create_project(session, name, path, description)
+                if project:
+                    print(f"  OK {name}")
 
-                # Migrate workflow events
-                project_path = validate_path(path, must_exist=True, must_be_dir=True)
-                workflow_file = project_path / ".pygubu-workflow.json"
-                if workflow_file.exists():
+                    # Workflow events are inserted in one batch after all projects exist
                     try:
-                        with open(workflow_file) as f:
-                            workflow_data = json.load(f)
-
-                        history = workflow_data.get("history", workflow_data.get("changes", []))
-                        for event in history[:100]:  # Limit to last 100
-                            action = event.get("action", "file_changed")
-                            desc = event.get("description", event.get("file", ""))
-                            add_workflow_event(session, name, action, desc)
+                        events.extend(_load_workflow_events(name, path))
                     except Exception as e:
                         print(f"    Warning: Could not migrate workflow: {e}")
 
-        print(f"\nOK Migration complete: {len(projects)} projects")
+            event_count = add_workflow_events_bulk(session, events)
+
+        print(f"\nOK Migration complete: {len(projects)} projects, {event_count} workflow events")
         return True
 
     except Exception as e:
         print(f"Error during migration: {e}")
         return False
-    finally:
-        session.close()
 
 
-def show_stats():
-    """Show database statistics"""
-    from .db import get_session, SQLALCHEMY_AVAILABLE
-    from .db.models import Project, Template, WorkflowEvent, Analytics
+def show_stats(metric: Optional[str] = None, hours: int = 24):
+    """Show database statistics and metric summaries for the last hours"""
+    from .db import session_scope, SQLALCHEMY_AVAILABLE
+    from .db.models import Project, Template, WorkflowEvent, Analytics, AnalyticsRollup
+    from .db.metrics import get_metrics_store, list_metrics, query_metric, summarize_metric
 
     if not SQLALCHEMY_AVAILABLE:
         print("Error: SQLAlchemy not installed")
         return
 
-    session = get_session()
-    if not session:
-        print("Error: Database not initialized")
-        return
+    get_metrics_store().flush()
+    with session_scope() as session:
+        if session is None:
+            print("Error: Database not available")
+            return
 
-    try:
         project_count = session.query(Project).count()
         template_count = session.query(Template).count()
         event_count = session.query(WorkflowEvent).count()
         analytics_count = session.query(Analytics).count()
+        rollup_count = session.query(AnalyticsRollup).count()
 
-        if RICH_AVAILABLE:
-            console = Console()
-            table = Table(title="Database Statistics")
-            table.add_column("Metric", style="cyan")
-            table.add_column("Count", style="green")
-
-            table.add_row("Projects", str(project_count))
-            table.add_row("Templates", str(template_count))
-            table.add_row("Workflow Events", str(event_count))
-            table.add_row("Analytics Records", str(analytics_count))
-
-            console.print(table)
-        else:
-            print("\nDatabase Statistics:")
-            print(f"  Projects: {project_count}")
-            print(f"  Templates: {template_count}")
-            print(f"  Workflow Events: {event_count}")
-            print(f"  Analytics Records: {analytics_count}")
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(hours=hours)
+    if metric:
+        title = f"{metric} (last {hours}h)"
+        rows = [(bucket["start"], bucket) for bucket in query_metric(metric, start, end)]
+    else:
+        title = f"Metrics (last {hours}h)"
+        rows = [(name, summarize_metric(name, start, end)) for name in list_metrics()]
+        rows = [(name, summary) for name, summary in rows if summary["count"]]
+
+    def fmt(value) -> str:
+        return "-" if value is None else f"{value:.2f}"
+
+    if RICH_AVAILABLE:
+        console = Console()
+        table = Table(title="Database Statistics")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Count", style="green")
+
+        table.add_row("Projects", str(project_count))
+        table.add_row("Templates", str(template_count))
+        table.add_row("Workflow Events", str(event_count))
+        table.add_row("Analytics Records", str(analytics_count))
+        table.add_row("Analytics Rollups", str(rollup_count))
+
+        console.print(table)
+
+        if rows:
+            metrics_table = Table(title=title)
+            for column in ("Bucket" if metric else "Metric", "Count", "Avg", "P95", "Max"):
+                metrics_table.add_column(column, style="cyan" if column in ("Bucket", "Metric") else "green")
+            for label, stats in rows:
+                metrics_table.add_row(
+                    label, str(stats["count"]), fmt(stats["avg"]), fmt(stats["p95"]), fmt(stats["max"])
+                )
+            console.print(metrics_table)
+    else:
+        print("\nDatabase Statistics:")
+        print(f"  Projects: {project_count}")
+        print(f"  Templates: {template_count}")
+        print(f"  Workflow Events: {event_count}")
+        print(f"  Analytics Records: {analytics_count}")
+        print(f"  Analytics Rollups: {rollup_count}")
+
+        if rows:
+            print(f"\n{title}:")
+            for label, stats in rows:
+                print(
+                    f"  {label}: count={stats['count']} avg={fmt(stats['avg'])} "
+                    f"p95={fmt(stats['p95'])} max={fmt(stats['max'])}"
+                )
+
+
+def prune_analytics():
+    """Apply analytics retention"""
+    from .db import SQLALCHEMY_AVAILABLE
+    from .db.metrics import get_metrics_store
 
-    finally:
-        session.close()
+    if not SQLALCHEMY_AVAILABLE:
+        print("Error: SQLAlchemy not installed")
+        return False
+
+    store = get_metrics_store()
+    store.flush()
+    deleted = store.apply_retention()
+    for tier, count in deleted.items():
+        print(f"  {tier}: {count} rows older than {store.retention_days[tier]} days removed")
+    print("OK Analytics retention applied")
+    return True
 
 
-def backup_database(output_file: str):
-    """Backup database"""
-    import shutil
+def backup_database(output_file: str, compression: Optional[str] = None):
+    """Backup database while it stays available to other processes"""
     from .db import get_db_path
+    from .db.backup import backup_database as write_backup
+    from .errors import PygubuAIError
 
     db_path = get_db_path()
     if not db_path.exists():
@@ -146,15 +220,20 @@ def backup_database(output_file: str):
         return False
 
     output_path = validate_path(output_file)
-    shutil.copy2(db_path, output_path)
+    try:
+        write_backup(db_path, output_path, compression)
+    except (PygubuAIError, ValueError) as e:
+        print(f"Error: {e}")
+        return False
     print(f"OK Database backed up to {output_path}")
     return True
 
 
 def restore_database(backup_file: str):
-    """Restore database from backup"""
-    import shutil
+    """Restore database from backup after an integrity check"""
     from .db import get_db_path
+    from .db.backup import restore_database as apply_backup
+    from .errors import PygubuAIError
 
     backup_path = validate_path(backup_file, must_exist=True)
     if not backup_path.exists():
@@ -168,7 +247,11 @@ def restore_database(backup_file: str):
         if response.lower() != "y":
             return False
 
-    shutil.copy2(backup_path, db_path)
+    try:
+        apply_backup(backup_path, db_path)
+    except PygubuAIError as e:
+        print(f"Error: {e}")
+        return False
     print(f"OK Database restored from {backup_path}")
     return True
 
@@ -180,8 +263,9 @@ def main():
         print("\nCommands:")
         print("  init                  - Initialize database")
         print("  migrate               - Migrate from JSON to database")
-        print("  stats                 - Show database statistics")
-        print("  backup <file>         - Backup database")
+        print("  stats [metric]        - Show database and metric statistics (--hours N)")
+        print("  prune                 - Apply analytics retention")
+        print("  backup <file>         - Backup database (--compress gzip|zstd, or .gz/.zst file)")
         print("  restore <file>        - Restore database from backup")
         sys.exit(1)
 
@@ -192,17 +276,40 @@ def main():
     elif command == "migrate":
         migrate_from_json()
     elif command == "stats":
-        show_stats()
+        args = sys.argv[2:]
+        hours = 24
+        if "--hours" in args:
+            index = args.index("--hours")
+            try:
+                hours = int(args[index + 1])
+            except (IndexError, ValueError):
+                print("Error: --hours requires a number")
+                sys.exit(1)
+            del args[index : index + 2]
+        show_stats(args[0] if args else None, hours)
+    elif command == "prune":
+        prune_analytics()
     elif command == "backup":
-        if len(sys.argv) < 3:
-            print("Usage: pygubu-db backup <file>")
+        args = sys.argv[2:]
+        compression = None
+        if "--compress" in args:
+            index = args.index("--compress")
+            if index + 1 >= len(args):
+                print("Error: --compress requires gzip, zstd or none")
+                sys.exit(1)
+            compression = args[index + 1]
+            del args[index : index + 2]
+        if not args:
+            print("Usage: pygubu-db backup <file> [--compress gzip|zstd]")
+            sys.exit(1)
+        if not backup_database(args[0], compression):
             sys.exit(1)
-        backup_database(sys.argv[2])
     elif command == "restore":
         if len(sys.argv) < 3:
             print("Usage: pygubu-db restore <file>")
             sys.exit(1)
-        restore_database(sys.argv[2])
+        if not restore_database(sys.argv[2]):
+            sys.exit(1)
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
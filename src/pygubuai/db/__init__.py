@@ -1,13 +1,16 @@
 """Database module for SQLAlchemy integration"""
 
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 try:
-    from sqlalchemy import create_engine
+    from sqlalchemy import create_engine, event
     from sqlalchemy.orm import sessionmaker, Session
 
     SQLALCHEMY_AVAILABLE = True
@@ -16,20 +19,61 @@ except ImportError:
     Session = None  # type: ignore[assignment,misc]
     logger.warning("SQLAlchemy not installed, database features unavailable")
 
+# Applied to every new SQLite connection. WAL lets watchers read while a CLI
+# command writes; NORMAL synchronous is durable in WAL mode without an fsync
+# per statement; busy_timeout makes writers wait instead of failing with
+# "database is locked".
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("busy_timeout", "5000"),
+    ("foreign_keys", "ON"),
+)
+
 _engine = None
 _SessionLocal = None
+_init_lock = threading.Lock()
 
 
 def get_db_path() -> Path:
-    """Get database file path"""
+    """Get database file path (PYGUBUAI_DB_PATH overrides the default)"""
+    env_path = os.environ.get("PYGUBUAI_DB_PATH")
+    if env_path:
+        return Path(env_path).expanduser()
     return Path.home() / ".pygubuai" / "pygubuai.db"  # type: ignore[no-any-return]
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure each pooled connection when it is opened"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
 def init_db(db_path: Optional[Path] = None) -> bool:
-    """Initialize database"""
+    """Initialize database engine and schema"""
     if not SQLALCHEMY_AVAILABLE:
         return False
+    with _init_lock:
+        _init_locked(db_path)
+    return True
+
+
+def _ensure_db() -> None:
+    """Initialize the default database once, however many threads get here first"""
+    if _SessionLocal is not None:
+        return
+    with _init_lock:
+        # Another thread may have finished init_db while we waited for the lock
+        if _SessionLocal is None:
+            _init_locked(None)
 
+
+def _init_locked(db_path: Optional[Path]) -> None:
+    """Body of init_db; the caller holds _init_lock"""
     global _engine, _SessionLocal
 
     if db_path is None:
@@ -37,27 +81,76 @@ def init_db(db_path: Optional[Path] = None) -> bool:
 
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    _engine = create_engine(f"sqlite:///{db_path}", echo=False)
-    _SessionLocal = sessionmaker(bind=_engine)
+    if _engine is not None:
+        _engine.dispose()
+
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        echo=False,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        connect_args={"timeout": 30, "check_same_thread": False},
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
 
     from .models import Base
+    from .search import create_search_index
 
-    Base.metadata.create_all(_engine)
+    Base.metadata.create_all(engine)
+    create_search_index(engine)
+
+    _engine = engine
+    _SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
 
     logger.info(f"Database initialized at {db_path}")
-    return True
+
+
+def get_engine():
+    """Get the engine, initializing the default database on first use"""
+    if not SQLALCHEMY_AVAILABLE:
+        return None
+    _ensure_db()
+    return _engine
 
 
 def get_session() -> Optional[Session]:
-    """Get database session"""
-    if not SQLALCHEMY_AVAILABLE or _SessionLocal is None:
+    """Get database session, initializing the database on first use"""
+    if not SQLALCHEMY_AVAILABLE:
+        return None
+    try:
+        _ensure_db()
+    except Exception as e:
+        logger.warning(f"Database unavailable: {e}")
         return None
-    return _SessionLocal()
+    return _SessionLocal() if _SessionLocal is not None else None
+
+
+@contextmanager
+def session_scope() -> Iterator[Optional[Session]]:
+    """Session for one unit of work: commit on success, rollback on error.
+
+    Yields None when SQLAlchemy is unavailable, so callers can skip work.
+    """
+    session = get_session()
+    if session is None:
+        yield None
+        return
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
 
 
 def close_db():
     """Close database connection"""
-    global _engine
-    if _engine:
-        _engine.dispose()
-        _engine = None
+    global _engine, _SessionLocal
+    with _init_lock:
+        if _engine:
+            _engine.dispose()
+            _engine = None
+            _SessionLocal = None
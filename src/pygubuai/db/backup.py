@@ -0,0 +1,212 @@
+"""Online database backup and restore with the SQLite backup API"""
+
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional
+
+from ..errors import DatabaseError, DependencyError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+COMPRESSIONS = ("none", "gzip", "zstd")
+# Pages copied per backup step; the source is unlocked between steps so
+# writers are never held up for the whole copy.
+BACKUP_PAGES = 256
+BACKUP_SLEEP = 0.005
+CHUNK_SIZE = 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+Progress = Callable[[int, int], None]
+
+
+def compression_for(path: Path) -> str:
+    """Compression implied by a backup file name"""
+    if path.suffix == ".gz":
+        return "gzip"
+    if path.suffix in (".zst", ".zstd"):
+        return "zstd"
+    return "none"
+
+
+def _detect_compression(path: Path) -> str:
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if magic == _ZSTD_MAGIC:
+        return "zstd"
+    return "none"
+
+
+def _require_zstd() -> None:
+    if not ZSTD_AVAILABLE:
+        raise DependencyError("zstandard", 'Install with: pip install -e ".[backup]" or use gzip')
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), timeout=30)
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+def _copy_pages(source: sqlite3.Connection, target: sqlite3.Connection, progress: Optional[Progress]) -> None:
+    def report(status: int, remaining: int, total: int) -> None:
+        if progress is not None:
+            progress(total - remaining, total)
+
+    source.backup(target, pages=BACKUP_PAGES, progress=report, sleep=BACKUP_SLEEP)
+
+
+def check_integrity(path: Path) -> None:
+    """Raise DatabaseError unless PRAGMA integrity_check passes"""
+    conn = sqlite3.connect(str(path))
+    try:
+        rows = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+    except sqlite3.DatabaseError as e:
+        raise DatabaseError("integrity check", str(e), e) from e
+    finally:
+        conn.close()
+    if rows != ["ok"]:
+        raise DatabaseError("integrity check", "; ".join(rows[:5]))
+
+
+def _compress(source: Path, target: BinaryIO, compression: str) -> None:
+    with open(source, "rb") as src:
+        if compression == "gzip":
+            with gzip.GzipFile(fileobj=target, mode="wb", mtime=0) as out:
+                shutil.copyfileobj(src, out, CHUNK_SIZE)
+        elif compression == "zstd":
+            _require_zstd()
+            with zstandard.ZstdCompressor(threads=-1).stream_writer(target, closefd=False) as out:
+                shutil.copyfileobj(src, out, CHUNK_SIZE)
+        else:
+            shutil.copyfileobj(src, target, CHUNK_SIZE)
+
+
+def _decompress(source: Path, target: BinaryIO, compression: str) -> None:
+    with open(source, "rb") as src:
+        if compression == "gzip":
+            with gzip.GzipFile(fileobj=src, mode="rb") as stream:
+                shutil.copyfileobj(stream, target, CHUNK_SIZE)
+        elif compression == "zstd":
+            _require_zstd()
+            with zstandard.ZstdDecompressor().stream_reader(src) as stream:
+                shutil.copyfileobj(stream, target, CHUNK_SIZE)
+        else:
+            shutil.copyfileobj(src, target, CHUNK_SIZE)
+
+
+def backup_database(
+    db_path: Path, output_path: Path, compression: Optional[str] = None, progress: Optional[Progress] = None
+) -> Path:
+    """Write a consistent snapshot of a live database.
+
+    Pages are copied in small steps through the SQLite backup API, so the
+    snapshot is transactionally consistent and concurrent writers keep
+    running. The snapshot is then streamed through the compressor.
+
+    Args:
+        db_path: Database to back up
+        output_path: Backup file to write
+        compression: "none", "gzip" or "zstd" (default: from the file suffix)
+        progress: Called with (pages copied, total pages)
+
+    Returns:
+        Path of the written backup
+
+    Raises:
+        DatabaseError: If the backup fails
+        DependencyError: If zstd is requested without zstandard installed
+    """
+    compression = compression or compression_for(output_path)
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}'. Use one of: {', '.join(COMPRESSIONS)}")
+    if compression == "zstd":
+        _require_zstd()
+    if not db_path.exists():
+        raise DatabaseError("backup", f"database does not exist: {db_path}")
+
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, snapshot_name = tempfile.mkstemp(dir=output_path.parent, prefix=".pygubuai-backup-", suffix=".db")
+        os.close(fd)
+    except OSError as e:
+        raise DatabaseError("backup", str(e), e) from e
+    snapshot = Path(snapshot_name)
+    partial = output_path.with_name(output_path.name + ".partial")
+    try:
+        source = _connect(db_path)
+        target = sqlite3.connect(str(snapshot))
+        try:
+            _copy_pages(source, target, progress)
+        finally:
+            target.close()
+            source.close()
+
+        with open(partial, "wb") as out:
+            _compress(snapshot, out, compression)
+        os.replace(partial, output_path)
+    except (OSError, sqlite3.Error) as e:
+        # e.g. a full disk while compressing; the partial file goes in finally
+        raise DatabaseError("backup", str(e), e) from e
+    finally:
+        snapshot.unlink(missing_ok=True)
+        partial.unlink(missing_ok=True)
+
+    logger.info(f"Database backed up to {output_path} ({compression})")
+    return output_path
+
+
+def restore_database(backup_path: Path, db_path: Path, progress: Optional[Progress] = None) -> None:
+    """Replace a database with a backup after verifying it.
+
+    The backup is decompressed to a temporary file and integrity checked
+    before anything is touched, then copied into the live database through
+    the backup API, which keeps its WAL consistent for other connections.
+    The restored database is checked again.
+
+    Raises:
+        DatabaseError: If the backup is corrupt or the restore fails
+    """
+    if not backup_path.exists():
+        raise DatabaseError("restore", f"backup not found: {backup_path}")
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, staged_name = tempfile.mkstemp(dir=db_path.parent, prefix=".pygubuai-restore-", suffix=".db")
+    staged = Path(staged_name)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            _decompress(backup_path, out, _detect_compression(backup_path))
+        check_integrity(staged)
+
+        from . import close_db
+
+        close_db()
+        source = sqlite3.connect(str(staged))
+        target = _connect(db_path)
+        try:
+            _copy_pages(source, target, progress)
+        finally:
+            target.close()
+            source.close()
+        check_integrity(db_path)
+    except (OSError, EOFError, sqlite3.Error) as e:
+        raise DatabaseError("restore", str(e), e) from e
+    finally:
+        staged.unlink(missing_ok=True)
+
+    logger.info(f"Database restored from {backup_path}")
@@ -0,0 +1,451 @@
+"""Time-series analytics with minute, hour and day rollups"""
+
+import atexit
+import logging
+import math
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import session_scope, SQLALCHEMY_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+RESOLUTIONS = ("minute", "hour", "day")
+DEFAULT_RETENTION_DAYS = {"raw": 7, "minute": 2, "hour": 90}
+
+# Relative accuracy of the quantile sketch: estimates are within 1% of the
+# true sample value, whatever the range of the metric.
+SKETCH_ACCURACY = 0.01
+_GAMMA = (1 + SKETCH_ACCURACY) / (1 - SKETCH_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+_ZERO_BUCKET = "z"
+
+
+def _utc_naive(value: Optional[datetime]) -> datetime:
+    """Normalize to naive UTC, the form SQLite stores"""
+    if value is None:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def bucket_start(value: datetime, resolution: str) -> datetime:
+    """Start of the rollup bucket containing value"""
+    if resolution == "minute":
+        return value.replace(second=0, microsecond=0)
+    if resolution == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+    if resolution == "day":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown resolution: {resolution}")
+
+
+def _sketch_key(value: float) -> str:
+    """Log-scale histogram bucket of a sample"""
+    if value <= 0:
+        return _ZERO_BUCKET
+    return str(math.ceil(math.log(value) / _LOG_GAMMA))
+
+
+def _sketch_value(key: str) -> float:
+    """Representative value of a histogram bucket"""
+    if key == _ZERO_BUCKET:
+        return 0.0
+    return 2 * _GAMMA ** int(key) / (_GAMMA + 1)
+
+
+@dataclass
+class Aggregate:
+    """Mergeable count/min/max/sum and quantile sketch of samples"""
+
+    count: int = 0
+    min_value: float = math.inf
+    max_value: float = -math.inf
+    sum_value: float = 0.0
+    sketch: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.min_value = min(self.min_value, value)
+        self.max_value = max(self.max_value, value)
+        self.sum_value += value
+        key = _sketch_key(value)
+        self.sketch[key] = self.sketch.get(key, 0) + 1
+
+    def merge(self, other: "Aggregate") -> None:
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self.sum_value += other.sum_value
+        for key, count in other.sketch.items():
+            self.sketch[key] = self.sketch.get(key, 0) + count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated q-quantile (0..1), clamped to the observed range"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        keys = sorted(self.sketch, key=lambda k: -math.inf if k == _ZERO_BUCKET else int(k))
+        for key in keys:
+            seen += self.sketch[key]
+            if seen > rank:
+                return min(max(_sketch_value(key), self.min_value), self.max_value)
+        return self.max_value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "min": self.min_value if self.count else None,
+            "max": self.max_value if self.count else None,
+            "sum": self.sum_value,
+            "avg": self.sum_value / self.count if self.count else None,
+            "p95": self.quantile(0.95),
+        }
+
+
+def configured_retention_days() -> Dict[str, int]:
+    """Retention per tier: defaults overridden by "metrics_retention_days" in config"""
+    from ..config import Config
+
+    retention_days = dict(DEFAULT_RETENTION_DAYS)
+    configured = Config().get("metrics_retention_days", {})
+    if isinstance(configured, dict):
+        retention_days.update(configured)
+    return retention_days
+
+
+def choose_resolution(
+    start: datetime,
+    end: datetime,
+    retention_days: Optional[Dict[str, int]] = None,
+    now: Optional[datetime] = None,
+) -> str:
+    """Coarsest resolution that still gives a useful number of points.
+
+    With retention_days, a resolution whose rollups have already expired
+    at the start of the range gives way to the next coarser one.
+    """
+    span = end - start
+    if span <= timedelta(hours=6):
+        preferred = "minute"
+    elif span <= timedelta(days=14):
+        preferred = "hour"
+    else:
+        preferred = "day"
+    if retention_days is None:
+        return preferred
+
+    now = _utc_naive(now)
+    for resolution in RESOLUTIONS[RESOLUTIONS.index(preferred) :]:
+        days = retention_days.get(resolution)
+        if not days or days <= 0 or start >= now - timedelta(days=days):
+            return resolution
+    return RESOLUTIONS[-1]
+
+
+class MetricsStore:
+    """Buffers metric samples and writes them with their rollups in batches.
+
+    Raw samples go to the Analytics table; every flush also folds them into
+    per-minute, per-hour and per-day AnalyticsRollup rows, so range queries
+    read a bounded number of buckets and raw rows can be expired.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        retention_days: Optional[Dict[str, int]] = None,
+        retention_interval: float = 3600.0,
+        max_buffer: int = 10_000,
+    ):
+        """
+        Args:
+            batch_size: Samples buffered before a flush is attempted
+            retention_days: Days kept per tier (default: configured_retention_days())
+            retention_interval: Seconds between automatic retention runs
+            max_buffer: Samples kept while the database is unavailable; oldest dropped first
+        """
+        if retention_days is None:
+            retention_days = configured_retention_days()
+
+        self.batch_size = batch_size
+        self.max_buffer = max(max_buffer, batch_size)
+        self.retention_days = retention_days
+        self.retention_interval = retention_interval
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._last_retention: Optional[datetime] = None
+
+    def record(
+        self,
+        metric_name: str,
+        metric_value: float,
+        project_name: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        recorded_at: Optional[datetime] = None,
+    ) -> None:
+        """Buffer one sample, flushing when the batch is full"""
+        sample = {
+            "metric_name": metric_name,
+            "metric_value": float(metric_value),
+            "project_name": project_name,
+            "metadata": metadata or {},
+            "recorded_at": _utc_naive(recorded_at),
+        }
+        with self._lock:
+            self._buffer.append(sample)
+            # Every batch_size samples, so a failing database is not retried on each record
+            full = len(self._buffer) % self.batch_size == 0
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered samples and update rollups in one transaction.
+
+        Returns:
+            Number of samples written
+        """
+        with self._lock:
+            samples, self._buffer = self._buffer, []
+        if not samples or not SQLALCHEMY_AVAILABLE:
+            return 0
+
+        from sqlalchemy import insert
+        from .models import Analytics
+        from .operations import _project_ids
+
+        try:
+            with session_scope() as session:
+                if session is None:
+                    return 0
+                project_ids = _project_ids(session, (s["project_name"] for s in samples))
+                rows = [
+                    {
+                        "project_id": project_ids.get(s["project_name"]),
+                        "metric_name": s["metric_name"],
+                        "metric_value": s["metric_value"],
+                        "recorded_at": s["recorded_at"],
+                        "meta_data": s["metadata"],
+                    }
+                    for s in samples
+                ]
+                session.execute(insert(Analytics), rows)
+                self._update_rollups(session, rows)
+        except Exception as e:
+            self._requeue(samples)
+            logger.warning(f"Failed to write {len(samples)} metric samples, kept for the next flush: {e}")
+            return 0
+
+        now = _utc_naive(None)
+        if self._last_retention is None or (now - self._last_retention).total_seconds() >= self.retention_interval:
+            self.apply_retention(now)
+        return len(samples)
+
+    def _requeue(self, samples: List[Dict[str, Any]]) -> None:
+        """Put unwritten samples back ahead of newer ones, up to max_buffer"""
+        with self._lock:
+            buffer = samples + self._buffer
+            dropped = len(buffer) - self.max_buffer
+            if dropped > 0:
+                logger.warning(f"Metrics buffer full, dropping {dropped} oldest samples")
+                buffer = buffer[dropped:]
+            self._buffer = buffer
+
+    def _update_rollups(self, session, rows: List[Dict[str, Any]]) -> None:
+        """Merge rows into existing rollup buckets, creating missing ones"""
+        from .models import AnalyticsRollup
+
+        for resolution in RESOLUTIONS:
+            pending: Dict[Tuple[str, Optional[int], datetime], Aggregate] = {}
+            for row in rows:
+                key = (row["metric_name"], row["project_id"], bucket_start(row["recorded_at"], resolution))
+                pending.setdefault(key, Aggregate()).add(row["metric_value"])
+
+            starts = [key[2] for key in pending]
+            existing = {
+                (r.metric_name, r.project_id, r.bucket_start): r
+                for r in session.query(AnalyticsRollup).filter(
+                    AnalyticsRollup.resolution == resolution,
+                    AnalyticsRollup.metric_name.in_({key[0] for key in pending}),
+                    AnalyticsRollup.bucket_start >= min(starts),
+                    AnalyticsRollup.bucket_start <= max(starts),
+                )
+            }
+
+            for (metric_name, project_id, start), aggregate in pending.items():
+                rollup = existing.get((metric_name, project_id, start))
+                if rollup is None:
+                    session.add(
+                        AnalyticsRollup(
+                            metric_name=metric_name,
+                            project_id=project_id,
+                            resolution=resolution,
+                            bucket_start=start,
+                            count=aggregate.count,
+                            min_value=aggregate.min_value,
+                            max_value=aggregate.max_value,
+                            sum_value=aggregate.sum_value,
+                            sketch=aggregate.sketch,
+                        )
+                    )
+                    continue
+                merged = _rollup_aggregate(rollup)
+                merged.merge(aggregate)
+                rollup.count = merged.count
+                rollup.min_value = merged.min_value
+                rollup.max_value = merged.max_value
+                rollup.sum_value = merged.sum_value
+                rollup.sketch = merged.sketch
+
+    def apply_retention(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Delete raw samples and fine rollups older than their retention.
+
+        Returns:
+            Rows deleted per tier ("raw", "minute", "hour")
+        """
+        if not SQLALCHEMY_AVAILABLE:
+            return {}
+
+        from .models import Analytics, AnalyticsRollup
+
+        now = _utc_naive(now)
+        self._last_retention = now
+        deleted: Dict[str, int] = {}
+        with session_scope() as session:
+            if session is None:
+                return {}
+            for tier, days in self.retention_days.items():
+                if not days or days <= 0:
+                    continue
+                cutoff = now - timedelta(days=days)
+                if tier == "raw":
+                    query = session.query(Analytics).filter(Analytics.recorded_at < cutoff)
+                elif tier in RESOLUTIONS:
+                    query = session.query(AnalyticsRollup).filter(
+                        AnalyticsRollup.resolution == tier, AnalyticsRollup.bucket_start < cutoff
+                    )
+                else:
+                    continue
+                deleted[tier] = query.delete(synchronize_session=False)
+        return deleted
+
+
+def _rollup_aggregate(rollup) -> Aggregate:
+    """Aggregate stored in a rollup row"""
+    return Aggregate(
+        count=rollup.count,
+        min_value=rollup.min_value,
+        max_value=rollup.max_value,
+        sum_value=rollup.sum_value,
+        sketch=dict(rollup.sketch or {}),
+    )
+
+
+def _load_rollups(
+    metric_name: str, start: datetime, end: datetime, resolution: str, project_name: Optional[str]
+) -> List[Tuple[datetime, Aggregate]]:
+    """Rollup aggregates of a metric whose buckets overlap [start, end)"""
+    if not SQLALCHEMY_AVAILABLE:
+        return []
+
+    from .models import AnalyticsRollup
+    from .operations import _project_ids
+
+    with session_scope() as session:
+        if session is None:
+            return []
+        query = session.query(AnalyticsRollup).filter(
+            AnalyticsRollup.metric_name == metric_name,
+            AnalyticsRollup.resolution == resolution,
+            AnalyticsRollup.bucket_start >= bucket_start(start, resolution),
+            AnalyticsRollup.bucket_start < end,
+        )
+        if project_name:
+            project_id = _project_ids(session, [project_name]).get(project_name)
+            if project_id is None:
+                return []
+            query = query.filter(AnalyticsRollup.project_id == project_id)
+        return [(rollup.bucket_start, _rollup_aggregate(rollup)) for rollup in query]
+
+
+def query_metric(
+    metric_name: str,
+    start: datetime,
+    end: datetime,
+    resolution: Optional[str] = None,
+    project_name: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Bucketed statistics of a metric over [start, end) from the rollups.
+
+    Args:
+        metric_name: Metric to query
+        start: Range start
+        end: Range end
+        resolution: "minute", "hour" or "day" (default: chosen from the span)
+        project_name: Only samples of this project (default: all projects)
+
+    Returns:
+        One dict per non-empty bucket with start, count, min, max, sum, avg, p95
+    """
+    start, end = _utc_naive(start), _utc_naive(end)
+    resolution = resolution or choose_resolution(start, end, configured_retention_days())
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution: {resolution}")
+
+    buckets: Dict[datetime, Aggregate] = {}
+    for key, aggregate in _load_rollups(metric_name, start, end, resolution, project_name):
+        buckets.setdefault(key, Aggregate()).merge(aggregate)
+    return [{"start": key.isoformat(), **buckets[key].to_dict()} for key in sorted(buckets)]
+
+
+def summarize_metric(
+    metric_name: str, start: datetime, end: datetime, project_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Statistics of a metric over the whole range"""
+    start, end = _utc_naive(start), _utc_naive(end)
+    total = Aggregate()
+    resolution = choose_resolution(start, end, configured_retention_days())
+    for _, aggregate in _load_rollups(metric_name, start, end, resolution, project_name):
+        total.merge(aggregate)
+    return total.to_dict()
+
+
+def list_metrics() -> List[str]:
+    """Names of all metrics with rollups"""
+    if not SQLALCHEMY_AVAILABLE:
+        return []
+
+    from .models import AnalyticsRollup
+
+    with session_scope() as session:
+        if session is None:
+            return []
+        return sorted(name for (name,) in session.query(AnalyticsRollup.metric_name).distinct())
+
+
+_store: Optional[MetricsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_metrics_store() -> MetricsStore:
+    """Process-wide store, flushed automatically at exit"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MetricsStore()
+            atexit.register(_store.flush)
+        return _store
+
+
+def record_metric(
+    metric_name: str,
+    metric_value: float,
+    project_name: Optional[str] = None,
+    metadata: Optional[Dict] = None,
+) -> None:
+    """Record a sample through the process-wide store"""
+    get_metrics_store().record(metric_name, metric_value, project_name, metadata)
@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 
 try:
-    from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON
+    from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON, UniqueConstraint
     from sqlalchemy.orm import declarative_base, relationship
 
     SQLALCHEMY_AVAILABLE = True
@@ -74,6 +74,25 @@ try:
 
         project = relationship("Project", back_populates="analytics")
 
+    class AnalyticsRollup(Base):  # type: ignore[misc,valid-type]
+        """Aggregated analytics samples for one metric and time bucket"""
+
+        __tablename__ = "analytics_rollups"
+        __table_args__ = (
+            UniqueConstraint("metric_name", "project_id", "resolution", "bucket_start", name="uq_rollup_bucket"),
+        )
+
+        id = Column(Integer, primary_key=True)
+        project_id = Column(Integer, ForeignKey("projects.id"), nullable=True, index=True)
+        metric_name = Column(String(100), nullable=False, index=True)
+        resolution = Column(String(10), nullable=False)
+        bucket_start = Column(DateTime, nullable=False, index=True)
+        count = Column(Integer, nullable=False, default=0)
+        min_value = Column(Float, nullable=False)
+        max_value = Column(Float, nullable=False)
+        sum_value = Column(Float, nullable=False, default=0.0)
+        sketch = Column(JSON, default=dict)
+
 except ImportError:
     SQLALCHEMY_AVAILABLE = False
     Base = None
@@ -81,3 +100,4 @@ except ImportError:
     Template = None  # type: ignore[assignment,misc]
     WorkflowEvent = None  # type: ignore[assignment,misc]
     Analytics = None  # type: ignore[assignment,misc]
+    AnalyticsRollup = None  # type: ignore[assignment,misc]
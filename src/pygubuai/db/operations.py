@@ -1,9 +1,10 @@
 """Database CRUD operations"""
 
-from typing import List, Optional, Dict
+from typing import Any, Iterable, List, Optional, Dict
 from datetime import datetime, timezone
 
 try:
+    from sqlalchemy import insert
     from sqlalchemy.orm import Session
     from .models import Project, Template, WorkflowEvent, Analytics, SQLALCHEMY_AVAILABLE
 except ImportError:
@@ -90,6 +91,73 @@ def add_workflow_event(session: Session, project_name: str, action: str, descrip
     return True
 
 
+def _project_ids(session: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Resolve project names to ids with a single query"""
+    wanted = {name for name in names if name}
+    if not wanted:
+        return {}
+    rows = session.query(Project.name, Project.id).filter(Project.name.in_(wanted)).all()
+    return {name: project_id for name, project_id in rows}
+
+
+def ensure_projects(session: Session, projects: Dict[str, str]) -> Dict[str, int]:
+    """Resolve project ids, inserting rows for projects not in the database yet.
+
+    Args:
+        session: Database session
+        projects: Project name to path
+
+    Returns:
+        Project name to id for every project that exists afterwards
+    """
+    if not SQLALCHEMY_AVAILABLE:
+        return {}
+
+    ids = _project_ids(session, projects)
+    missing = [
+        {"name": name, "path": path, "description": ""}
+        for name, path in projects.items()
+        if name not in ids and path
+    ]
+    if missing:
+        session.execute(insert(Project), missing)
+        ids.update(_project_ids(session, (row["name"] for row in missing)))
+    return ids
+
+
+def add_workflow_events_bulk(session: Session, events: Iterable[Dict[str, Any]]) -> int:
+    """Add many workflow events in one statement and one commit.
+
+    Args:
+        session: Database session
+        events: Dicts with "project_name", "action" and optional
+            "description" and "timestamp" (datetime)
+
+    Returns:
+        Number of events inserted; events for unknown projects are skipped
+    """
+    if not SQLALCHEMY_AVAILABLE:
+        return 0
+
+    events = list(events)
+    project_ids = _project_ids(session, (event.get("project_name") for event in events))
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "project_id": project_ids[event["project_name"]],
+            "action": event["action"],
+            "description": event.get("description") or "",
+            "timestamp": event.get("timestamp") or now,
+        }
+        for event in events
+        if event.get("project_name") in project_ids
+    ]
+    if rows:
+        session.execute(insert(WorkflowEvent), rows)
+        session.commit()
+    return len(rows)
+
+
 def get_workflow_events(
     session: Session, project_name: str, limit: int = 100
 ) -> List[WorkflowEvent]:  # type: ignore[type-arg]
@@ -123,15 +191,26 @@ def create_template(session: Session, name: str, content: str, **kwargs) -> Opti
     return template
 
 
-def search_templates(session: Session, query: str) -> List[Template]:  # type: ignore[type-arg]
-    """Search templates"""
+def search_templates(session: Session, query: str, limit: int = 20) -> List[Template]:  # type: ignore[type-arg]
+    """Search templates by relevance, boosted by downloads and rating.
+
+    Uses the FTS5 index when present and falls back to a substring scan.
+    """
     if not SQLALCHEMY_AVAILABLE:
         return []
 
+    from .search import has_search_index, ranked_template_ids
+
+    if has_search_index(session):
+        ranked = ranked_template_ids(session, query, limit)
+        rows = {t.id: t for t in session.query(Template).filter(Template.id.in_([i for i, _ in ranked]))}
+        return [rows[template_id] for template_id, _ in ranked if template_id in rows]
+
     result: List[Template] = (
         session.query(Template)
         .filter((Template.name.contains(query)) | (Template.description.contains(query)))
         .order_by(Template.downloads.desc())
+        .limit(limit)
         .all()
     )  # type: ignore[type-arg]
     return result
@@ -155,8 +234,41 @@ def record_analytics(
             project_id = project.id
 
     analytics = Analytics(
-        project_id=project_id, metric_name=metric_name, metric_value=metric_value, metadata=metadata or {}
+        project_id=project_id, metric_name=metric_name, metric_value=metric_value, meta_data=metadata or {}
     )
     session.add(analytics)
     session.commit()
     return True
+
+
+def record_analytics_bulk(session: Session, samples: Iterable[Dict[str, Any]]) -> int:
+    """Record many analytics metrics in one statement and one commit.
+
+    Args:
+        session: Database session
+        samples: Dicts with "metric_name", "metric_value" and optional
+            "project_name", "metadata" and "recorded_at" (datetime)
+
+    Returns:
+        Number of samples inserted
+    """
+    if not SQLALCHEMY_AVAILABLE:
+        return 0
+
+    samples = list(samples)
+    project_ids = _project_ids(session, (sample.get("project_name") for sample in samples))
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "project_id": project_ids.get(sample.get("project_name")),
+            "metric_name": sample["metric_name"],
+            "metric_value": float(sample["metric_value"]),
+            "recorded_at": sample.get("recorded_at") or now,
+            "meta_data": sample.get("metadata") or {},
+        }
+        for sample in samples
+    ]
+    if rows:
+        session.execute(insert(Analytics), rows)
+        session.commit()
+    return len(rows)
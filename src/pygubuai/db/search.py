@@ -0,0 +1,154 @@
+"""Full-text template search backed by an FTS5 index"""
+
+import json
+import logging
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "templates_fts"
+
+# bm25() column weights for name, description, author, tags
+BM25_WEIGHTS = (10.0, 3.0, 1.0, 5.0)
+# Popularity boosts added to the relevance (negated bm25, higher is better)
+DOWNLOAD_WEIGHT = 0.25
+RATING_WEIGHT = 0.3
+# Text matches fetched per requested result before re-ranking by popularity
+CANDIDATE_FACTOR = 5
+
+_TAGS_SQL = "coalesce(json_extract({row}.meta_data, '$.tags'), '')"
+
+_SCHEMA = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        name, description, author, tags,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS templates_fts_insert AFTER INSERT ON templates BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, description, author, tags)
+        VALUES (new.id, new.name, new.description, new.author, {_TAGS_SQL.format(row="new")});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS templates_fts_delete AFTER DELETE ON templates BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS templates_fts_update
+    AFTER UPDATE OF name, description, author, meta_data ON templates BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+        INSERT INTO {FTS_TABLE}(rowid, name, description, author, tags)
+        VALUES (new.id, new.name, new.description, new.author, {_TAGS_SQL.format(row="new")});
+    END""",
+]
+
+_REBUILD = f"""INSERT INTO {FTS_TABLE}(rowid, name, description, author, tags)
+    SELECT id, name, description, author, {_TAGS_SQL.format(row="templates")} FROM templates"""
+
+
+def create_search_index(engine) -> bool:
+    """Create the FTS5 table and sync triggers, indexing existing rows once.
+
+    Returns:
+        False if this SQLite build has no FTS5 support
+    """
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+            ).first()
+            for statement in _SCHEMA:
+                conn.execute(text(statement))
+            if not exists:
+                conn.execute(text(_REBUILD))
+        return True
+    except OperationalError as e:
+        logger.warning(f"Full-text template search unavailable: {e}")
+        return False
+
+
+def has_search_index(session) -> bool:
+    """True if the FTS5 table exists in this database"""
+    from sqlalchemy import text
+
+    row = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+    ).first()
+    return row is not None
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """FTS5 MATCH expression requiring every word of the query as a prefix"""
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def popularity_boost(downloads: Optional[int], rating: Optional[float]) -> float:
+    """Score bonus for widely used, well-rated templates"""
+    return DOWNLOAD_WEIGHT * math.log1p(max(downloads or 0, 0)) + RATING_WEIGHT * (rating or 0.0)
+
+
+def ranked_template_ids(session, query: str, limit: int = 20) -> List[Tuple[int, float]]:
+    """Template ids matching query, best first, with their blended scores.
+
+    Candidates are selected by BM25 relevance in SQLite, then re-ranked with
+    downloads and rating so popular templates win among similar matches.
+    """
+    from sqlalchemy import text
+
+    match = build_match_query(query)
+    if match is None:
+        return []
+
+    weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+    rows = session.execute(
+        text(
+            f"SELECT t.id, bm25({FTS_TABLE}, {weights}) AS relevance, t.downloads, t.rating "
+            f"FROM {FTS_TABLE} JOIN templates t ON t.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH :match ORDER BY relevance LIMIT :candidates"
+        ),
+        {"match": match, "candidates": max(limit * CANDIDATE_FACTOR, limit)},
+    ).all()
+
+    scored = [(row.id, -row.relevance + popularity_boost(row.downloads, row.rating)) for row in rows]
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:limit]
+
+
+def sync_registry_templates(session, templates: Dict[str, Dict[str, Any]], sources: Dict[str, str]) -> int:
+    """Mirror TemplateRegistry templates into the templates table for search.
+
+    Args:
+        session: Database session
+        templates: Template name to template dict
+        sources: Template name to "built-in" or "user"
+
+    Returns:
+        Number of rows inserted or updated
+    """
+    from .models import Template
+
+    existing = {t.name: t for t in session.query(Template).filter(Template.name.in_(list(templates)))}
+    changed = 0
+    for name, template in templates.items():
+        content = json.dumps(template, sort_keys=True)
+        tags = template.get("tags") or sorted({w.get("type", "") for w in template.get("widgets", [])} - {""})
+        meta = {"source": sources.get(name, "user"), "tags": tags}
+        row = existing.get(name)
+        if row is None:
+            session.add(
+                Template(name=name, description=template.get("description", ""), content=content, meta_data=meta)
+            )
+            changed += 1
+        elif (row.meta_data or {}).get("source") in ("built-in", "user") and row.content != content:
+            row.description = template.get("description", "")
+            row.content = content
+            row.meta_data = meta
+            changed += 1
+    if changed:
+        session.commit()
+    return changed
@@ -92,6 +92,14 @@ class GitError(PygubuAIError):
         super().__init__(f"Git {operation} failed: {reason}", suggestion)
 
 
+class DatabaseError(PygubuAIError):
+    """Database operation failed"""
+
+    def __init__(self, operation: str, reason: str, cause: Optional[Exception] = None):
+        suggestion = "Check the database file or restore it from a backup with 'pygubu-db restore'"
+        super().__init__(f"Database {operation} failed: {reason}", suggestion, cause)
+
+
 def validate_pygubu():
     """Check pygubu is installed and compatible"""
     try:
@@ -0,0 +1,266 @@
+"""Background writer that keeps workflow persistence off the watch loop"""
+
+import atexit
+import copy
+import logging
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+class EventWriter:
+    """Daemon thread that batches workflow events into the database.
+
+    Producers call submit_event() and save_workflow(), which never wait on
+    disk or database I/O. Events go through a bounded queue; when it is full
+    the backpressure policy decides what happens:
+
+    - drop_oldest: evict the oldest queued event (default)
+    - drop_newest: discard the new event
+    - block: wait up to block_timeout for room, then discard the new event
+
+    Workflow JSON snapshots are coalesced per project, so only the latest
+    state of each project is written.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 1000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        policy: str = "drop_oldest",
+        block_timeout: float = 1.0,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}'. Use one of: {', '.join(POLICIES)}")
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.written = 0
+
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_paths: Dict[str, Path] = {}
+        self._snapshot_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="pygubuai-event-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._stop.is_set()
+
+    def submit_event(
+        self, project_name: str, project_path: Any, action: str, description: str = "", timestamp: Any = None
+    ) -> bool:
+        """Queue a workflow event for the database.
+
+        Args:
+            project_name: Project the event belongs to
+            project_path: Project directory, used if the project is not in the database yet
+            action: Event action
+            description: Event description
+            timestamp: datetime or ISO string (default: time of writing)
+
+        Returns:
+            False if the event was discarded by the backpressure policy
+        """
+        if self.closed:
+            return False
+        if isinstance(timestamp, str):
+            try:
+                timestamp = datetime.fromisoformat(timestamp)
+            except ValueError:
+                timestamp = None
+        return self._put(
+            {
+                "project_name": project_name,
+                "project_path": str(project_path),
+                "action": action,
+                "description": description,
+                "timestamp": timestamp,
+            }
+        )
+
+    def save_workflow(self, project_path: Any, data: Dict[str, Any]) -> None:
+        """Schedule a workflow JSON save, replacing any pending one for the project"""
+        path = Path(project_path)
+        snapshot = copy.deepcopy(data)
+        with self._snapshot_lock:
+            self._snapshots[str(path)] = snapshot
+            self._snapshot_paths[str(path)] = path
+        if self.closed:
+            self._write([])
+
+    def _put(self, item: Dict[str, Any]) -> bool:
+        """Enqueue applying the backpressure policy"""
+        if self.policy == "block":
+            try:
+                self._queue.put(item, timeout=self.block_timeout)
+                return True
+            except queue.Full:
+                self._record_drop()
+                return False
+
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                if self.policy == "drop_newest":
+                    self._record_drop()
+                    return False
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self._record_drop()
+            except queue.Empty:
+                pass
+
+    def _record_drop(self) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 100 == 0:
+            logger.warning(f"Event queue full ({self.policy}), {self.dropped} events dropped so far")
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Dict[str, Any]] = []
+            taken = 0
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+                taken += 1
+                if item is not None:
+                    batch.append(item)
+                while len(batch) < self.batch_size:
+                    item = self._queue.get_nowait()
+                    taken += 1
+                    if item is not None:
+                        batch.append(item)
+            except queue.Empty:
+                pass
+
+            try:
+                if batch or self._snapshots:
+                    self._write(batch)
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+            if self._stop.is_set() and self._queue.empty():
+                self._write([])
+                return
+
+    def _write(self, events: List[Dict[str, Any]]) -> None:
+        """Write pending workflow snapshots and a batch of events"""
+        with self._write_lock:
+            with self._snapshot_lock:
+                snapshots = [(self._snapshot_paths[key], data) for key, data in self._snapshots.items()]
+                self._snapshots.clear()
+                self._snapshot_paths.clear()
+
+            if snapshots:
+                from .workflow import save_workflow
+
+                for path, data in snapshots:
+                    try:
+                        save_workflow(path, data)
+                    except Exception as e:
+                        logger.error(f"Failed to save workflow for {path}: {e}")
+
+            if events:
+                self._write_events(events)
+
+    def _write_events(self, events: List[Dict[str, Any]]) -> None:
+        from .db import session_scope, SQLALCHEMY_AVAILABLE
+
+        if not SQLALCHEMY_AVAILABLE:
+            return
+
+        from .db.operations import add_workflow_events_bulk, ensure_projects
+
+        try:
+            with session_scope() as session:
+                if session is None:
+                    return
+                ensure_projects(session, {event["project_name"]: event["project_path"] for event in events})
+                self.written += add_workflow_events_bulk(session, events)
+        except Exception as e:
+            logger.warning(f"Failed to record {len(events)} workflow events: {e}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything submitted so far is written.
+
+        Returns:
+            False if the timeout expired first
+        """
+        # Queue.join() with a timeout, without leaving a waiting thread behind
+        with self._queue.all_tasks_done:
+            finished = self._queue.all_tasks_done.wait_for(lambda: not self._queue.unfinished_tasks, timeout)
+        if finished:
+            # Workflow snapshots scheduled after the last batch was taken
+            self._write([])
+        return finished
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Stop the thread after writing everything queued"""
+        if self.closed:
+            return
+        self._stop.set()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"Event writer did not finish within {timeout}s")
+
+
+_writer: Optional[EventWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_event_writer() -> Optional[EventWriter]:
+    """Process-wide writer, or None unless record_events_to_db is enabled.
+
+    Recording is opt-in, so processes that never watch a project do not
+    start the thread. The writer is closed, and its queue flushed, at interpreter exit.
+    """
+    global _writer
+    from .config import Config
+
+    with _writer_lock:
+        if _writer is not None and not _writer.closed:
+            return _writer
+
+        config = Config()
+        if not config.get("record_events_to_db", False):
+            return None
+        try:
+            _writer = EventWriter(
+                max_queue=int(config.get("event_queue_size", 1000)),
+                policy=config.get("event_queue_policy", "drop_oldest"),
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid event writer config, using defaults: {e}")
+            _writer = EventWriter()
+        atexit.register(_writer.close)
+        return _writer
+
+
+def shutdown_event_writer(timeout: Optional[float] = 10.0) -> None:
+    """Flush and stop the process-wide writer"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close(timeout)
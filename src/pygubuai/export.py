@@ -1,36 +1,117 @@
 #!/usr/bin/env python3
 """Export project to standalone Python file"""
-from pathlib import Path
-from typing import Optional
+import ast
+import base64
+import hashlib
+import io
+import json
+import logging
+import os
+import textwrap
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Set, Tuple
+
+from defusedxml import ElementTree as ET
+
 from .registry import Registry
 from .utils import validate_path
 
+logger = logging.getLogger(__name__)
+
+# Image formats pygubu can load; property values ending in these are bundled
+ASSET_SUFFIXES = {".png", ".gif", ".ppm", ".pgm", ".xbm", ".ico", ".jpg", ".jpeg"}
+# Project subdirectories searched for referenced images, besides the project itself
+ASSET_DIRS = ("images", "assets", "img")
+# Fixed timestamp for zipapp entries, so identical inputs give identical archives
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+UI_CHUNK = 76
+# Written to the --out directory of a fleet export to skip unchanged projects
+EXPORT_MANIFEST = "export-manifest.json"
+# Part of every fleet fingerprint; bump when code extraction changes its output
+EXTRACTOR_VERSION = 2
+
+# Statements of the generated __init__; copies found in the source are dropped
+_INIT_BOILERPLATE = (
+    "pygubu.Builder",
+    "add_resource_path",
+    "add_from_file",
+    "add_from_string",
+    "connect_callbacks",
+)
+_TEMPLATE_IMPORTS = {
+    "import base64",
+    "import functools",
+    "import pathlib",
+    "import tempfile",
+    "import zipfile",
+    "import zlib",
+    "import tkinter as tk",
+    "import pygubu",
+}
+_TEMPLATE_NAMES = {"PROJECT_PATH", "main"}
+
 STANDALONE_TEMPLATE = '''#!/usr/bin/env python3
 """
 {project_name} - Standalone Application
 Generated by PygubuAI Export Tool
 """
+import base64
+import functools
+import pathlib
+import tempfile
 import tkinter as tk
-import pygubu
-
-# Embedded UI Definition
-UI_DEFINITION = """
-{ui_content}
-"""
+import zipfile
+import zlib
 
+import pygubu
+{imports}
+PROJECT_PATH = pathlib.Path(__file__).resolve().parent
+
+# Embedded UI definition (zlib-compressed, base64-encoded)
+UI_DATA = (
+{ui_data}
+)
+ASSETS_DIGEST = "{assets_digest}"
+
+
+@functools.lru_cache(maxsize=None)
+def ui_definition():
+    """UI XML, decompressed on first use"""
+    return zlib.decompress(base64.b64decode(UI_DATA)).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def resource_dir():
+    """Directory holding the images the UI refers to.
+
+    When running from a zipapp, bundled assets are extracted once to a
+    temporary directory keyed by their digest.
+    """
+    if not PROJECT_PATH.is_file():
+        return PROJECT_PATH
+    target = pathlib.Path(tempfile.gettempdir()) / f"{project_name}-{{ASSETS_DIGEST}}"
+    if not target.is_dir():
+        with zipfile.ZipFile(PROJECT_PATH) as archive:
+            members = [name for name in archive.namelist() if name.startswith("assets/")]
+            archive.extractall(target, members)
+    return target / "assets"
+{helpers}
 
 class {class_name}:
     def __init__(self, master=None):
         self.builder = pygubu.Builder()
-        self.builder.add_from_string(UI_DEFINITION)
+        self.builder.add_resource_path(str(resource_dir()))
+        self.builder.add_from_string(ui_definition())
         self.mainwindow = self.builder.get_object('mainwindow', master)
-
+{init}
         # Connect callbacks
         self.builder.connect_callbacks(self)
-
-    def run(self):
-        self.mainwindow.mainloop()
-{callbacks}
+{methods}
 
 
 def main():
@@ -43,45 +124,223 @@ if __name__ == '__main__':
     main()
 '''
 
+DEFAULT_METHODS = {
+    "run": "    def run(self):\n        self.mainwindow.mainloop()",
+}
+
+
+@dataclass
+class ExtractedCode:
+    """Code of a project's Python file that the standalone export keeps"""
+
+    imports: List[str] = field(default_factory=list)
+    helpers: List[str] = field(default_factory=list)
+    init: List[str] = field(default_factory=list)
+    methods: Dict[str, str] = field(default_factory=dict)
+
+
+def _segment(lines: List[str], node: ast.AST) -> str:
+    """Source of node including its decorators, dedented"""
+    decorators = getattr(node, "decorator_list", [])
+    start = min([node.lineno] + [d.lineno for d in decorators])
+    return textwrap.dedent("".join(lines[start - 1 : node.end_lineno])).rstrip()
+
+
+def _is_boilerplate(statement: ast.stmt) -> bool:
+    if isinstance(statement, ast.Assign) and any(ast.unparse(t) == "self.mainwindow" for t in statement.targets):
+        return True
+    return any(marker in ast.unparse(statement) for marker in _INIT_BOILERPLATE)
+
+
+class _BuilderAliases(ast.NodeTransformer):
+    """Rewrite local aliases of the builder ("builder" in designer code) as self.builder"""
+
+    def __init__(self, aliases: Set[str]):
+        self.aliases = aliases
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id not in self.aliases:
+            return node
+        builder = ast.Attribute(value=ast.Name(id="self", ctx=ast.Load()), attr="builder", ctx=node.ctx)
+        return ast.copy_location(builder, node)
+
+
+def _builder_aliases(body: List[ast.stmt]) -> Set[str]:
+    """Local names bound together with self.builder, as in self.builder = builder = ..."""
+    for statement in body:
+        if isinstance(statement, ast.Assign) and any(ast.unparse(t) == "self.builder" for t in statement.targets):
+            return {t.id for t in statement.targets if isinstance(t, ast.Name)}
+    return set()
+
+
+def _init_statement(lines: List[str], statement: ast.stmt, aliases: Set[str]) -> str:
+    """Source of a kept __init__ statement, with builder aliases resolved"""
+    if not any(isinstance(n, ast.Name) and n.id in aliases for n in ast.walk(statement)):
+        return _segment(lines, statement)
+    return ast.unparse(_BuilderAliases(aliases).visit(statement))
+
+
+def _assigned_names(node: ast.stmt) -> List[str]:
+    targets = node.targets if isinstance(node, ast.Assign) else [getattr(node, "target", None)]
+    return [t.id for t in targets if isinstance(t, ast.Name)]
+
+
+def _app_class(tree: ast.Module) -> Optional[ast.ClassDef]:
+    """The class that connects the builder's callbacks, else the first class"""
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    for cls in classes:
+        if "connect_callbacks" in ast.unparse(cls):
+            return cls
+    return classes[0] if classes else None
+
+
+def extract_code(source: str, filename: str = "<project>") -> ExtractedCode:
+    """Split a project's Python file into the parts a standalone export needs.
+
+    Methods of the app class (callbacks and helpers alike) are kept
+    verbatim, as are module-level imports, functions, classes and
+    constants. Builder setup in __init__ is dropped, since the export
+    loads the UI itself; any other __init__ statements are kept, with
+    local aliases of the builder rewritten as self.builder.
+
+    Raises:
+        ValueError: If the source cannot be parsed
+    """
+    try:
+        tree = ast.parse(source, filename)
+    except SyntaxError as e:
+        raise ValueError(f"Cannot parse {filename}: {e}")
+    lines = source.splitlines(keepends=True)
+    app = _app_class(tree)
+    extracted = ExtractedCode()
+
+    for node in tree.body:
+        if node is app:
+            continue
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statement = ast.unparse(node)
+            if statement not in _TEMPLATE_IMPORTS and not statement.startswith("from __future__"):
+                extracted.imports.append(statement)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node.name not in _TEMPLATE_NAMES:
+                extracted.helpers.append(_segment(lines, node))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            if not set(_assigned_names(node)) & _TEMPLATE_NAMES:
+                extracted.helpers.append(_segment(lines, node))
+
+    for node in app.body if app else []:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if node.name == "__init__":
+            aliases = _builder_aliases(node.body)
+            body = [s for s in node.body if not _is_boilerplate(s)]
+            if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+                body = body[1:]
+            extracted.init.extend(_init_statement(lines, statement, aliases) for statement in body)
+        else:
+            extracted.methods[node.name] = textwrap.indent(_segment(lines, node), "    ")
+    return extracted
+
 
 def extract_callbacks(py_file: Path) -> str:
     """Extract callback methods from Python file"""
     if not py_file.exists():
         return ""
+    methods = extract_code(py_file.read_text(encoding="utf-8"), str(py_file)).methods
+    return "\n\n".join(methods.values()) if methods else "    # Add your callbacks here\n    pass"
+
+
+def compress_ui(ui_content: str) -> str:
+    """UI XML as zlib-compressed base64, one quoted line per chunk"""
+    encoded = base64.b64encode(zlib.compress(ui_content.encode("utf-8"), 9)).decode("ascii")
+    return "\n".join(f'    "{encoded[i : i + UI_CHUNK]}"' for i in range(0, len(encoded), UI_CHUNK)) or '    ""'
+
+
+def find_ui_assets(ui_file: Path) -> Dict[str, Path]:
+    """Images referenced by a UI file, as {archive name: file}.
+
+    Values are looked up relative to the project and its image
+    directories, the same way pygubu's resource paths resolve them.
+    Missing images are logged and left out.
+    """
+    project_dir = ui_file.parent
+    assets: Dict[str, Path] = {}
+    for prop in ET.parse(ui_file).getroot().iter("property"):
+        value = (prop.text or "").strip()
+        relative = PurePosixPath(value.replace("\\", "/"))
+        if relative.suffix.lower() not in ASSET_SUFFIXES or relative.is_absolute() or ".." in relative.parts:
+            continue
+        arcname = f"assets/{relative}"
+        if arcname in assets:
+            continue
+        for base in (project_dir, *(project_dir / d for d in ASSET_DIRS)):
+            candidate = base / relative
+            if candidate.is_file():
+                assets[arcname] = candidate
+                break
+        else:
+            logger.warning(f"Image '{value}' referenced by {ui_file.name} not found, not bundled")
+    return assets
+
+
+def _assets_digest(assets: Dict[str, Path]) -> str:
+    digest = hashlib.sha256()
+    for arcname in sorted(assets):
+        digest.update(arcname.encode("utf-8") + b"\0" + assets[arcname].read_bytes() + b"\0")
+    return digest.hexdigest()[:16]
+
+
+def build_standalone(project_dir: Path, project_name: str, assets: Optional[Dict[str, Path]] = None) -> str:
+    """Standalone source for a project, with its UI embedded compressed"""
+    ui_file = project_dir / f"{project_name}.ui"
+    py_file = project_dir / f"{project_name}.py"
+    if not ui_file.exists():
+        raise FileNotFoundError(f"UI file not found: {ui_file}")
+
+    extracted = (
+        extract_code(py_file.read_text(encoding="utf-8"), str(py_file)) if py_file.exists() else ExtractedCode()
+    )
+    methods = {**DEFAULT_METHODS, **extracted.methods}
+    class_name = "".join(word.capitalize() for word in project_name.split("_")) + "App"
 
-    content = py_file.read_text()
-    lines = content.split("\\n")
-
-    callbacks = []
-    in_callback = False
-    current_callback = []
-    indent_level = 0
-
-    for line in lines:
-        # Detect callback method (starts with 'def on_')
-        if line.strip().startswith("def on_"):
-            in_callback = True
-            indent_level = len(line) - len(line.lstrip())
-            current_callback = [line]
-        elif in_callback:
-            # Continue collecting callback lines
-            if line.strip() and not line.startswith(" " * indent_level):
-                # End of callback
-                callbacks.append("\\n".join(current_callback))
-                current_callback = []
-                in_callback = False
-            else:
-                current_callback.append(line)
-
-    # Add last callback if exists
-    if current_callback:
-        callbacks.append("\\n".join(current_callback))
-
-    return "\\n\\n".join(callbacks) if callbacks else "    # Add your callbacks here\\n    pass"
-
-
-def export_standalone(project_name: str, output_file: Optional[str] = None) -> str:
-    """Export project to standalone file"""
+    return STANDALONE_TEMPLATE.format(
+        project_name=project_name,
+        class_name=class_name,
+        imports="".join(f"{statement}\n" for statement in extracted.imports),
+        ui_data=compress_ui(ui_file.read_text(encoding="utf-8")),
+        assets_digest=_assets_digest(assets) if assets else "",
+        helpers="".join(f"\n\n{helper}\n" for helper in extracted.helpers),
+        init="".join(textwrap.indent(statement, " " * 8) + "\n" for statement in extracted.init),
+        methods="\n" + "\n\n".join(methods.values()),
+    )
+
+
+def write_zipapp(output_path: Path, main_code: str, assets: Dict[str, Path]) -> None:
+    """Write a runnable .pyz with main_code as __main__.py plus assets.
+
+    Entries are sorted and carry a fixed timestamp, so the same inputs
+    always produce a byte-identical archive.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        entries = {"__main__.py": main_code.encode("utf-8")}
+        entries.update((arcname, path.read_bytes()) for arcname, path in assets.items())
+        for arcname in sorted(entries):
+            info = zipfile.ZipInfo(arcname, ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, entries[arcname])
+    output_path.write_bytes(b"#!/usr/bin/env python3\n" + buffer.getvalue())
+
+
+def export_standalone(project_name: str, output_file: Optional[str] = None, zipapp: bool = False) -> str:
+    """Export project to standalone file.
+
+    Args:
+        project_name: Registered project
+        output_file: Output path (default: <project>_standalone.py, or <project>.pyz)
+        zipapp: Build a .pyz bundling the images the UI refers to
+    """
     registry = Registry()
     project_path = registry.get_project(project_name)
 
@@ -90,53 +349,207 @@ def export_standalone(project_name: str, output_file: Optional[str] = None) -> s
 
     project_dir = validate_path(project_path, must_exist=True, must_be_dir=True)
     ui_file = project_dir / f"{project_name}.ui"
-    py_file = project_dir / f"{project_name}.py"
-
     if not ui_file.exists():
         raise FileNotFoundError(f"UI file not found: {ui_file}")
 
-    # Read UI content
-    ui_content = ui_file.read_text()
-
-    # Extract callbacks
-    callbacks = extract_callbacks(py_file)
-
-    # Generate class name
-    class_name = "".join(word.capitalize() for word in project_name.split("_")) + "App"
-
-    # Generate standalone code
-    standalone_code = STANDALONE_TEMPLATE.format(
-        project_name=project_name, class_name=class_name, ui_content=ui_content, callbacks=callbacks
-    )
+    assets = find_ui_assets(ui_file) if zipapp else {}
+    standalone_code = build_standalone(project_dir, project_name, assets)
 
     # Determine output file
     if output_file is None:
-        output_path = project_dir / f"{project_name}_standalone.py"
+        default_name = f"{project_name}.pyz" if zipapp else f"{project_name}_standalone.py"
+        output_path = project_dir / default_name
     else:
         output_path = validate_path(output_file)
 
-    # Write output
-    output_path.write_text(standalone_code)
+    write_artifact(output_path, standalone_code, assets, zipapp)
+    return str(output_path)
+
 
+def write_artifact(output_path: Path, code: str, assets: Dict[str, Path], zipapp: bool) -> None:
+    """Write an executable .py or .pyz, replacing output_path atomically"""
+    temp_path = output_path.with_name(f".{output_path.name}.tmp")
+    if zipapp:
+        write_zipapp(temp_path, code, assets)
+    else:
+        temp_path.write_text(code, encoding="utf-8")
     # Make executable
-    output_path.chmod(0o755)
+    temp_path.chmod(0o755)
+    os.replace(temp_path, output_path)
+
+
+@dataclass
+class ExportResult:
+    name: str
+    artifact: str
+    status: str  # "exported", "unchanged" or "failed"
+    fingerprint: str = ""
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def input_fingerprint(
+    project_dir: Path, project_name: str, zipapp: bool, assets: Optional[Dict[str, Path]] = None
+) -> str:
+    """Hash of everything an export depends on.
+
+    Covers the UI and Python files, bundled images and the export
+    template and extractor version, so changing any of them forces a
+    rebuild.
+    """
+    digest = hashlib.sha256(STANDALONE_TEMPLATE.encode("utf-8"))
+    digest.update(f"extractor:{EXTRACTOR_VERSION}".encode("ascii"))
+    digest.update(b"pyz" if zipapp else b"py")
+    for suffix in (".ui", ".py"):
+        path = project_dir / f"{project_name}{suffix}"
+        digest.update(b"\0" + (path.read_bytes() if path.exists() else b""))
+    if zipapp:
+        if assets is None:
+            assets = find_ui_assets(project_dir / f"{project_name}.ui")
+        digest.update(_assets_digest(assets).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _export_fleet_project(item: Tuple[str, str, str, bool, Optional[str]]) -> ExportResult:
+    """Export one project of a fleet unless its fingerprint is unchanged"""
+    name, project_path, artifact, zipapp, previous = item
+    start = time.perf_counter()
+    try:
+        project_dir = Path(project_path)
+        assets = find_ui_assets(project_dir / f"{name}.ui") if zipapp else {}
+        fingerprint = input_fingerprint(project_dir, name, zipapp, assets)
+        output_path = Path(artifact)
+        if fingerprint == previous and output_path.exists():
+            return ExportResult(name, artifact, "unchanged", fingerprint, time.perf_counter() - start)
+        write_artifact(output_path, build_standalone(project_dir, name, assets), assets, zipapp)
+        return ExportResult(name, artifact, "exported", fingerprint, time.perf_counter() - start)
+    except Exception as e:
+        return ExportResult(name, artifact, "failed", seconds=time.perf_counter() - start, error=str(e))
 
-    return str(output_path)
+
+def _load_export_manifest(path: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return dict(data.get("projects", {}))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning(f"Ignoring unreadable export manifest {path}: {e}")
+        return {}
+
+
+def export_all(
+    out_dir: str,
+    projects: Optional[Dict[str, str]] = None,
+    jobs: Optional[int] = None,
+    zipapp: bool = False,
+    force: bool = False,
+) -> List[ExportResult]:
+    """Export many projects into out_dir in a process pool.
+
+    Artifacts are <project>.py or <project>.pyz. A manifest in out_dir
+    records each project's input fingerprint; projects whose fingerprint
+    is unchanged and whose artifact still exists are skipped.
+
+    Args:
+        out_dir: Directory for artifacts and the manifest
+        projects: Project name to path (default: all registered projects)
+        jobs: Worker processes (default: CPU count; 1 runs in-process)
+        zipapp: Build .pyz archives bundling images instead of .py files
+        force: Rebuild even unchanged projects
+
+    Returns:
+        One result per project, sorted by name
+    """
+    if projects is None:
+        projects = Registry().list_projects()
+
+    out_path = validate_path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_path / EXPORT_MANIFEST
+    manifest = {} if force else _load_export_manifest(manifest_path)
+    suffix = ".pyz" if zipapp else ".py"
+    items = [
+        (name, path, str(out_path / f"{name}{suffix}"), zipapp, manifest.get(name, {}).get("fingerprint"))
+        for name, path in sorted(projects.items())
+    ]
+    if not items:
+        return []
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(items) == 1:
+        results = list(map(_export_fleet_project, items))
+    else:
+        chunksize = max(1, len(items) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_export_fleet_project, items, chunksize=chunksize))
+
+    for result in results:
+        if result.status == "failed":
+            manifest.pop(result.name, None)
+        else:
+            manifest[result.name] = {"fingerprint": result.fingerprint, "artifact": Path(result.artifact).name}
+    # Replaced atomically, so an interrupted run leaves the previous manifest
+    temp_path = manifest_path.with_name(f".{manifest_path.name}.tmp")
+    temp_path.write_text(json.dumps({"version": 1, "projects": manifest}, indent=2, sort_keys=True) + "\n")
+    os.replace(temp_path, manifest_path)
+    return results
+
+
+def _export_all_main(argv: List[str]) -> None:
+    """Handle pygubu-export --all"""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(prog="pygubu-export --all", description="Export every registered project.")
+    parser.add_argument("--out", "-o", required=True, help="Output directory for the artifacts")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--zipapp", action="store_true", help="Build .pyz archives bundling images")
+    parser.add_argument("--force", action="store_true", help="Rebuild projects whose inputs are unchanged")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        results = export_all(args.out, jobs=args.jobs, zipapp=args.zipapp, force=args.force)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        detail = f" - {result.error}" if result.error else ""
+        print(f"  {result.status.upper():10} {result.name:30} {result.seconds * 1000:8.1f} ms{detail}")
+
+    counts = {status: sum(1 for r in results if r.status == status) for status in ("exported", "unchanged", "failed")}
+    print(
+        f"\nExported {counts['exported']}, unchanged {counts['unchanged']}, "
+        f"failed {counts['failed']} of {len(results)} projects in {elapsed:.2f}s"
+    )
+    if counts["failed"]:
+        sys.exit(1)
 
 
 def main():
     """CLI entry point"""
     import sys
 
+    if "--all" in sys.argv[1:]:
+        _export_all_main([arg for arg in sys.argv[1:] if arg != "--all"])
+        return
+
     if len(sys.argv) < 2:
-        print("Usage: pygubu-export <project> [--output file.py]")
-        print("\\nExport project to standalone Python file with embedded UI.")
-        print("\\nOptions:")
+        print("Usage: pygubu-export <project> [--output file.py] [--zipapp]")
+        print("       pygubu-export --all --out <dir> [--jobs N] [--zipapp] [--force]")
+        print("\nExport project to standalone Python file with embedded UI.")
+        print("\nOptions:")
         print("  --output <file>    Output file path (default: <project>_standalone.py)")
+        print("  --zipapp           Build a <project>.pyz bundling the images the UI uses")
+        print("  --all              Export every registered project into --out, skipping unchanged ones")
         sys.exit(1)
 
     project_name = sys.argv[1]
     output_file = None
+    zipapp = "--zipapp" in sys.argv
 
     if "--output" in sys.argv:
         idx = sys.argv.index("--output")
@@ -144,10 +557,10 @@ def main():
             output_file = sys.argv[idx + 1]
 
     try:
-        output_path = export_standalone(project_name, output_file)
+        output_path = export_standalone(project_name, output_file, zipapp=zipapp)
         print(f"OK Exported '{project_name}' to standalone file:")
         print(f"  {output_path}")
-        print(f"\\n  Run with: python {output_path}")
+        print(f"\n  Run with: python {output_path}")
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -1,35 +1,193 @@
 """Centralized code generation functions for PygubuAI."""
 
-from typing import List, Tuple, Dict, Any, Optional
+import io
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .utils import safe_xml_text
+
+
+# Characters not allowed anywhere in an XML 1.0 document
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_ATTR_WHITESPACE = {"\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+
+class UIWriter:
+    """Streaming writer for pygubu .ui XML.
+
+    Elements are written to the output as soon as they are started, so
+    documents of any size are produced without building them in memory.
+    Text and attribute values are escaped, and characters XML cannot
+    represent are dropped. Objects started inside another object are
+    wrapped in <child> automatically.
+
+    Example:
+        with UIWriter(f) as ui:
+            ui.start_interface()
+            with ui.object("tk.Toplevel", "mainwindow"):
+                ui.property("title", "Demo")
+                with ui.object("ttk.Button", "ok"):
+                    ui.property("text", "OK")
+                    ui.layout("pack", {"pady": 5})
+    """
+
+    def __init__(self, out: TextIO, indent: str = "  ", level: int = 0):
+        """
+        Args:
+            out: Text stream to write to
+            indent: String repeated once per nesting level
+            level: Nesting level of the first element, for writing fragments
+        """
+        self.out = out
+        self.indent = indent
+        self.level = level
+        self._open: List[str] = []
+
+    def __enter__(self) -> "UIWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def text(value: Any) -> str:
+        """Escape a value for element text"""
+        return _INVALID_XML_CHARS.sub("", safe_xml_text(value))
+
+    @classmethod
+    def attr(cls, value: Any) -> str:
+        """Escape a value for a double-quoted attribute, keeping whitespace intact"""
+        escaped = cls.text(value)
+        for char, ref in _ATTR_WHITESPACE.items():
+            escaped = escaped.replace(char, ref)
+        return escaped
+
+    def _line(self, markup: str) -> None:
+        self.out.write(f"{self.indent * (self.level + len(self._open))}{markup}\n")
+
+    def _start(self, tag: str, markup: str) -> None:
+        self._line(markup)
+        self._open.append(tag)
+
+    def _end(self, tag: str) -> None:
+        if not self._open or self._open[-1] != tag:
+            raise ValueError(f"Cannot close <{tag}>, open elements: {self._open}")
+        self._open.pop()
+        self._line(f"</{tag}>")
+
+    def start_interface(self, version: str = "1.2") -> None:
+        """Write the XML declaration and open <interface>"""
+        self.out.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        self._start("interface", f'<interface version="{self.attr(version)}">')
+
+    def start_object(self, cls: str, object_id: str, child: Optional[bool] = None) -> None:
+        """Open an object.
+
+        Args:
+            cls: Widget class, e.g. "ttk.Button"
+            object_id: Widget id
+            child: Wrap in <child> (default: when inside another object)
+        """
+        if child is None:
+            child = bool(self._open) and self._open[-1] == "object"
+        if child:
+            self._start("child", "<child>")
+        self._start("object", f'<object class="{self.attr(cls)}" id="{self.attr(object_id)}">')
+
+    def end_object(self) -> None:
+        """Close the current object and its <child> wrapper"""
+        self._end("object")
+        if self._open and self._open[-1] == "child":
+            self._end("child")
+
+    @contextmanager
+    def object(self, cls: str, object_id: str, child: Optional[bool] = None) -> Iterator["UIWriter"]:
+        self.start_object(cls, object_id, child)
+        yield self
+        self.end_object()
+
+    def property(self, name: str, value: Any) -> None:
+        self._line(f'<property name="{self.attr(name)}">{self.text(value)}</property>')
+
+    def properties(self, values: Dict[str, Any]) -> None:
+        for name, value in values.items():
+            self.property(name, value)
+
+    def layout(self, manager: str, properties: Optional[Dict[str, Any]] = None) -> None:
+        """Write the layout of the current object"""
+        self._start("layout", f'<layout manager="{self.attr(manager)}">')
+        self.properties(properties or {})
+        self._end("layout")
+
+    def close(self) -> None:
+        """Close every open element"""
+        while self._open:
+            tag = self._open[-1]
+            if tag == "object":
+                self.end_object()
+            else:
+                self._end(tag)
+
+
+def write_base_ui(
+    out: TextIO, project_name: str, widgets_data: Iterable[Tuple[str, Dict[str, Any]]], indent: str = "  "
+) -> None:
+    """Stream the base UI (main window, frame and widgets) to out.
+
+    widgets_data may be a generator, so large scaffolds are never held in memory.
+    """
+    from .widgets import write_widget_xml
+
+    with UIWriter(out, indent) as ui:
+        ui.start_interface()
+        ui.start_object("tk.Toplevel", "mainwindow")
+        ui.properties({"title": project_name.replace("_", " ").title(), "height": "400", "width": "600"})
+        ui.start_object("ttk.Frame", "mainframe")
+        ui.property("padding", "20")
+        ui.layout("pack", {"expand": "true", "fill": "both"})
+        for i, (widget_type, config) in enumerate(widgets_data, 1):
+            write_widget_xml(ui, config.get("id", f"{widget_type}{i}"), config)
 
 
 def generate_base_ui_xml_structure(project_name: str, widgets_data: List[Tuple[str, Dict[str, Any]]]) -> str:
     """Generate base UI XML structure with widgets."""
-    from .widgets import generate_widget_xml
-    from .utils import safe_xml_text
-
-    xml_parts = [
-        "<?xml version='1.0' encoding='utf-8'?>",
-        '<interface version="1.2">',
-        '  <object class="tk.Toplevel" id="mainwindow">',
-        f'    <property name="title">{safe_xml_text(project_name.replace("_", " ").title())}</property>',
-        '    <property name="height">400</property>',
-        '    <property name="width">600</property>',
-        "    <child>",
-        '      <object class="ttk.Frame" id="mainframe">',
-        '        <property name="padding">20</property>',
-        '        <layout manager="pack">',
-        '          <property name="expand">true</property>',
-        '          <property name="fill">both</property>',
-        "        </layout>",
-    ]
-
-    for i, (widget_type, config) in enumerate(widgets_data, 1):
-        widget_id = config.get("id", f"{widget_type}{i}")
-        xml_parts.extend(generate_widget_xml(widget_type, widget_id, config, i))
-
-    xml_parts.extend(["      </object>", "    </child>", "  </object>", "</interface>"])
-    return "\n".join(xml_parts)
+    buffer = io.StringIO()
+    write_base_ui(buffer, project_name, widgets_data)
+    return buffer.getvalue()
+
+
+def write_ui_tree(out: TextIO, objects: Iterable[Dict[str, Any]], indent: str = "  ") -> None:
+    """Stream UI XML for a tree of widgets to out.
+
+    Args:
+        out: Text stream to write to
+        objects: Top-level widgets. Each is a dict with "class", "id" and
+            optional "properties", "layout" ({"manager", "properties"}) and
+            "children" (list of the same dicts)
+        indent: Indentation per nesting level
+    """
+    with UIWriter(out, indent) as ui:
+        ui.start_interface()
+        for obj in objects:
+            _write_object(ui, obj)
+
+
+def _write_object(ui: UIWriter, obj: Dict[str, Any]) -> None:
+    with ui.object(obj["class"], obj["id"]):
+        ui.properties(obj.get("properties", {}))
+        layout = obj.get("layout")
+        if layout:
+            ui.layout(layout["manager"], layout.get("properties"))
+        for child in obj.get("children", []):
+            _write_object(ui, child)
+
+
+def generate_ui_tree_xml(objects: List[Dict[str, Any]]) -> str:
+    """Generate UI XML for a tree of widgets (see write_ui_tree)"""
+    buffer = io.StringIO()
+    write_ui_tree(buffer, objects)
+    return buffer.getvalue()
 
 
 def generate_python_app_structure(project_name: str, callbacks: List[str], custom_callbacks_code: str = "") -> str:
@@ -1,15 +1,20 @@
 """Git integration for project management"""
 
+import os
 import subprocess
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 logger = logging.getLogger(__name__)
 
+INITIAL_COMMIT_MESSAGE = "Initial commit: PygubuAI project"
 
+
+@lru_cache(maxsize=1)
 def is_git_available() -> bool:
-    """Check if git is installed"""
+    """Check if git is installed (checked once per process)"""
     try:
         subprocess.run(["git", "--version"], shell=False, capture_output=True, check=True)
         return True
@@ -17,6 +22,17 @@ def is_git_available() -> bool:
         return False
 
 
+def find_repo_root(path: Union[str, Path]) -> Optional[Path]:
+    """Nearest enclosing git work tree, found without running git"""
+    current = Path(path).resolve()
+    if not current.is_dir():
+        current = current.parent
+    for directory in (current, *current.parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
 def init_git_repo(project_path: Path, initial_commit: bool = True) -> bool:
     """Initialize git repository in project directory"""
     if not is_git_available():
@@ -34,7 +50,7 @@ def init_git_repo(project_path: Path, initial_commit: bool = True) -> bool:
         if initial_commit:
             subprocess.run(["git", "add", "."], shell=False, cwd=str(project_path), capture_output=True, check=True)
             subprocess.run(
-                ["git", "commit", "-m", "Initial commit: PygubuAI project"],
+                ["git", "commit", "-m", INITIAL_COMMIT_MESSAGE],
                 shell=False,
                 cwd=str(project_path),
                 capture_output=True,
@@ -108,3 +124,151 @@ def git_commit(project_path: Path, message: str, files: Optional[list] = None) -
         return True
     except subprocess.CalledProcessError:
         return False
+
+
+class GitBatch:
+    """Stage files across any number of repositories and commit each once.
+
+    Paths are grouped by repository in Python, then every repository costs
+    two git processes however many files changed: one
+    ``git update-index --add --remove -z --stdin`` that hashes and stages
+    all of its paths (including deletions), and one ``git commit``.
+
+    Example:
+        batch = GitBatch()
+        for project in projects:
+            batch.add(project / f"{project.name}.ui")
+        batch.commit("Apply clam theme")
+    """
+
+    def __init__(self):
+        self._pending: Dict[Path, Set[str]] = {}
+        self._roots: Dict[Path, Optional[Path]] = {}
+        self.skipped: List[Path] = []
+
+    def __len__(self) -> int:
+        return sum(len(paths) for paths in self._pending.values())
+
+    @property
+    def repositories(self) -> List[Path]:
+        return sorted(self._pending)
+
+    def _root_for(self, directory: Path) -> Optional[Path]:
+        if directory not in self._roots:
+            self._roots[directory] = find_repo_root(directory)
+        return self._roots[directory]
+
+    def add(self, *paths: Union[str, Path]) -> None:
+        """Queue files for staging; files outside any repository are skipped"""
+        for path in paths:
+            path = Path(path).resolve()
+            root = self._root_for(path.parent)
+            if root is None:
+                self.skipped.append(path)
+                continue
+            self._pending.setdefault(root, set()).add(path.relative_to(root).as_posix())
+
+    def stage(self) -> Dict[Path, bool]:
+        """Stage queued files, one git process per repository.
+
+        Returns:
+            Repository root to whether staging succeeded
+        """
+        results = {}
+        for root in self.repositories:
+            paths = sorted(self._pending[root])
+            payload = "".join(f"{p}\0" for p in paths).encode("utf-8")
+            result = _git(root, ["update-index", "--add", "--remove", "-z", "--stdin"], payload)
+            results[root] = result.returncode == 0
+            if not results[root]:
+                logger.error(f"Staging {len(paths)} files in {root} failed: {_output(result)}")
+        return results
+
+    def commit(self, message: str) -> Dict[Path, bool]:
+        """Stage queued files and commit every repository with one message.
+
+        Repositories where nothing changed are reported as False without
+        being treated as errors. The queue is cleared afterwards.
+
+        Returns:
+            Repository root to whether a commit was created
+        """
+        if not self._pending:
+            return {}
+        if not is_git_available():
+            logger.warning("Git not available, skipping commit")
+            return {root: False for root in self.repositories}
+
+        results = {}
+        for root, staged in self.stage().items():
+            if not staged:
+                results[root] = False
+                continue
+            result = _git(root, ["commit", "-q", "-m", message])
+            results[root] = result.returncode == 0
+            if result.returncode != 0 and "nothing to commit" not in _output(result):
+                logger.error(f"Commit in {root} failed: {_output(result)}")
+        self._pending.clear()
+        return results
+
+
+def _git(root: Path, args: List[str], stdin: Optional[bytes] = None) -> subprocess.CompletedProcess:
+    """Run one git command in a repository without raising on failure"""
+    env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+    return subprocess.run(
+        ["git"] + args, shell=False, cwd=str(root), input=stdin, capture_output=True, env=env, check=False
+    )
+
+
+def _output(result: subprocess.CompletedProcess) -> str:
+    return (result.stderr or result.stdout or b"").decode("utf-8", errors="replace").strip()
+
+
+def commit_files(files: Iterable[Union[str, Path]], message: str) -> Dict[Path, bool]:
+    """Commit files from any number of repositories, one commit per repository"""
+    batch = GitBatch()
+    batch.add(*files)
+    return batch.commit(message)
+
+
+def init_git_repos(
+    project_paths: Iterable[Union[str, Path]], initial_commit: bool = True, jobs: Optional[int] = None
+) -> Dict[Path, bool]:
+    """Initialize repositories for many projects.
+
+    Repositories are initialized in parallel threads. For the initial
+    commit, git lists the untracked files that .gitignore does not exclude
+    and they are staged with one update-index call, so each project costs
+    four git processes.
+
+    Returns:
+        Project path to whether its repository was initialized (and committed)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = [Path(p).resolve() for p in project_paths]
+    if not paths:
+        return {}
+    if not is_git_available():
+        logger.warning("Git not available, skipping repository initialization")
+        return {path: False for path in paths}
+
+    def init_one(path: Path) -> bool:
+        result = _git(path, ["init", "-q"])
+        if result.returncode != 0:
+            logger.error(f"Git initialization failed in {path}: {_output(result)}")
+            return False
+        (path / ".gitignore").write_text(generate_gitignore())
+        if not initial_commit:
+            return True
+        # update-index ignores .gitignore, so let git pick the files
+        listed = _git(path, ["ls-files", "--others", "--exclude-standard", "-z"])
+        if listed.returncode != 0:
+            logger.error(f"Listing files in {path} failed: {_output(listed)}")
+            return False
+        batch = GitBatch()
+        batch.add(*(path / name for name in listed.stdout.decode("utf-8").split("\0") if name))
+        return batch.commit(INITIAL_COMMIT_MESSAGE).get(path, False)
+
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as executor:
+        return dict(zip(paths, executor.map(init_one, paths)))
@@ -4,6 +4,7 @@ from defusedxml import ElementTree as ET
 from typing import Optional, Dict, List, Any
 from .registry import Registry
 from .utils import validate_path
+from .uidiff import UIDiff, diff_files, format_diff
 
 try:
     from rich.console import Console
@@ -136,18 +137,39 @@ def list_callbacks(project_name: str) -> List[Dict]:
     return callbacks
 
 
+def diff_ui_files(old_file: str, new_file: str) -> UIDiff:
+    """Diff two UI files by widget id"""
+    old_path = validate_path(old_file, must_exist=True)
+    new_path = validate_path(new_file, must_exist=True)
+    return diff_files(old_path, new_path)
+
+
 def main():
     """CLI entry point"""
     import sys
 
     if len(sys.argv) < 2:
         print("Usage: pygubu-inspect <project> [options]")
+        print("       pygubu-inspect --diff <old.ui> <new.ui>")
         print("\\nOptions:")
         print("  --widget <id>    Inspect specific widget")
         print("  --tree           Show widget hierarchy")
         print("  --callbacks      List all callbacks")
+        print("  --diff A B       Show widget changes between two UI files")
         sys.exit(1)
 
+    if sys.argv[1] == "--diff":
+        if len(sys.argv) < 4:
+            print("Error: --diff requires two UI files")
+            sys.exit(1)
+        try:
+            diff = diff_ui_files(sys.argv[2], sys.argv[3])
+        except (ValueError, ET.ParseError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(format_diff(diff))
+        return
+
     project_name = sys.argv[1]
 
     if len(sys.argv) == 2 or "--tree" in sys.argv:
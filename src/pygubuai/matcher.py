@@ -0,0 +1,131 @@
+"""Multi-keyword matching with an Aho-Corasick automaton"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+# Suffixes a keyword may carry and still count as a whole-word match ("buttons")
+PLURAL_SUFFIXES = ("s", "es")
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    label: Hashable
+    keyword: str
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Find every keyword of a table in one pass over the text.
+
+    Keywords are compiled into an Aho-Corasick automaton, so matching costs
+    O(len(text) + matches) however many keywords there are. Matching is
+    case-insensitive and only whole words count: "click" matches "click"
+    and "clicks" but not "clicked". Keywords may contain spaces.
+
+    The table can be extended at any time with add(); the automaton is
+    rebuilt on the next search.
+
+    Example:
+        matcher = KeywordMatcher({"button": ["button", "submit"]})
+        matcher.find_all("Submit buttons")  # two matches, both labelled "button"
+    """
+
+    def __init__(self, table: Optional[Dict[Hashable, Iterable[str]]] = None):
+        self._keywords: Dict[str, Set[Hashable]] = {}
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._output: List[List[str]] = []
+        self._dirty = True
+        for label, keywords in (table or {}).items():
+            self.add(label, *keywords)
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def add(self, label: Hashable, *keywords: str) -> None:
+        """Map keywords to a label; a keyword may belong to several labels"""
+        for keyword in keywords:
+            keyword = keyword.lower().strip()
+            if keyword:
+                self._keywords.setdefault(keyword, set()).add(label)
+                self._dirty = True
+
+    def _build(self) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[str]] = [[]]
+        for keyword in self._keywords:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(keyword)
+
+        # Breadth-first so every failure target is finished before it is used
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, child in goto[state].items():
+                queue.append(child)
+                target = fail[state]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                fail[child] = goto[target].get(char, 0)
+                output[child].extend(output[fail[child]])
+
+        self._goto, self._fail, self._output = goto, fail, output
+        self._dirty = False
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """All whole-word keyword matches in text, ordered by end position.
+
+        Positions index into text itself, even where lowercasing changes
+        the length of a character.
+        """
+        if self._dirty:
+            self._build()
+        goto, fail, output = self._goto, self._fail, self._output
+
+        matches = []
+        state = 0
+        # Original index of each lowercased character fed to the automaton
+        origins: List[int] = []
+        for index, original in enumerate(text):
+            for char in original.lower():
+                origins.append(index)
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                if not output[state]:
+                    continue
+                for keyword in output[state]:
+                    start = origins[len(origins) - len(keyword)]
+                    if self._is_whole_word(text, start, index + 1):
+                        for label in self._keywords[keyword]:
+                            matches.append(KeywordMatch(label, keyword, start, index + 1))
+        return matches
+
+    def labels(self, text: str) -> Set[Hashable]:
+        """Labels with at least one match in text"""
+        return {match.label for match in self.find_all(text)}
+
+    @staticmethod
+    def _is_whole_word(text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+            return False
+        if end >= len(text) or not _is_word_char(text[end]) or not _is_word_char(text[end - 1]):
+            return True
+        for suffix in PLURAL_SUFFIXES:
+            after = end + len(suffix)
+            if text[end:after].lower() == suffix and (after >= len(text) or not _is_word_char(text[after])):
+                return True
+        return False
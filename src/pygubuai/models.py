@@ -47,6 +47,7 @@ class WorkflowHistory(BaseModel):
     action: str
     description: str
     user: Optional[str] = None
+    changes: Optional[Dict[str, List[str]]] = None
 
 
 class WorkflowData(BaseModel):
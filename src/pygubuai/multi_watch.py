@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, Union
 from datetime import datetime, timezone
 
 from .workflow import get_file_hash, load_workflow, save_workflow, get_watch_interval, get_file_patterns
+from .event_writer import EventWriter, get_event_writer
 from .registry import Registry
 from .errors import ProjectNotFoundError
 
@@ -46,17 +47,24 @@ def watch_multiple_projects(
     print(f"   Interval: {interval}s\n")
     print("Press Ctrl+C to stop\n")
 
+    writer = get_event_writer()
     try:
         while True:
             for name, path in projects_to_watch.items():
-                _check_project_changes(name, path, workflows[name], patterns)
+                _check_project_changes(name, path, workflows[name], patterns, writer)
             time.sleep(interval)
     except KeyboardInterrupt:
         print("\n\nOK Stopped watching")
+    finally:
+        if writer is not None:
+            writer.flush(timeout=10.0)
 
 
-def _check_project_changes(name: str, path: Path, workflow: Dict, patterns: List[str]) -> None:
-    """Check single project for changes"""
+def _check_project_changes(
+    name: str, path: Path, workflow: Dict, patterns: List[str], writer: Optional[EventWriter] = None
+) -> None:
+    """Check single project for changes, persisting through writer if given"""
+    persist = writer.save_workflow if writer is not None else save_workflow
     ui_files: list[Path] = []
     for pattern in patterns:
         ui_files.extend(path.glob(pattern))
@@ -74,12 +82,20 @@ def _check_project_changes(name: str, path: Path, workflow: Dict, patterns: List
 
         if prev_hash is None:
             workflow["file_hashes"][file_key] = current_hash
-            save_workflow(path, workflow)
+            persist(path, workflow)
         elif current_hash != prev_hash:
-            print(f" [{name}] {ui_file.name} changed at {datetime.now(timezone.utc).strftime('%H:%M:%S')}")
+            now = datetime.now(timezone.utc)
+            print(f" [{name}] {ui_file.name} changed at {now.strftime('%H:%M:%S')}")
             workflow["file_hashes"][file_key] = current_hash
-            workflow["changes"].append({"file": ui_file.name, "timestamp": datetime.now(timezone.utc).isoformat()})
-            save_workflow(path, workflow)
+            event = {
+                "timestamp": now.isoformat(),
+                "action": "file_changed",
+                "description": f"File {ui_file.name} changed",
+            }
+            workflow.setdefault("history", []).append(event)
+            persist(path, workflow)
+            if writer is not None:
+                writer.submit_event(name, path, event["action"], event["description"], event["timestamp"])
 
 
 def watch_all_projects(interval: Optional[float] = None, patterns: Union[List[str], None] = None) -> None:
@@ -1,11 +1,95 @@
 #!/usr/bin/env python3
 """Quick preview tool for UI files"""
+import logging
 import tkinter as tk
+from typing import Any, Dict
 from .registry import Registry
+from .uidiff import UIDiff, WidgetNode, diff_trees, parse_ui
+
+logger = logging.getLogger(__name__)
+
+
+# Properties whose values are resolved by the builder into Tk objects
+# (variables, images, callbacks) cannot be patched onto a live widget.
+_REBUILD_PROPERTIES = {"command", "textvariable", "variable", "listvariable", "image", "class_"}
+
+
+def _can_patch(diff: UIDiff, new: Dict[str, WidgetNode]) -> bool:
+    """Check whether a diff can be applied to live widgets without a rebuild"""
+    if diff.moved or diff.class_changed or diff.container_layout:
+        return False
+    if any(new[w].parent is None for w in diff.added):
+        return False
+    for props in diff.properties.values():
+        for name, (_, after) in props.items():
+            if after is None or name in _REBUILD_PROPERTIES:
+                return False
+    for props in diff.layout.values():
+        if "manager" in props or any(after is None for _, after in props.values()):
+            return False
+    return True
+
+
+def _apply_ui_changes(
+    objects: Dict[str, Any], diff: UIDiff, old: Dict[str, WidgetNode], new: Dict[str, WidgetNode]
+) -> None:
+    """Patch live widgets in place.
+
+    Args:
+        objects: Widget id to pygubu BuilderObject for every live widget
+        diff: Changes accepted by _can_patch
+        old: Tree the live widgets were built from
+        new: Tree to bring the live widgets in line with
+
+    Raises:
+        KeyError, tk.TclError: If a widget cannot be patched (caller rebuilds)
+    """
+    import pygubu
+    from defusedxml import ElementTree as ET
+
+    for widget_id in diff.removed:
+        objects[widget_id].widget.destroy()
+        stale = [widget_id]
+        while stale:
+            current = stale.pop()
+            objects.pop(current, None)
+            stale.extend(old[current].children)
+
+    for widget_id, props in diff.properties.items():
+        bobject = objects[widget_id]
+        for name, (_, value) in props.items():
+            bobject.wmeta.properties[name] = value
+            bobject._set_property(bobject.widget, name, value)
+
+    for widget_id, props in diff.layout.items():
+        bobject = objects[widget_id]
+        bobject.wmeta.layout_properties.update({name: value for name, (_, value) in props.items()})
+        bobject.layout()
+
+    for widget_id in diff.added:
+        node = new[widget_id]
+        parent = objects[node.parent]
+        fragment = pygubu.Builder()
+        fragment.add_from_string(
+            f'<interface version="1.2">{ET.tostring(node.element, encoding="unicode")}</interface>'
+        )
+        widget = fragment.get_object(widget_id, parent.get_child_master())
+        objects.update(fragment.objects)
+
+        # Keep pack order: place the new widget before its next live sibling
+        if node.layout and node.layout["manager"] == "pack":
+            siblings = new[node.parent].children
+            following = [w for w in siblings[node.index + 1 :] if w in old and w in objects]
+            if following:
+                widget.pack_configure(before=objects[following[0]].widget)
 
 
 def preview_ui(ui_file_path: str, watch: bool = False) -> None:
-    """Preview UI file in Tkinter window"""
+    """Preview UI file in Tkinter window.
+
+    In watch mode, edits are applied to the live widgets in place; the window
+    is only rebuilt when the change cannot be patched (see _can_patch).
+    """
     from .errors import DependencyError, UIParseError, FileOperationError
     from .utils import validate_path
 
@@ -19,11 +103,13 @@ def preview_ui(ui_file_path: str, watch: bool = False) -> None:
     except ValueError as e:
         raise FileOperationError("read", ui_file_path, e) from e
 
-    last_mtime = ui_path.stat().st_mtime
+    root = tk.Tk()
+    root.title(f"Preview: {ui_path.name}")
+    state: Dict[str, Any] = {"mtime": ui_path.stat().st_mtime, "tree": {}, "objects": {}}
 
-    def create_window():
-        root = tk.Tk()
-        root.title(f"Preview: {ui_path.name}")
+    def build():
+        for child in root.winfo_children():
+            child.destroy()
 
         builder = pygubu.Builder()
         try:
@@ -43,31 +129,53 @@ def preview_ui(ui_file_path: str, watch: bool = False) -> None:
         except Exception as e:
             raise UIParseError(str(ui_path), f"Failed to load UI: {e}") from e
 
+        state["objects"] = dict(builder.objects)
         if watch:
+            try:
+                state["tree"] = parse_ui(ui_path)
+            except Exception as e:
+                logger.debug(f"Could not index UI for incremental reload: {e}")
+                state["tree"] = {}
+
+    def reload():
+        try:
+            new_tree = parse_ui(ui_path)
+        except Exception as e:
+            # Half-written file: keep the current window until the next save
+            logger.debug(f"Skipping reload, UI not parseable yet: {e}")
+            return
+
+        diff = diff_trees(state["tree"], new_tree) if state["tree"] else None
+        if diff is None or not _can_patch(diff, new_tree):
+            logger.info(f"Reloading {ui_path.name} (full rebuild)")
+            build()
+            return
 
-            def check_changes():
-                nonlocal last_mtime
-                try:
-                    current_mtime = ui_path.stat().st_mtime
-                    if current_mtime != last_mtime:
-                        last_mtime = current_mtime
-                        root.destroy()
-                        create_window()
-                except (OSError, PermissionError) as e:
-                    # File may be temporarily unavailable during write
-                    import logging
-
-                    logging.debug(f"Temporary error checking file: {e}")
-                except tk.TclError:
-                    # Window already destroyed
-                    return
-                root.after(1000, check_changes)
-
-            root.after(1000, check_changes)
-
-        return root
-
-    root = create_window()
+        try:
+            _apply_ui_changes(state["objects"], diff, state["tree"], new_tree)
+            state["tree"] = new_tree
+            logger.info(f"Patched {ui_path.name}: {diff.summary()}")
+        except (KeyError, tk.TclError) as e:
+            logger.info(f"Reloading {ui_path.name} (full rebuild): {e}")
+            build()
+
+    def check_changes():
+        try:
+            current_mtime = ui_path.stat().st_mtime
+            if current_mtime != state["mtime"]:
+                state["mtime"] = current_mtime
+                reload()
+        except (OSError, PermissionError) as e:
+            # File may be temporarily unavailable during write
+            logger.debug(f"Temporary error checking file: {e}")
+        except tk.TclError:
+            # Window already destroyed
+            return
+        root.after(1000, check_changes)
+
+    build()
+    if watch:
+        root.after(1000, check_changes)
     root.mainloop()
 
 
@@ -94,11 +202,9 @@ def preview_project(project_name: str, watch: bool = False) -> None:
 def main():
     """CLI entry point"""
     import sys
-    import logging
     from .errors import PygubuAIError
 
     logging.basicConfig(level=logging.INFO, format="%(message)s")
-    logger = logging.getLogger(__name__)
 
     if len(sys.argv) < 2:
         print("Usage: pygubu-preview <project_name|file.ui> [--watch]")
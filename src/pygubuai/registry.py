@@ -4,7 +4,7 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Optional, Union
 from contextlib import contextmanager
 from datetime import datetime, timezone
 
@@ -150,20 +150,31 @@ class Registry:
 
     def add_project(self, name: str, path: str, description: str = "", tags: Union[list[str], None] = None) -> None:
         """Add project with metadata"""
+        self.add_projects([{"name": name, "path": path, "description": description, "tags": tags}])
+
+    def add_projects(self, projects: Iterable[Dict]) -> None:
+        """Add many projects with a single registry read and write.
+
+        Args:
+            projects: Dicts with "name", "path" and optional "description" and "tags"
+        """
         from .utils import validate_path
 
         data = self._read()
-        try:
-            safe_path = validate_path(path, must_exist=True, must_be_dir=True)
-        except ValueError:
-            safe_path = Path(path).resolve()
-        data["projects"][name] = {
-            "path": str(safe_path),
-            "created": datetime.now(timezone.utc).isoformat(),
-            "modified": datetime.now(timezone.utc).isoformat(),
-            "description": description,
-            "tags": tags or [],
-        }
+        now = datetime.now(timezone.utc).isoformat()
+        for project in projects:
+            path = project["path"]
+            try:
+                safe_path = validate_path(str(path), must_exist=True, must_be_dir=True)
+            except ValueError:
+                safe_path = Path(path).resolve()
+            data["projects"][project["name"]] = {
+                "path": str(safe_path),
+                "created": now,
+                "modified": now,
+                "description": project.get("description", ""),
+                "tags": project.get("tags") or [],
+            }
         self._write(data)
 
     def get_project(self, name: str) -> Optional[str]:
@@ -0,0 +1,73 @@
+"""Parsed view of a project shared by analysis, context and query tools"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .uidiff import WidgetNode, parse_ui
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProjectSnapshot:
+    """Project files resolved and parsed once"""
+
+    name: str
+    path: Path
+    ui_file: Path
+    py_file: Path
+    nodes: Dict[str, WidgetNode] = field(default_factory=dict)
+    code: Optional[str] = None
+
+    @classmethod
+    def load(cls, project_name: str, registry=None) -> Optional["ProjectSnapshot"]:
+        """Resolve a registered project and parse its UI and code files.
+
+        Args:
+            project_name: Registered project name
+            registry: Registry to resolve the name with (default: new Registry)
+
+        Returns:
+            Snapshot, or None if the project is not registered
+        """
+        if registry is None:
+            from .registry import Registry
+
+            registry = Registry()
+
+        project_path = registry.get_project(project_name)
+        if not project_path:
+            return None
+        return cls.from_path(project_name, project_path)
+
+    @classmethod
+    def from_path(cls, project_name: str, project_path: Union[str, Path]) -> "ProjectSnapshot":
+        """Parse the UI and code files of a project directory"""
+        path = Path(project_path)
+        snapshot = cls(
+            name=project_name,
+            path=path,
+            ui_file=path / f"{project_name}.ui",
+            py_file=path / f"{project_name}.py",
+        )
+
+        if snapshot.ui_file.exists():
+            try:
+                snapshot.nodes = parse_ui(snapshot.ui_file)
+            except Exception as e:
+                logger.debug(f"Failed to parse {snapshot.ui_file}: {e}")
+
+        if snapshot.py_file.exists():
+            try:
+                snapshot.code = snapshot.py_file.read_text()
+            except OSError as e:
+                logger.debug(f"Failed to read {snapshot.py_file}: {e}")
+
+        return snapshot
+
+    @property
+    def callbacks(self) -> List[str]:
+        """Sorted command callbacks referenced by the UI"""
+        return sorted({node.properties["command"] for node in self.nodes.values() if node.properties.get("command")})
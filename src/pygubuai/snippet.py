@@ -1,5 +1,13 @@
 #!/usr/bin/env python3
 """XML snippet generator for common widgets"""
+import io
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, TextIO, Tuple, Union
+from xml.etree.ElementTree import indent as indent_tree
+
+from defusedxml import ElementTree as ET
+
+from .generator import UIWriter
 
 SNIPPET_TEMPLATES = {
     "button": """    <object class="ttk.Button" id="{id}">
@@ -71,16 +79,241 @@ DEFAULT_VALUES = {
 }
 
 
+# Snippets that may hold other snippets
+CONTAINER_SNIPPETS = {"frame"}
+
+_FIELD_RE = re.compile(r"\{(\w+)\}")
+_ATTR_FIELD_RE = re.compile(r'="\{(\w+)\}"')
+
+SnippetSpec = Union[str, Dict[str, Any]]
+
+
+class CompiledSnippet:
+    """A snippet template compiled for fast repeated rendering.
+
+    The template is dedented once and split into the object's opening part
+    and its closing tag, so children can be placed between them. Indented
+    format strings are cached per nesting level, so rendering is a single
+    format_map() call. Values are escaped for the position they appear
+    in: fields inside attributes are attribute-escaped, the rest text-escaped.
+    """
+
+    def __init__(self, widget_type: str, template: str, defaults: Dict[str, Any]):
+        self.widget_type = widget_type
+        self.defaults = dict(defaults)
+        self.attr_fields = set(_ATTR_FIELD_RE.findall(template))
+        self.fields = set(_FIELD_RE.findall(template))
+        # (depth, line) with depth counted in two-space steps from the object tag
+        lines = template.splitlines()
+        base = len(lines[0]) - len(lines[0].lstrip())
+        self._lines = [((len(line) - len(line.lstrip()) - base) // 2, line.strip()) for line in lines]
+        self._formats: Dict[Tuple[int, str], Tuple[str, str]] = {}
+
+    def _format(self, level: int, indent: str) -> Tuple[str, str]:
+        key = (level, indent)
+        formats = self._formats.get(key)
+        if formats is None:
+            lines = [f"{indent * (level + depth)}{line}\n" for depth, line in self._lines]
+            formats = self._formats[key] = ("".join(lines[:-1]), lines[-1])
+        return formats
+
+    def values(self, overrides: Dict[str, Any]) -> Dict[str, str]:
+        """Defaults merged with overrides, escaped for their positions"""
+        values = {**self.defaults, **overrides}
+        missing = self.fields - values.keys()
+        if missing:
+            raise ValueError(f"Snippet '{self.widget_type}' needs values for: {', '.join(sorted(missing))}")
+        return {
+            field: UIWriter.attr(values[field]) if field in self.attr_fields else UIWriter.text(values[field])
+            for field in self.fields
+        }
+
+    def render_parts(self, values: Dict[str, str], level: int = 0, indent: str = "  ") -> Tuple[str, str]:
+        """Opening part and closing tag for already escaped values"""
+        head, tail = self._format(level, indent)
+        return head.format_map(values), tail
+
+    def render(self, level: int = 0, indent: str = "  ", **overrides: Any) -> str:
+        head, tail = self.render_parts(self.values(overrides), level, indent)
+        return head + tail
+
+
+_compiled_snippets: Dict[str, CompiledSnippet] = {}
+
+
+def get_snippet(widget_type: str) -> CompiledSnippet:
+    """Compiled snippet for a widget type, compiled on first use"""
+    compiled = _compiled_snippets.get(widget_type)
+    if compiled is None:
+        if widget_type not in SNIPPET_TEMPLATES:
+            raise ValueError(f"Unknown widget type: {widget_type}")
+        compiled = CompiledSnippet(widget_type, SNIPPET_TEMPLATES[widget_type], DEFAULT_VALUES[widget_type])
+        _compiled_snippets[widget_type] = compiled
+    return compiled
+
+
 def generate_snippet(widget_type: str, **kwargs) -> str:
     """Generate XML snippet for widget"""
-    if widget_type not in SNIPPET_TEMPLATES:
-        raise ValueError(f"Unknown widget type: {widget_type}")
+    return get_snippet(widget_type).render(level=2, **kwargs).rstrip("\n")
+
+
+def _normalize(spec: SnippetSpec) -> Dict[str, Any]:
+    if isinstance(spec, str):
+        return {"type": spec}
+    if not isinstance(spec, dict) or "type" not in spec:
+        raise ValueError(f"Snippet spec must be a widget type or a dict with a 'type': {spec!r}")
+    return spec
+
+
+def _explicit_ids(specs: Iterable[Dict[str, Any]], ids: Set[str]) -> None:
+    for spec in specs:
+        if "id" in spec:
+            if spec["id"] in ids:
+                raise ValueError(f"Duplicate widget id: {spec['id']}")
+            ids.add(spec["id"])
+        _explicit_ids([_normalize(child) for child in spec.get("children", [])], ids)
+
+
+class _IdAllocator:
+    """Hands out button_1, button_2, ... skipping ids already taken"""
+
+    def __init__(self, taken: Set[str]):
+        self.taken = taken
+        self.counters: Dict[str, int] = {}
+
+    def __call__(self, default_id: str) -> str:
+        prefix = default_id.rsplit("_", 1)[0]
+        number = self.counters.get(prefix, 0)
+        while True:
+            number += 1
+            candidate = f"{prefix}_{number}"
+            if candidate not in self.taken:
+                break
+        self.counters[prefix] = number
+        self.taken.add(candidate)
+        return candidate
+
+
+def write_snippets(
+    out: TextIO,
+    specs: Iterable[SnippetSpec],
+    level: int = 0,
+    indent: str = "  ",
+    taken_ids: Optional[Iterable[str]] = None,
+    child: bool = True,
+) -> List[str]:
+    """Stream a fragment of composed snippets to out.
+
+    Each spec is a widget type ("button") or a dict with "type", template
+    values and, for containers, a "children" list of further specs. Widgets
+    without an "id" get the next free one (button_1, button_2, ...).
+
+    Args:
+        out: Text stream to write to
+        specs: Snippet specs, in document order
+        level: Nesting level of the top-level snippets
+        indent: String repeated once per nesting level
+        taken_ids: Ids already used in the target document
+        child: Wrap top-level snippets in <child>, for placing inside an object
+
+    Returns:
+        Ids of the widgets written, in document order
+
+    Raises:
+        ValueError: For unknown types, duplicate ids or children of a non-container
+    """
+    specs = [_normalize(spec) for spec in specs]
+    taken = set(taken_ids or ())
+    explicit: Set[str] = set()
+    _explicit_ids(specs, explicit)
+    clashes = explicit & taken
+    if clashes:
+        raise ValueError(f"Widget ids already in use: {', '.join(sorted(clashes))}")
+    allocate = _IdAllocator(taken | explicit)
+    written: List[str] = []
+
+    def emit(spec: Dict[str, Any], depth: int, wrap: bool) -> None:
+        compiled = get_snippet(spec["type"])
+        children = spec.get("children", [])
+        if children and spec["type"] not in CONTAINER_SNIPPETS:
+            raise ValueError(f"Snippet '{spec['type']}' cannot contain children")
+        overrides = {k: v for k, v in spec.items() if k not in ("type", "children")}
+        if "id" not in overrides:
+            overrides["id"] = allocate(compiled.defaults["id"])
+        written.append(str(overrides["id"]))
+
+        if wrap:
+            out.write(f"{indent * depth}<child>\n")
+            depth += 1
+        head, tail = compiled.render_parts(compiled.values(overrides), depth, indent)
+        out.write(head)
+        for child_spec in children:
+            emit(_normalize(child_spec), depth + 1, True)
+        out.write(tail)
+        if wrap:
+            out.write(f"{indent * (depth - 1)}</child>\n")
+
+    for spec in specs:
+        emit(spec, level, child)
+    return written
+
+
+def render_snippets(specs: Iterable[SnippetSpec], level: int = 0, indent: str = "  ", child: bool = True) -> str:
+    """Composed snippets as an XML fragment (see write_snippets)"""
+    out = io.StringIO()
+    write_snippets(out, specs, level, indent, child=child)
+    return out.getvalue()
+
+
+def _find_object(root, object_id: str):
+    """Object element with object_id and its depth below the root"""
+    stack = [(root, 0)]
+    while stack:
+        element, depth = stack.pop()
+        if element.tag == "object" and element.get("id") == object_id:
+            return element, depth
+        stack.extend((child, depth + 1) for child in element)
+    return None, -1
+
+
+def insert_snippets(ui_file, parent_id: str, specs: Iterable[SnippetSpec], indent: str = "  ") -> List[str]:
+    """Insert composed snippets into an existing .ui file under parent_id.
+
+    The file is parsed and written once however many snippets are inserted.
+    Generated ids avoid every id already in the file.
+
+    Returns:
+        Ids of the inserted widgets, in document order
+
+    Raises:
+        ValueError: If parent_id does not exist or the specs are invalid
+    """
+    tree = ET.parse(ui_file)
+    root = tree.getroot()
+    parent, depth = _find_object(root, parent_id)
+    if parent is None:
+        raise ValueError(f"No object with id '{parent_id}' in {ui_file}")
 
-    # Merge defaults with provided values
-    values = DEFAULT_VALUES[widget_type].copy()
-    values.update(kwargs)
+    taken = {element.get("id") for element in root.iter("object")}
+    out = io.StringIO()
+    inserted = write_snippets(out, specs, indent=indent, taken_ids=taken)
+    fragment = ET.fromstring(f"<fragment>{out.getvalue()}</fragment>")
 
-    return SNIPPET_TEMPLATES[widget_type].format(**values)
+    children = list(fragment)
+    if not children:
+        return inserted
+    inner = "\n" + indent * (depth + 1)
+    if len(parent):
+        parent[-1].tail = inner
+    else:
+        parent.text = inner
+    for element in children:
+        indent_tree(element, indent, level=depth + 1)
+        element.tail = inner
+        parent.append(element)
+    children[-1].tail = "\n" + indent * depth
+    tree.write(ui_file, encoding="utf-8", xml_declaration=True)
+    return inserted
 
 
 def main():
@@ -96,6 +329,7 @@ def main():
         print("  pygubu-snippet button 'Submit' --command on_submit")
         print("  pygubu-snippet entry 'Email' --variable email_var")
         print("  pygubu-snippet frame --layout grid")
+        print("  pygubu-snippet button 'Save' --into app.ui --parent main_frame")
         sys.exit(1)
 
     widget_type = sys.argv[1]
@@ -130,7 +364,15 @@ def main():
         else:
             i += 1
 
+    into = kwargs.pop("into", None)
+    parent = kwargs.pop("parent", None)
     try:
+        if into:
+            if not parent:
+                raise ValueError("--into needs --parent <object id>")
+            ids = insert_snippets(into, parent, [{"type": widget_type, **kwargs}])
+            print(f"Inserted {', '.join(ids)} into '{parent}' in {into}")
+            return
         snippet = generate_snippet(widget_type, **kwargs)
         print("\\n" + snippet + "\\n")
     except Exception as e:
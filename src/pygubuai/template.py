@@ -1,19 +1,103 @@
 """Template CLI"""
 
 import sys
+import hashlib
+import html
+import io
+import json
 import logging
 import argparse
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Optional
 
 from . import __version__
 from .errors import PygubuAIError, validate_pygubu
-from .utils import validate_project_name, ensure_directory
-from .template_data import get_template, list_templates, get_template_widgets_and_callbacks
-from .generator import generate_base_ui_xml_structure, generate_python_app_structure, generate_readme_content
+from .utils import validate_project_name, ensure_directory, safe_xml_text
+from .template_data import list_templates, template_widgets_and_callbacks
+from .template_discovery import get_template_registry
+from .generator import generate_python_app_structure, generate_readme_content, write_base_ui
 
 logger = logging.getLogger(__name__)
 
 
+# Stand-in project name rendered into compiled skeletons. It has no
+# underscores or capitals, so its title and class-name forms are known.
+_SENTINEL = "pygubuaiprojectname"
+_SENTINEL_TITLE = _SENTINEL.title()
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template's rendered project files with the project name left open"""
+
+    name: str
+    digest: str
+    ui: str
+    py: str
+    readme: str
+
+    def render(self, project_name: str) -> Dict[str, str]:
+        """Project files for project_name, keyed by file name"""
+        title = project_name.replace("_", " ").title()
+        return {
+            f"{project_name}.ui": self.ui.replace(_SENTINEL_TITLE, safe_xml_text(title)),
+            f"{project_name}.py": self.py.replace(_SENTINEL_TITLE, title.replace(" ", "")).replace(
+                _SENTINEL, project_name
+            ),
+            "README.md": self.readme.replace(_SENTINEL_TITLE, html.escape(title)).replace(_SENTINEL, project_name),
+        }
+
+
+_compiled_templates: Dict[str, CompiledTemplate] = {}
+
+
+def compile_template(template_name: str) -> CompiledTemplate:
+    """Compiled skeleton for a built-in or user template.
+
+    Compiled templates are kept for the life of the process and rebuilt
+    when the template's content changes, including edits to user
+    template files.
+
+    Raises:
+        PygubuAIError: If the template does not exist
+    """
+    registry = get_template_registry()
+    registry.refresh()
+    template = registry.get_template(template_name)
+    if not template:
+        raise PygubuAIError(
+            f"Template '{template_name}' not found", "Use 'pygubu-template list' to see available templates"
+        )
+
+    digest = hashlib.sha256(json.dumps(template, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    compiled = _compiled_templates.get(template_name)
+    if compiled is not None and compiled.digest == digest:
+        return compiled
+
+    template_widgets, template_callbacks_code = template_widgets_and_callbacks(template)
+    ui = io.StringIO()
+    write_base_ui(ui, _SENTINEL, template_widgets)
+    compiled = CompiledTemplate(
+        name=template_name,
+        digest=digest,
+        ui=ui.getvalue(),
+        py=generate_python_app_structure(_SENTINEL, [], custom_callbacks_code=template_callbacks_code),
+        readme=generate_readme_content(
+            _SENTINEL, template["description"], f"{_SENTINEL}.ui", template_name=template_name
+        ),
+    )
+    _compiled_templates[template_name] = compiled
+    return compiled
+
+
+def write_project(base: Path, name: str, compiled: CompiledTemplate) -> None:
+    """Write a compiled template's files for one project"""
+    for file_name, content in compiled.render(name).items():
+        (base / file_name).write_text(content)
+    (base / f"{name}.py").chmod(0o755)
+
+
 def create_from_template(
     name: str, template_name: str, skip_validation: bool = False, dry_run: bool = False, init_git: bool = False
 ):
@@ -22,11 +106,7 @@ def create_from_template(
         if not skip_validation:
             validate_pygubu()
 
-        template = get_template(template_name)
-        if not template:
-            raise PygubuAIError(
-                f"Template '{template_name}' not found", "Use 'pygubu-template list' to see available templates"
-            )
+        compiled = compile_template(template_name)
 
         name = validate_project_name(name)
         base = Path.cwd() / name
@@ -41,20 +121,7 @@ def create_from_template(
             return
 
         base = ensure_directory(base)
-
-        template_widgets, template_callbacks_code = get_template_widgets_and_callbacks(template_name)
-
-        ui_file = base / f"{name}.ui"
-        ui_file.write_text(generate_base_ui_xml_structure(name, template_widgets))
-
-        py_file = base / f"{name}.py"
-        py_file.write_text(generate_python_app_structure(name, [], custom_callbacks_code=template_callbacks_code))
-        py_file.chmod(0o755)
-
-        readme = base / "README.md"
-        readme.write_text(
-            generate_readme_content(name, template["description"], f"{name}.ui", template_name=template_name)
-        )
+        write_project(base, name, compiled)
 
         # Initialize git if requested
         if init_git:
@@ -75,6 +142,47 @@ def create_from_template(
         sys.exit(1)
 
 
+def create_many_from_template(
+    prefix: str, template_name: str, count: int, parent: Optional[Path] = None, skip_validation: bool = False
+) -> List[Path]:
+    """Stamp out count projects named <prefix>_001, <prefix>_002, ... from one template.
+
+    The template is compiled once; each project then only costs three file
+    writes.
+
+    Args:
+        prefix: Project name prefix
+        template_name: Template to use
+        count: Number of projects
+        parent: Directory to create projects in (default: current directory)
+        skip_validation: Skip the pygubu installation check
+
+    Returns:
+        Created project directories
+
+    Raises:
+        PygubuAIError: If the template does not exist or pygubu is missing
+        ValueError: If count is not positive or the prefix is empty
+    """
+    if count < 1:
+        raise ValueError("Count must be at least 1")
+    if not skip_validation:
+        validate_pygubu()
+
+    compiled = compile_template(template_name)
+    prefix = validate_project_name(prefix)
+    parent = parent or Path.cwd()
+    width = max(3, len(str(count)))
+
+    created = []
+    for i in range(1, count + 1):
+        name = f"{prefix}_{i:0{width}d}"
+        base = ensure_directory(parent / name)
+        write_project(base, name, compiled)
+        created.append(base)
+    return created
+
+
 def main(args=None):
     """CLI entry point"""
     logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -87,6 +195,9 @@ def main(args=None):
     create_parser = subparsers.add_parser("create", help="Create project from template")
     create_parser.add_argument("name", help="Project name")
     create_parser.add_argument("template", help="Template name")
+    create_parser.add_argument(
+        "--count", type=int, metavar="N", help="Create N projects named <name>_001 ... <name>_N"
+    )
 
     # Support legacy positional args: pygubu-template <name> <template>
     parsed_args = parser.parse_args(args)
@@ -96,7 +207,16 @@ def main(args=None):
         for name, desc in list_templates():
             print(f"  {name:12} - {desc}")
     elif parsed_args.command == "create":
-        create_from_template(parsed_args.name, parsed_args.template)
+        if parsed_args.count is not None:
+            try:
+                created = create_many_from_template(parsed_args.name, parsed_args.template, parsed_args.count)
+            except (PygubuAIError, ValueError, OSError) as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            print(f"Created {len(created)} projects from '{parsed_args.template}'")
+            print(f"  {created[0].name} ... {created[-1].name}")
+        else:
+            create_from_template(parsed_args.name, parsed_args.template)
     else:
         # Legacy mode: pygubu-template <name> <template>
         if args is None:
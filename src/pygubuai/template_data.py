@@ -114,6 +114,21 @@ def get_template_widgets_and_callbacks(template_name: str) -> Tuple[List[Tuple[s
     if not template:
         raise ValueError(f"Template not found: {template_name}")
 
+    return template_widgets_and_callbacks(template)
+
+
+def template_widgets_and_callbacks(template: Dict[str, Any]) -> Tuple[List[Tuple[str, Dict[str, Any]]], str]:
+    """Extract widgets and callback code from a template dictionary.
+
+    Args:
+        template: Template dictionary, built-in or user
+
+    Returns:
+        Tuple of (widget list, callback code string)
+
+    Raises:
+        ValueError: If template is invalid
+    """
     widgets_for_generator = []
     used_ids = set()
 
@@ -2,12 +2,15 @@
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from .logging_config import get_logger
 from .template_data import TEMPLATES, validate_widget
 
 logger = get_logger(__name__)
 
+# Parsed and validated user templates, reused while a file's mtime and size are unchanged
+_user_template_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 class TemplateRegistry:
     """Registry for discovering and managing templates from multiple sources."""
@@ -15,12 +18,14 @@ class TemplateRegistry:
     def __init__(self):
         """Initialize template registry with built-in and user templates."""
         self.templates = TEMPLATES.copy()
+        self._user_templates: Dict[str, Dict[str, Any]] = {}
         self._discover_user_templates()
 
     def _discover_user_templates(self) -> None:
         """Discover templates from user template directory.
 
-        Searches ~/.pygubuai/templates/ for JSON template files.
+        Searches ~/.pygubuai/templates/ for JSON template files. Files that
+        have not changed since they were last loaded are not parsed again.
         """
         user_template_dir = Path.home() / ".pygubuai" / "templates"
         if not user_template_dir.exists():
@@ -29,14 +34,35 @@ class TemplateRegistry:
 
         for template_file in user_template_dir.glob("*.json"):
             try:
+                stat = template_file.stat()
+                key = (stat.st_mtime_ns, stat.st_size)
+                cached = _user_template_cache.get(template_file)
+                if cached is not None and cached[0] == key:
+                    self._user_templates[template_file.stem] = cached[1]
+                    continue
+
                 template_data = json.loads(template_file.read_text())
                 template_name = template_file.stem
 
                 if self._validate_template(template_data):
-                    self.templates[template_name] = template_data
+                    _user_template_cache[template_file] = (key, template_data)
+                    self._user_templates[template_name] = template_data
                     logger.info(f"Loaded user template: {template_name}")
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(f"Failed to load template {template_file}: {e}")
+        self.templates.update(self._user_templates)
+
+    def refresh(self) -> None:
+        """Pick up user template files added, changed or removed since loading"""
+        previous = self._user_templates
+        self._user_templates = {}
+        self._discover_user_templates()
+        for name, template in previous.items():
+            if name not in self._user_templates and self.templates.get(name) is template:
+                if name in TEMPLATES:
+                    self.templates[name] = TEMPLATES[name]
+                else:
+                    del self.templates[name]
 
     def _validate_template(self, template: Dict[str, Any]) -> bool:
         """Validate template structure and content.
@@ -98,6 +124,43 @@ class TemplateRegistry:
             result.append((name, tmpl["description"], source))
         return result
 
+    def search(self, query: str, limit: int = 20) -> List[tuple]:
+        """Search templates by name, description and widget types.
+
+        Templates are mirrored into the database so they share the indexed
+        search used for marketplace templates; without SQLAlchemy a simple
+        substring match over this registry is used.
+
+        Args:
+            query: Search words (each must match as a word prefix)
+            limit: Maximum number of results
+
+        Returns:
+            List of (name, description, source) tuples, best match first
+        """
+        from .db import session_scope, SQLALCHEMY_AVAILABLE
+
+        if SQLALCHEMY_AVAILABLE:
+            from .db.operations import search_templates
+            from .db.search import sync_registry_templates
+
+            sources = {name: source for name, _, source in self.list_templates()}
+            try:
+                with session_scope() as session:
+                    if session is not None:
+                        sync_registry_templates(session, self.templates, sources)
+                        return [
+                            (t.name, t.description, (t.meta_data or {}).get("source", "marketplace"))
+                            for t in search_templates(session, query, limit)
+                        ]
+            except Exception as e:
+                logger.warning(f"Indexed template search failed, scanning registry: {e}")
+
+        words = query.lower().split()
+        return [
+            entry for entry in self.list_templates() if all(w in f"{entry[0]} {entry[1]}".lower() for w in words)
+        ][:limit]
+
     def register_template(self, name: str, template: Dict[str, Any]) -> bool:
         """Register a new template programmatically.
 
@@ -135,6 +198,7 @@ class TemplateRegistry:
         try:
             template_file.write_text(json.dumps(template, indent=2))
             self.templates[name] = template
+            self._user_templates[name] = template
             logger.info(f"Saved user template: {name}")
             return True
         except OSError as e:
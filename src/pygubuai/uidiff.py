@@ -0,0 +1,263 @@
+"""Structural diff for pygubu UI files keyed by widget id"""
+
+import bisect
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from defusedxml import ElementTree as ET
+
+Change = Tuple[Optional[str], Optional[str]]
+
+
+@dataclass
+class WidgetNode:
+    """Single object of a UI file"""
+
+    id: str
+    cls: str
+    parent: Optional[str]
+    index: int
+    properties: Dict[str, str] = field(default_factory=dict)
+    layout: Optional[Dict[str, str]] = None
+    container_layout: str = ""
+    children: List[str] = field(default_factory=list)
+    element: Any = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class UIDiff:
+    """Changes between two UI trees.
+
+    Property and layout changes map widget id to {name: (old, new)}, where a
+    missing value is None. The layout manager is reported under "manager".
+    """
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    moved: List[str] = field(default_factory=list)
+    class_changed: List[str] = field(default_factory=list)
+    properties: Dict[str, Dict[str, Change]] = field(default_factory=dict)
+    layout: Dict[str, Dict[str, Change]] = field(default_factory=dict)
+    container_layout: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """True if both trees are structurally identical"""
+        return not (
+            self.added
+            or self.removed
+            or self.moved
+            or self.class_changed
+            or self.properties
+            or self.layout
+            or self.container_layout
+        )
+
+    def summary(self) -> str:
+        """One-line description of the diff"""
+        if self.is_empty():
+            return "no widget changes"
+        parts = []
+        for label, count in (
+            ("added", len(self.added)),
+            ("removed", len(self.removed)),
+            ("moved", len(self.moved)),
+            ("class changed", len(self.class_changed)),
+            ("properties changed", len(self.properties)),
+            ("layout changed", len(self.layout) + len(self.container_layout)),
+        ):
+            if count:
+                parts.append(f"{count} {label}")
+        return ", ".join(parts)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Compact id-only form suitable for workflow history"""
+        return {
+            "added": list(self.added),
+            "removed": list(self.removed),
+            "moved": list(self.moved),
+            "modified": sorted(
+                set(self.class_changed) | set(self.properties) | set(self.layout) | set(self.container_layout)
+            ),
+        }
+
+
+def parse_ui(source: Union[str, Path]) -> Dict[str, WidgetNode]:
+    """Index every object in a UI file by widget id.
+
+    Args:
+        source: Path to a .ui file, or the XML itself
+
+    Returns:
+        Dict of widget id to WidgetNode, in document order
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+    """
+    if isinstance(source, Path) or not source.lstrip().startswith("<"):
+        root = ET.parse(str(source)).getroot()
+    else:
+        root = ET.fromstring(source)
+
+    nodes: Dict[str, WidgetNode] = {}
+
+    def walk(element, parent_id: Optional[str]) -> None:
+        index = 0
+        for item in element:
+            if item.tag == "object":
+                objects = [item]
+            elif item.tag == "child":
+                objects = item.findall("object")
+            else:
+                continue
+            for obj in objects:
+                widget_id = obj.get("id")
+                if not widget_id:
+                    continue
+                layout = None
+                container = []
+                layout_el = obj.find("layout")
+                if layout_el is not None:
+                    layout = {"manager": layout_el.get("manager") or ""}
+                    for prop in layout_el:
+                        if prop.tag == "property":
+                            layout[prop.get("name")] = prop.text or ""
+                        else:
+                            container.append(ET.tostring(prop, encoding="unicode"))
+                container.extend(ET.tostring(e, encoding="unicode") for e in obj.findall("containerlayout"))
+
+                if parent_id is not None:
+                    nodes[parent_id].children.append(widget_id)
+                nodes[widget_id] = WidgetNode(
+                    id=widget_id,
+                    cls=obj.get("class") or "",
+                    parent=parent_id,
+                    index=index,
+                    properties={p.get("name"): p.text or "" for p in obj.findall("property")},
+                    layout=layout,
+                    container_layout="".join(container),
+                    element=obj,
+                )
+                index += 1
+                walk(obj, widget_id)
+
+    walk(root, None)
+    return nodes
+
+
+def _changed(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, Change]:
+    """Keys whose values differ, with (old, new) pairs"""
+    changes: Dict[str, Change] = {}
+    for key, value in new.items():
+        if old.get(key) != value:
+            changes[key] = (old.get(key), value)
+    for key in old.keys() - new.keys():
+        changes[key] = (old[key], None)
+    return changes
+
+
+def _out_of_order(pairs: List[Tuple[int, str]]) -> List[str]:
+    """Ids not on the longest increasing run of new positions.
+
+    Args:
+        pairs: (new index, id) for surviving siblings, in old order
+    """
+    if len(pairs) < 2:
+        return []
+    tails: List[int] = []
+    tail_at: List[int] = []
+    previous = [-1] * len(pairs)
+    for i, (position, _) in enumerate(pairs):
+        slot = bisect.bisect_left(tails, position)
+        if slot == len(tails):
+            tails.append(position)
+            tail_at.append(i)
+        else:
+            tails[slot] = position
+            tail_at[slot] = i
+        previous[i] = tail_at[slot - 1] if slot else -1
+
+    keep = set()
+    i = tail_at[-1]
+    while i != -1:
+        keep.add(i)
+        i = previous[i]
+    return [widget_id for i, (_, widget_id) in enumerate(pairs) if i not in keep]
+
+
+def diff_trees(old: Dict[str, WidgetNode], new: Dict[str, WidgetNode]) -> UIDiff:
+    """Compute an id-keyed diff of two parsed UI trees in a single pass.
+
+    Added and removed only list the topmost widget of each subtree. A widget
+    is moved when its parent changed or its position relative to surviving
+    siblings changed.
+    """
+    diff = UIDiff()
+    siblings: Dict[Optional[str], List[Tuple[int, int, str]]] = {}
+
+    for widget_id, node in old.items():
+        other = new.get(widget_id)
+        if other is None:
+            if node.parent is None or node.parent in new:
+                diff.removed.append(widget_id)
+            continue
+
+        if other.parent != node.parent:
+            diff.moved.append(widget_id)
+        else:
+            siblings.setdefault(node.parent, []).append((node.index, other.index, widget_id))
+
+        if other.cls != node.cls:
+            diff.class_changed.append(widget_id)
+
+        props = _changed(node.properties, other.properties)
+        if props:
+            diff.properties[widget_id] = props
+
+        if node.layout != other.layout:
+            diff.layout[widget_id] = _changed(node.layout or {}, other.layout or {})
+
+        if node.container_layout != other.container_layout:
+            diff.container_layout.append(widget_id)
+
+    for widget_id, node in new.items():
+        if widget_id not in old and (node.parent is None or node.parent in old):
+            diff.added.append(widget_id)
+
+    for entries in siblings.values():
+        entries.sort()
+        diff.moved.extend(_out_of_order([(new_index, widget_id) for _, new_index, widget_id in entries]))
+
+    return diff
+
+
+def diff_files(old_file: Union[str, Path], new_file: Union[str, Path]) -> UIDiff:
+    """Diff two UI files"""
+    return diff_trees(parse_ui(Path(old_file)), parse_ui(Path(new_file)))
+
+
+def format_diff(diff: UIDiff) -> str:
+    """Render a diff as human-readable lines"""
+    if diff.is_empty():
+        return "No widget changes"
+
+    lines = []
+    for widget_id in diff.added:
+        lines.append(f"+ {widget_id}")
+    for widget_id in diff.removed:
+        lines.append(f"- {widget_id}")
+    for widget_id in diff.moved:
+        lines.append(f"> {widget_id} (moved)")
+    for widget_id in diff.class_changed:
+        lines.append(f"~ {widget_id} (class changed)")
+    for widget_id, props in diff.properties.items():
+        for name, (before, after) in sorted(props.items()):
+            lines.append(f"~ {widget_id}.{name}: {before!r} -> {after!r}")
+    for widget_id, props in diff.layout.items():
+        for name, (before, after) in sorted(props.items()):
+            lines.append(f"~ {widget_id} layout.{name}: {before!r} -> {after!r}")
+    for widget_id in diff.container_layout:
+        lines.append(f"~ {widget_id} (container layout changed)")
+    lines.append("")
+    lines.append(diff.summary())
+    return "\n".join(lines)
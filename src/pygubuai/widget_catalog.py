@@ -0,0 +1,286 @@
+"""Indexed widget catalog with category buckets and fuzzy search"""
+
+import bisect
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .widget_data import CATEGORIES, WIDGET_LIBRARY
+
+logger = logging.getLogger(__name__)
+
+# Entry point group third-party widget packs register under
+ENTRY_POINT_GROUP = "pygubuai.widget_packs"
+
+# Weight of a token by the field it came from
+FIELD_WEIGHTS = {"name": 5.0, "description": 2.0, "use_cases": 2.0, "properties": 1.0, "category": 1.0}
+# Weight of a query token by how it matched an indexed token
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.7
+FUZZY_MATCH = 0.4
+# Bonus when the query is a prefix of the widget name ("ttk.En", "entr")
+NAME_PREFIX_BONUS = 10.0
+SEARCH_CACHE_SIZE = 256
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of text"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _within_distance(a: str, b: str, limit: int) -> bool:
+    """True if the Levenshtein distance between a and b is at most limit"""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+def _typo_limit(token: str) -> int:
+    """Edits tolerated for a query token; short tokens must be spelled right"""
+    if len(token) < 4:
+        return 0
+    return 1 if len(token) < 8 else 2
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    name: str
+    score: float
+    info: Dict[str, Any]
+
+
+class WidgetCatalog:
+    """Widget library with precomputed category buckets and a token index.
+
+    Every widget's name, category, description, properties and use cases
+    are tokenized once into an inverted index. Queries then look up each word
+    exactly, as a prefix of indexed tokens (for completion as the user
+    types) and, failing that, within a small edit distance (for typos).
+    Widgets must match every query word; they are ranked by how well and
+    in which fields the words matched.
+
+    Widget packs can be added at runtime with register_pack(), and
+    installed packages can provide them through the "pygubuai.widget_packs"
+    entry point group.
+    """
+
+    def __init__(self, library: Optional[Dict[str, Dict]] = None, categories: Optional[Dict[str, str]] = None):
+        self.categories: Dict[str, str] = dict(CATEGORIES if categories is None else categories)
+        self.widgets: Dict[str, Dict[str, Any]] = {}
+        self.packs: Dict[str, List[str]] = {}
+        self._buckets: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._index: Dict[str, Dict[str, float]] = {}
+        self._tokens: List[str] = []
+        self._tokens_dirty = False
+        self._cache: "OrderedDict[Tuple[str, Optional[str], Optional[int]], List[SearchResult]]" = OrderedDict()
+        for name, info in (WIDGET_LIBRARY if library is None else library).items():
+            self._add(name, info)
+
+    def __len__(self) -> int:
+        return len(self.widgets)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.widgets
+
+    # Registration
+
+    def _add(self, name: str, info: Dict[str, Any]) -> None:
+        if "category" not in info or "description" not in info:
+            raise ValueError(f"Widget '{name}' needs a category and a description")
+        info = {"properties": [], "use_cases": [], **info}
+        if name in self.widgets:
+            self._remove(name)
+
+        self.widgets[name] = info
+        self._buckets.setdefault(info["category"], {})[name] = info
+        for field, weight in FIELD_WEIGHTS.items():
+            value = name if field == "name" else info.get(field, "")
+            text = " ".join(value) if isinstance(value, (list, tuple)) else str(value)
+            for token in tokenize(text):
+                postings = self._index.setdefault(token, {})
+                postings[name] = max(postings.get(name, 0.0), weight)
+        self._tokens_dirty = True
+        self._cache.clear()
+
+    def _remove(self, name: str) -> None:
+        info = self.widgets.pop(name)
+        self._buckets.get(info["category"], {}).pop(name, None)
+        for token in [t for t, postings in self._index.items() if name in postings]:
+            del self._index[token][name]
+            if not self._index[token]:
+                del self._index[token]
+        self._tokens_dirty = True
+        self._cache.clear()
+
+    def register(self, name: str, info: Dict[str, Any]) -> None:
+        """Add or replace one widget.
+
+        Args:
+            name: Widget class as used in .ui files, e.g. "customtkinter.CTkButton"
+            info: Dict with "category" and "description", and optionally
+                "properties" and "use_cases" lists
+        """
+        self._add(name, info)
+
+    def register_pack(
+        self, pack_name: str, widgets: Dict[str, Dict[str, Any]], categories: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Add a pack of third-party widgets, replacing an earlier pack of the same name.
+
+        Raises:
+            ValueError: If a widget lacks a category or description
+        """
+        for name in self.packs.pop(pack_name, []):
+            if name in self.widgets:
+                self._remove(name)
+        for category, description in (categories or {}).items():
+            self.categories.setdefault(category, description)
+        for name, info in widgets.items():
+            self._add(name, info)
+        self.packs[pack_name] = list(widgets)
+        logger.debug(f"Registered widget pack '{pack_name}' ({len(widgets)} widgets)")
+
+    def load_entry_point_packs(self) -> int:
+        """Register packs advertised by installed packages.
+
+        Each entry point must resolve to a dict with "widgets" and optionally
+        "categories", or to a callable returning one.
+
+        Returns:
+            Number of packs registered
+        """
+        from importlib.metadata import entry_points
+
+        installed = entry_points()
+        if hasattr(installed, "select"):
+            group = installed.select(group=ENTRY_POINT_GROUP)
+        else:
+            # Python 3.9 returns a dict of groups
+            group = installed.get(ENTRY_POINT_GROUP, [])
+
+        loaded = 0
+        for entry_point in group:
+            try:
+                pack = entry_point.load()
+                if callable(pack):
+                    pack = pack()
+                self.register_pack(entry_point.name, pack["widgets"], pack.get("categories"))
+                loaded += 1
+            except Exception as e:
+                logger.warning(f"Failed to load widget pack '{entry_point.name}': {e}")
+        return loaded
+
+    # Queries
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.widgets.get(name)
+
+    def by_category(self, category: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Widgets in a category (all widgets if category is None)"""
+        if category is None:
+            return dict(self.widgets)
+        return dict(self._buckets.get(category, {}))
+
+    def category_counts(self) -> Dict[str, int]:
+        """Number of widgets per known category"""
+        return {category: len(self._buckets.get(category, {})) for category in self.categories}
+
+    def _vocabulary(self) -> List[str]:
+        if self._tokens_dirty:
+            self._tokens = sorted(self._index)
+            self._tokens_dirty = False
+        return self._tokens
+
+    def _matches(self, token: str) -> Dict[str, float]:
+        """Widget scores for one query token: exact, then prefix, then fuzzy"""
+        vocabulary = self._vocabulary()
+        scores: Dict[str, float] = {}
+
+        def collect(indexed: str, quality: float) -> None:
+            for name, weight in self._index[indexed].items():
+                scores[name] = max(scores.get(name, 0.0), weight * quality)
+
+        if token in self._index:
+            collect(token, EXACT_MATCH)
+        start = bisect.bisect_left(vocabulary, token)
+        for indexed in vocabulary[start:]:
+            if not indexed.startswith(token):
+                break
+            if indexed != token:
+                # Closer completions score higher
+                collect(indexed, PREFIX_MATCH * len(token) / len(indexed))
+        if not scores:
+            limit = _typo_limit(token)
+            if limit:
+                for indexed in vocabulary:
+                    if _within_distance(token, indexed, limit):
+                        collect(indexed, FUZZY_MATCH)
+        return scores
+
+    def search(self, query: str, category: Optional[str] = None, limit: Optional[int] = None) -> List[SearchResult]:
+        """Widgets matching every word of query, best first.
+
+        Args:
+            query: Words to look for; the last may be a partial word
+            category: Only return widgets in this category
+            limit: Maximum number of results (default: all)
+        """
+        key = (query.strip().lower(), category, limit)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        tokens = tokenize(query)
+        results: List[SearchResult] = []
+        if tokens:
+            totals: Optional[Dict[str, float]] = None
+            for token in tokens:
+                scores = self._matches(token)
+                if totals is None:
+                    totals = scores
+                else:
+                    totals = {name: totals[name] + score for name, score in scores.items() if name in totals}
+                if not totals:
+                    break
+
+            needle = key[0]
+            for name, score in (totals or {}).items():
+                info = self.widgets[name]
+                if category is not None and info["category"] != category:
+                    continue
+                lowered = name.lower()
+                if lowered.startswith(needle) or lowered.split(".")[-1].startswith(needle):
+                    score += NAME_PREFIX_BONUS
+                results.append(SearchResult(name, round(score, 4), info))
+            results.sort(key=lambda r: (-r.score, r.name))
+            results = results[:limit]
+
+        self._cache[key] = results
+        if len(self._cache) > SEARCH_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return results
+
+
+_catalog: Optional[WidgetCatalog] = None
+
+
+def get_widget_catalog() -> WidgetCatalog:
+    """Process-wide catalog of built-in widgets plus installed widget packs"""
+    global _catalog
+    if _catalog is None:
+        _catalog = WidgetCatalog()
+        _catalog.load_entry_point_packs()
+    return _catalog
@@ -1,7 +1,16 @@
 """Widget detection, generation, and library browser"""
 
-from typing import List, Dict, Optional
-from .widget_data import WIDGET_LIBRARY, CATEGORIES
+import io
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from .generator import UIWriter
+from .matcher import KeywordMatch, KeywordMatcher
+from .widget_catalog import get_widget_catalog
 
 try:
     from rich.console import Console
@@ -20,15 +29,24 @@ WIDGET_PATTERNS = {
         "class": "ttk.Button",
         "properties": {"text": "Button", "command": "on_button_click"},
     },
-    "treeview": {"keywords": ["list", "table", "tree"], "class": "ttk.Treeview", "properties": {}, "expand": True},
+    "treeview": {
+        "keywords": ["list", "table", "tree", "treeview", "listbox"],
+        "class": "ttk.Treeview",
+        "properties": {},
+        "expand": True,
+    },
     "text": {
         "keywords": ["text area", "textarea", "multiline"],
         "class": "tk.Text",
         "properties": {"height": "10"},
         "expand": True,
     },
-    "combobox": {"keywords": ["dropdown", "select", "combo"], "class": "ttk.Combobox", "properties": {}},
-    "checkbutton": {"keywords": ["checkbox", "check"], "class": "ttk.Checkbutton", "properties": {"text": "Option"}},
+    "combobox": {"keywords": ["dropdown", "select", "combo", "combobox"], "class": "ttk.Combobox", "properties": {}},
+    "checkbutton": {
+        "keywords": ["checkbox", "check", "checkbutton"],
+        "class": "ttk.Checkbutton",
+        "properties": {"text": "Option"},
+    },
 }
 
 CONTEXT_PATTERNS = {
@@ -38,44 +56,220 @@ CONTEXT_PATTERNS = {
 }
 
 
+def _build_matcher() -> KeywordMatcher:
+    matcher = KeywordMatcher()
+    for context in CONTEXT_PATTERNS:
+        matcher.add(("context", context), context)
+    for widget_type, config in WIDGET_PATTERNS.items():
+        matcher.add(("widget", widget_type), *config["keywords"])
+    return matcher
+
+
+# Built once at import; extended by register_widget_keywords/register_context
+WIDGET_MATCHER = _build_matcher()
+
+
+def register_widget_keywords(widget_type: str, keywords: List[str], config: Optional[dict] = None) -> None:
+    """Teach detect_widgets new keywords, optionally for a new widget type.
+
+    Args:
+        widget_type: Key in WIDGET_PATTERNS
+        keywords: Words or phrases that indicate the widget
+        config: Pattern for a new widget type ("class", "properties", ...)
+    """
+    if config is not None:
+        WIDGET_PATTERNS[widget_type] = {**config, "keywords": list(config.get("keywords", []))}
+    elif widget_type not in WIDGET_PATTERNS:
+        raise ValueError(f"Unknown widget type '{widget_type}'; pass a config to add it")
+    pattern_keywords = WIDGET_PATTERNS[widget_type]["keywords"]
+    pattern_keywords.extend(k for k in keywords if k not in pattern_keywords)
+    WIDGET_MATCHER.add(("widget", widget_type), *pattern_keywords)
+
+
+def register_context(context: str, widget_types: List[str], keywords: Optional[List[str]] = None) -> None:
+    """Add a context whose keyword expands to a fixed widget list"""
+    unknown = [w for w in widget_types if w not in WIDGET_PATTERNS]
+    if unknown:
+        raise ValueError(f"Unknown widget types: {', '.join(unknown)}")
+    CONTEXT_PATTERNS[context] = list(widget_types)
+    WIDGET_MATCHER.add(("context", context), context, *(keywords or []))
+
+
+def find_widget_keywords(description: str) -> List[KeywordMatch]:
+    """Every context and widget keyword in description, with positions"""
+    return WIDGET_MATCHER.find_all(description)
+
+
 def detect_widgets(description):
     """Detect widgets from description"""
-    desc_lower = description.lower()
+    found = WIDGET_MATCHER.labels(description)
 
     for context, widget_list in CONTEXT_PATTERNS.items():
-        if context in desc_lower:
+        if ("context", context) in found:
             return [(w, WIDGET_PATTERNS[w]) for w in widget_list if w in WIDGET_PATTERNS]
 
-    widgets = []
-    for widget_type, config in WIDGET_PATTERNS.items():
-        if any(kw in desc_lower for kw in config["keywords"]):
-            widgets.append((widget_type, config))
+    widgets = [
+        (widget_type, config) for widget_type, config in WIDGET_PATTERNS.items() if ("widget", widget_type) in found
+    ]
 
     return widgets if widgets else [("label", WIDGET_PATTERNS["label"]), ("button", WIDGET_PATTERNS["button"])]
 
 
+# Confidence of a detection by how it was found
+KEYWORD_CONFIDENCE = 0.9
+CONTEXT_CONFIDENCE = 0.6
+DEFAULT_CONFIDENCE = 0.2
+# Added per extra mention of the same widget, up to MAX_CONFIDENCE
+REPEAT_BONUS = 0.03
+MAX_CONFIDENCE = 0.99
+
+
+@dataclass(frozen=True)
+class Detection:
+    """A widget detected in a description.
+
+    start/end delimit the keyword that triggered it (None for defaults),
+    and source is "keyword", "context" or "default".
+    """
+
+    widget_type: str
+    start: Optional[int]
+    end: Optional[int]
+    keyword: Optional[str]
+    confidence: float
+    source: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def detect_widgets_detailed(description: str) -> List[Detection]:
+    """Detect widgets like detect_widgets, with the span and confidence of each"""
+    matches = find_widget_keywords(description)
+
+    for context, widget_list in CONTEXT_PATTERNS.items():
+        context_match = next((m for m in matches if m.label == ("context", context)), None)
+        if context_match is not None:
+            span = (context_match.start, context_match.end, context_match.keyword)
+            return [Detection(w, *span, CONTEXT_CONFIDENCE, "context") for w in widget_list if w in WIDGET_PATTERNS]
+
+    by_widget: Dict[str, List[KeywordMatch]] = {}
+    for match in matches:
+        kind, name = match.label
+        if kind == "widget":
+            by_widget.setdefault(name, []).append(match)
+
+    detections = []
+    for widget_type in WIDGET_PATTERNS:
+        found = by_widget.get(widget_type)
+        if found:
+            first = found[0]
+            confidence = min(MAX_CONFIDENCE, KEYWORD_CONFIDENCE + REPEAT_BONUS * (len(found) - 1))
+            detections.append(Detection(widget_type, first.start, first.end, first.keyword, confidence, "keyword"))
+
+    if detections:
+        return detections
+    return [Detection(w, None, None, None, DEFAULT_CONFIDENCE, "default") for w in ("label", "button")]
+
+
+def _detect_many(descriptions: List[str]) -> List[List[Detection]]:
+    """Process pool worker: detect widgets for a chunk of descriptions"""
+    return [detect_widgets_detailed(description) for description in descriptions]
+
+
+class BatchDetector:
+    """Detect widgets for a stream of descriptions.
+
+    Descriptions are read in blocks. Identical descriptions are detected
+    once and then served from a bounded memo, and the remaining ones are
+    fanned out to a process pool in chunks. Results come back in input
+    order as soon as each block is done, so arbitrarily large corpora run
+    in constant memory.
+
+    Worker processes see keywords registered before the detector starts
+    on platforms that fork; elsewhere only the built-in tables apply.
+    """
+
+    def __init__(self, jobs: Optional[int] = None, chunk_size: int = 256, memo_size: int = 100_000):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.memo_size = memo_size
+        self.total = 0
+        self.computed = 0
+        self._memo: "OrderedDict[str, List[Detection]]" = OrderedDict()
+
+    def detect(self, descriptions: Iterable[str]) -> Iterator[List[Detection]]:
+        """Detections for each description, in order"""
+        executor = ProcessPoolExecutor(max_workers=self.jobs) if self.jobs > 1 else None
+        try:
+            for block in _blocks(descriptions, self.chunk_size * self.jobs):
+                # Resolve the whole block before trimming, so computing the
+                # misses cannot evict a hit that is yet to be served
+                results: Dict[str, List[Detection]] = {}
+                pending = []
+                for description in dict.fromkeys(block):
+                    hit = self._memo.get(description)
+                    if hit is None:
+                        pending.append(description)
+                    else:
+                        results[description] = hit
+                        self._memo.move_to_end(description)
+                results.update(self._compute(pending, executor))
+                while len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+                for description in block:
+                    self.total += 1
+                    yield results[description]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _compute(self, pending: List[str], executor: Optional[ProcessPoolExecutor]) -> Dict[str, List[Detection]]:
+        if not pending:
+            return {}
+        if executor is None or len(pending) <= self.chunk_size:
+            results = _detect_many(pending)
+        else:
+            chunks = [pending[i : i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+            results = [result for chunk in executor.map(_detect_many, chunks) for result in chunk]
+
+        self.computed += len(pending)
+        fresh = dict(zip(pending, results))
+        self._memo.update(fresh)
+        return fresh
+
+
+def _blocks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    block = []
+    for item in items:
+        block.append(item)
+        if len(block) >= size:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def detect_widgets_batch(descriptions: Iterable[str], jobs: Optional[int] = None) -> List[List[Detection]]:
+    """Detections for many descriptions (see BatchDetector for streaming)"""
+    return list(BatchDetector(jobs=jobs).detect(descriptions))
+
+
+def write_widget_xml(ui: UIWriter, widget_id: str, config: dict, child: Optional[bool] = None) -> None:
+    """Stream one widget, packed into the current container"""
+    with ui.object(config.get("class", "ttk.Label"), widget_id, child):
+        ui.properties(config.get("properties", {}))
+        if config.get("expand"):
+            ui.layout("pack", {"expand": "true", "fill": "both"})
+        else:
+            ui.layout("pack", {"pady": "5"})
+
+
 def generate_widget_xml(widget_type: str, widget_id: str, config: dict, index: int = 1) -> List[str]:
     """Generate XML for widget"""
-    xml = ["        <child>", f'          <object class="{config.get("class", "ttk.Label")}" id="{widget_id}">']
-
-    for prop, value in config.get("properties", {}).items():
-        xml.append(f'            <property name="{prop}">{value}</property>')
-
-    layout = '            <layout manager="pack">'
-    if config.get("expand"):
-        xml.extend(
-            [
-                layout,
-                '              <property name="expand">true</property>',
-                '              <property name="fill">both</property>',
-                "            </layout>",
-            ]
-        )
-    else:
-        xml.append(layout + '<property name="pady">5</property></layout>')
-
-    xml.extend(["          </object>", "        </child>"])
-    return xml
+    buffer = io.StringIO()
+    write_widget_xml(UIWriter(buffer, level=4), widget_id, config, child=True)
+    return buffer.getvalue().splitlines()
 
 
 def get_callbacks(widgets):
@@ -89,27 +283,96 @@ def get_callbacks(widgets):
 
 def list_widgets(category: Optional[str] = None) -> Dict[str, Dict]:
     """List all widgets, optionally filtered by category"""
-    if category:
-        return {name: info for name, info in WIDGET_LIBRARY.items() if info["category"] == category}
-    return WIDGET_LIBRARY
+    return get_widget_catalog().by_category(category)
 
 
-def search_widgets(query: str) -> Dict[str, Dict]:
-    """Search widgets by name or description"""
-    query_lower = query.lower() if isinstance(query, str) else str(query).lower()
-    results = {}
-    for name, info in WIDGET_LIBRARY.items():
-        name_str = name if isinstance(name, str) else str(name)
-        desc = info["description"]
-        desc_str = desc if isinstance(desc, str) else str(desc)
-        if query_lower in name_str.lower() or query_lower in desc_str.lower():
-            results[name] = info
-    return results
+def search_widgets(query: str, category: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Dict]:
+    """Search widgets by name, description, properties and use cases, best match first"""
+    return {result.name: result.info for result in get_widget_catalog().search(str(query), category, limit)}
 
 
 def get_widget_info(widget_name: str) -> Optional[Dict]:
     """Get detailed info about a specific widget"""
-    return WIDGET_LIBRARY.get(widget_name)
+    return get_widget_catalog().get(widget_name)
+
+
+def read_corpus(stream: TextIO, field: str = "description") -> Iterator[Tuple[Any, str]]:
+    """Stream (id, description) pairs from JSON lines.
+
+    A line is either a JSON string or an object holding the description in
+    field and an optional "id"; lines are numbered from 1 when there is no id.
+    Unusable lines are reported on stderr and skipped.
+    """
+    import sys
+
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"Warning: line {line_number}: invalid JSON ({e.msg})", file=sys.stderr)
+            continue
+        if isinstance(record, str):
+            yield line_number, record
+        elif isinstance(record, dict) and isinstance(record.get(field), str):
+            yield record.get("id", line_number), record[field]
+        else:
+            print(f"Warning: line {line_number}: no '{field}' text", file=sys.stderr)
+
+
+def _detect_main(args: List[str]) -> None:
+    """Handle pygubu-widgets detect"""
+    import argparse
+    import sys
+    from collections import deque
+
+    parser = argparse.ArgumentParser(prog="pygubu-widgets detect", description="Detect widgets in descriptions")
+    parser.add_argument("text", nargs="?", help="Single description (instead of --input)")
+    parser.add_argument("--input", "-i", help="JSON-lines corpus, or - for stdin")
+    parser.add_argument("--output", "-o", help="JSON-lines output file (default: stdout)")
+    parser.add_argument("--jobs", "-j", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--field", default="description", help="Object field holding the description")
+    parsed = parser.parse_args(args)
+
+    if parsed.input is None:
+        if not parsed.text:
+            parser.error("give a description or --input FILE")
+        for detection in detect_widgets_detailed(parsed.text):
+            print(json.dumps(detection.to_dict()))
+        return
+
+    try:
+        source = sys.stdin if parsed.input == "-" else open(parsed.input, encoding="utf-8")
+        out = open(parsed.output, "w", encoding="utf-8") if parsed.output else sys.stdout
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    ids: "deque[Any]" = deque()
+
+    def descriptions() -> Iterator[str]:
+        for record_id, description in read_corpus(source, parsed.field):
+            ids.append(record_id)
+            yield description
+
+    detector = BatchDetector(jobs=parsed.jobs)
+    start = time.perf_counter()
+    try:
+        for detections in detector.detect(descriptions()):
+            record = {"id": ids.popleft(), "widgets": [d.to_dict() for d in detections]}
+            out.write(json.dumps(record) + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Detected widgets in {detector.total} descriptions ({detector.computed} unique) in {elapsed:.2f}s",
+        file=sys.stderr,
+    )
 
 
 def main():
@@ -123,6 +386,8 @@ def main():
         print("  search <query>           - Search widgets")
         print("  info <widget>            - Show widget details")
         print("  categories               - List all categories")
+        print("  detect <text>            - Detect widgets in a description")
+        print("  detect --input <corpus.jsonl> [--jobs N] [--output <file>]")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -136,7 +401,8 @@ def main():
 
         if RICH_AVAILABLE:
             console = Console()
-            title = f"{CATEGORIES.get(category, category)} Widgets" if category else "All Available Widgets"
+            categories = get_widget_catalog().categories
+            title = f"{categories.get(category, category)} Widgets" if category else "All Available Widgets"
             table = Table(title=title)
             table.add_column("Widget", style="cyan", no_wrap=True)
             table.add_column("Description", style="white")
@@ -149,7 +415,7 @@ def main():
             console.print(f"\nTotal: {len(widgets)} widgets", style="bold green")
         else:
             if category:
-                print(f"\n{CATEGORIES.get(category, category)} Widgets:\n")
+                print(f"\n{get_widget_catalog().categories.get(category, category)} Widgets:\n")
             else:
                 print("\nAll Available Widgets:\n")
 
@@ -166,7 +432,7 @@ def main():
         results = search_widgets(query)
 
         print(f"\nSearch results for '{query}':\n")
-        for name, info in sorted(results.items()):
+        for name, info in results.items():
             print(f"  {name:20} - {info['description']}")
         print(f"\nFound: {len(results)} widgets")
 
@@ -202,11 +468,14 @@ def main():
             for use_case in info["use_cases"]:
                 print(f"  • {use_case}")
 
+    elif command == "detect":
+        _detect_main(sys.argv[2:])
+
     elif command == "categories":
         print("\nWidget Categories:\n")
-        for cat, desc in CATEGORIES.items():
-            count = len([w for w in WIDGET_LIBRARY.values() if w["category"] == cat])
-            print(f"  {cat:12} - {desc} ({count} widgets)")
+        catalog = get_widget_catalog()
+        for cat, count in catalog.category_counts().items():
+            print(f"  {cat:12} - {catalog.categories[cat]} ({count} widgets)")
 
     else:
         print("Unknown command: " + command)
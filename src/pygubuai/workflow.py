@@ -7,11 +7,14 @@ import pathlib
 import hashlib
 import logging
 import argparse
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from .registry import Registry
 from .errors import ProjectNotFoundError
 from .config import Config
+from .uidiff import UIDiff, diff_trees, format_diff, parse_ui
+from .event_writer import EventWriter, get_event_writer
 
 try:
     from pydantic import ValidationError
@@ -24,6 +27,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Last parsed widget tree per watched .ui file, used to describe changes.
+# Cleared when a watch starts and capped, least recently checked first out.
+_ui_trees: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+MAX_UI_TREES = 1000
+
 
 def get_file_hash(filepath: pathlib.Path) -> Optional[str]:
     """Get SHA256 hash of file"""
@@ -224,6 +232,8 @@ def watch_project(project_name: str, interval: Optional[float] = None) -> None:
     print("\nPress Ctrl+C to stop\n")
 
     workflow = load_workflow(project_path)
+    writer = get_event_writer()
+    _ui_trees.clear()
     error_count = 0
     MAX_ERRORS = 5  # Circuit breaker threshold
 
@@ -232,7 +242,7 @@ def watch_project(project_name: str, interval: Optional[float] = None) -> None:
             try:
                 # Rescan files in each loop to detect new/deleted files
                 current_files = {f for p in patterns for f in project_path.glob(p)}
-                _check_ui_changes(list(current_files), workflow, project_path, project_name)
+                _check_ui_changes(list(current_files), workflow, project_path, project_name, writer)
 
                 # Reset error count on success
                 error_count = 0
@@ -263,12 +273,24 @@ def watch_project(project_name: str, interval: Optional[float] = None) -> None:
 
     except KeyboardInterrupt:
         print("\n\nStopped watching")
+    finally:
+        if writer is not None:
+            writer.flush(timeout=10.0)
 
 
 def _check_ui_changes(
-    ui_files: List[pathlib.Path], workflow: Dict[str, Any], project_path: pathlib.Path, project_name: str
+    ui_files: List[pathlib.Path],
+    workflow: Dict[str, Any],
+    project_path: pathlib.Path,
+    project_name: str,
+    writer: Optional[EventWriter] = None,
 ) -> None:
-    """Check UI files for changes and update workflow"""
+    """Check UI files for changes and update workflow.
+
+    With a writer, the workflow file is saved and the event recorded to the
+    database in the background; otherwise the file is saved synchronously.
+    """
+    persist = writer.save_workflow if writer is not None else save_workflow
     for ui_file in ui_files:
         if not ui_file.exists():
             continue
@@ -282,12 +304,20 @@ def _check_ui_changes(
         if current_hash is None:
             continue
 
+        # Remember the current tree as the baseline for later edits, but
+        # only if it is the version the workflow already knows about
+        baseline_missing = str(ui_file) not in _ui_trees and ui_file.suffix == ".ui"
+        if baseline_missing and (prev_hash is None or current_hash == prev_hash):
+            _diff_ui_file(ui_file)
+            baseline_missing = False
+
         if prev_hash is None:
             workflow["file_hashes"][file_key] = current_hash
             workflow.setdefault("file_mtimes", {})[file_key] = current_mtime
-            save_workflow(project_path, workflow)
+            persist(project_path, workflow)
         elif current_hash != prev_hash:
-            _notify_ui_change(ui_file, project_name)
+            diff = _diff_ui_file(ui_file)
+            _notify_ui_change(ui_file, project_name, diff)
             workflow["file_hashes"][file_key] = current_hash
             workflow.setdefault("file_mtimes", {})[file_key] = current_mtime
 
@@ -296,20 +326,57 @@ def _check_ui_changes(
             if len(workflow["history"]) >= 99:
                 workflow["history"] = workflow["history"][-98:]
 
-            workflow["history"].append(
-                {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "action": "file_changed",
-                    "description": f"File {ui_file.name} changed",
-                }
-            )
-            save_workflow(project_path, workflow)
+            event: Dict[str, Any] = {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "action": "file_changed",
+                "description": f"File {ui_file.name} changed",
+            }
+            if diff is not None:
+                event["description"] += f": {diff.summary()}"
+                event["changes"] = diff.to_dict()
+            elif baseline_missing:
+                event["description"] += " (previous version unavailable, widget changes not recorded)"
+            workflow["history"].append(event)
+            persist(project_path, workflow)
+            if writer is not None:
+                writer.submit_event(
+                    project_name, project_path, event["action"], event["description"], event["timestamp"]
+                )
+
+
+def _diff_ui_file(ui_file: pathlib.Path) -> Optional[UIDiff]:
+    """Diff a UI file against the tree seen on the previous check.
+
+    Returns None for non-UI files, unparseable files and the first sighting.
+    """
+    if ui_file.suffix != ".ui":
+        return None
 
+    key = str(ui_file)
+    try:
+        tree = parse_ui(ui_file)
+    except Exception as e:
+        logger.debug(f"Cannot parse {ui_file.name} for diff: {e}")
+        return None
 
-def _notify_ui_change(ui_file: pathlib.Path, project_name: str) -> None:
+    previous = _ui_trees.pop(key, None)
+    _ui_trees[key] = tree
+    while len(_ui_trees) > MAX_UI_TREES:
+        _ui_trees.popitem(last=False)
+    return diff_trees(previous, tree) if previous is not None else None
+
+
+def _notify_ui_change(ui_file: pathlib.Path, project_name: str, diff: Optional[UIDiff] = None) -> None:
     """Print notification when UI file changes"""
     print(f" UI changed: {ui_file.name}")
     print(f"   Time: {datetime.now(timezone.utc).strftime('%H:%M:%S')}")
+    if diff is not None:
+        lines = format_diff(diff).splitlines()
+        if len(lines) > 22:
+            lines = lines[:20] + [f"... {len(lines) - 22} more", "", lines[-1]]
+        print("\nChanges:")
+        for line in lines:
+            print(f"   {line}")
     print("\nSuggested action:")
     print(f"   Tell your AI: 'I updated {ui_file.name}, sync the Python code'")
     print(f"   Or: 'Review changes in {project_name}'\n")
@@ -378,6 +445,11 @@ class WorkflowTracker:
 
         save_workflow(self.project_path, workflow)
 
+        writer = get_event_writer()
+        if writer is not None:
+            project_name = workflow.get("project") or self.project_path.name
+            writer.submit_event(project_name, self.project_path, action, description, event["timestamp"])
+
     def get_history(self) -> List[Any]:
         """Get workflow history"""
         workflow = load_workflow(self.project_path)
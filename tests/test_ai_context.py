@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Tests for AI context generation"""
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai import db  # noqa: E402
+from pygubuai.ai_context import ContextBuilder, format_for_ai  # noqa: E402
+from pygubuai.registry import Registry  # noqa: E402
+
+UI = """<?xml version='1.0' encoding='utf-8'?>
+<interface version="1.2">
+  <object class="tk.Toplevel" id="mainwindow">
+    <child>
+      <object class="ttk.Frame" id="mainframe">
+        {children}
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+BUTTON = '<child><object class="ttk.Button" id="button_{0}"><property name="command">on_{0}</property></object></child>'
+
+
+class ProjectTestCase(unittest.TestCase):
+    """Registers a temporary project with a generated UI file"""
+
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        env = {"HOME": str(self.temp_dir), "PYGUBUAI_DB_PATH": str(self.temp_dir / "pygubuai.db")}
+        patcher = patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # CACHE_DIR is fixed at import, so HOME alone does not cover generate_context
+        cache_patcher = patch("pygubuai.cache.CACHE_DIR", self.temp_dir / "cache")
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        # The engine is created lazily; drop any that points at another test's database
+        db.close_db()
+        self.addCleanup(db.close_db)
+
+        self.project_dir = self.temp_dir / "ctxapp"
+        self.project_dir.mkdir()
+        self.ui_file = self.project_dir / "ctxapp.ui"
+        self.write_ui(3)
+        Registry().add_project("ctxapp", str(self.project_dir))
+
+    def write_ui(self, buttons):
+        self.ui_file.write_text(UI.format(children="".join(BUTTON.format(i) for i in range(buttons))))
+
+    def builder(self):
+        return ContextBuilder("ctxapp", cache_dir=self.temp_dir / "cache")
+
+
+class TestContextBuilder(ProjectTestCase):
+    def test_build_context(self):
+        """Test widgets, callbacks and metrics are extracted"""
+        context = self.builder().build()
+        self.assertEqual(context["metrics"], {"widget_count": 5, "callback_count": 3})
+        self.assertEqual(context["callbacks"], ["on_0", "on_1", "on_2"])
+        self.assertEqual(context["widgets"][2], {"id": "button_0", "class": "ttk.Button", "parent": "mainframe"})
+
+    def test_unchanged_ui_is_not_reparsed(self):
+        """Test cached sections are reused while the UI file is unchanged"""
+        self.builder().build()
+        with patch("pygubuai.ai_context._parse_ui_file") as parse:
+            self.builder().build()
+            parse.assert_not_called()
+
+    def test_delta_only_emits_changed_sections(self):
+        """Test sections already handed to the assistant are skipped"""
+        builder = self.builder()
+        context = builder.build()
+        self.assertIn("widgets", context["changed"])
+        builder.mark_emitted(context)
+
+        context = self.builder().build()
+        self.assertEqual(context["changed"], [])
+        text = format_for_ai(context, only_changed=True)
+        self.assertNotIn("## Widgets", text)
+        self.assertIn("Unchanged since last context: metrics, callbacks, widgets", text)
+
+        self.write_ui(4)
+        os.utime(self.ui_file, ns=(1, 1))
+        context = self.builder().build()
+        self.assertIn("widgets", context["changed"])
+        self.assertIn("button_3", format_for_ai(context, only_changed=True))
+
+    def test_token_budget_truncates_low_priority_sections(self):
+        """Test packing stops at the budget, highest priority first"""
+        self.write_ui(200)
+        context = self.builder().build()
+
+        full = format_for_ai(context, token_budget=100000)
+        self.assertIn("button_199", full)
+
+        small = format_for_ai(context, token_budget=120)
+        self.assertIn("## Metrics", small)
+        self.assertIn("more", small)
+        self.assertNotIn("button_199", small)
+        self.assertLess(len(small), len(full))
+
+    def test_sections_cut_by_budget_are_sent_again(self):
+        """Test only sections written in full count as handed to the assistant"""
+        self.write_ui(200)
+        builder = self.builder()
+        context = builder.build()
+        format_for_ai(context, token_budget=120)
+        self.assertIn("metrics", context["emitted_sections"])
+        self.assertNotIn("widgets", context["emitted_sections"])
+        builder.mark_emitted(context)
+
+        context = self.builder().build()
+        self.assertIn("widgets", context["changed"])
+        self.assertNotIn("metrics", context["changed"])
+        self.assertIn("button_199", format_for_ai(context, token_budget=100000, only_changed=True))
+
+
+class TestQueryBatch(ProjectTestCase):
+    def test_batch_parses_project_once(self):
+        """Test many queries share one snapshot"""
+        from pygubuai import snapshot
+        from pygubuai.ai_query import query_batch
+
+        with patch.object(snapshot, "parse_ui", wraps=snapshot.parse_ui) as parse:
+            answers = query_batch("ctxapp", ["How many widgets?", "What callbacks?", "layout?", "gibberish"])
+            self.assertEqual(parse.call_count, 1)
+        self.assertTrue((self.temp_dir / "cache" / "context_ctxapp.json").exists())
+
+        self.assertEqual(answers[0], "Total widgets: 5")
+        self.assertIn("on_2", answers[1])
+        self.assertIn("I don't understand", answers[3])
+
+    def test_missing_project(self):
+        """Test queries against an unknown project report an error"""
+        from pygubuai.ai_query import query_project
+
+        self.assertIn("not found", query_project("nope", "How many widgets?"))
+
+
+if __name__ == "__main__":
+    unittest.main()
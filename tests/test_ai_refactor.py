@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Tests for refactoring suggestions"""
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.ai_refactor import FleetSummary, Suggestion, analyze_fleet  # noqa: E402
+
+UI = """<interface version="1.2">
+  <object class="tk.Toplevel" id="mainwindow">
+    <child><object class="ttk.Frame" id="mainframe">{children}</object></child>
+  </object>
+</interface>
+"""
+ENTRY = '<child><object class="ttk.Entry" id="entry_{0}"><layout manager="pack" /></object></child>'
+
+
+def make_project(base: pathlib.Path, name: str, entries: int) -> str:
+    path = base / name
+    path.mkdir()
+    (path / f"{name}.ui").write_text(UI.format(children="".join(ENTRY.format(i) for i in range(entries))))
+    (path / f"{name}.py").write_text('"""App"""\n')
+    return str(path)
+
+
+class TestFleetAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.base = pathlib.Path(tempfile.mkdtemp())
+        self.projects = {
+            "alpha": make_project(self.base, "alpha", 2),
+            "beta": make_project(self.base, "beta", 1),
+            "gamma": make_project(self.base, "gamma", 0),
+        }
+
+    def test_fleet_matches_sequential(self):
+        """Test the process pool gives the same summary as in-process runs"""
+        parallel = analyze_fleet(self.projects, jobs=2)
+        sequential = analyze_fleet(self.projects, jobs=1)
+
+        self.assertEqual(parallel.projects, ["alpha", "beta", "gamma"])
+        self.assertEqual(parallel.columns, sequential.columns)
+        self.assertEqual(parallel.projects_for("add_labels"), ["alpha", "beta"])
+        self.assertEqual(parallel.projects_for("add_handlers"), ["alpha", "beta", "gamma"])
+
+    def test_missing_project_dir_has_no_ui_suggestions(self):
+        """Test a project without files is still analyzed"""
+        summary = analyze_fleet({"ghost": str(self.base / "ghost")}, jobs=1)
+        self.assertEqual(summary.projects, ["ghost"])
+        self.assertNotIn("add_labels", summary.columns)
+
+    def test_rank_weights_impact(self):
+        """Test ranking multiplies project count by impact"""
+        summary = FleetSummary()
+        low = Suggestion("low", "quality", "Low", "", "low", "low", False)
+        high = Suggestion("high", "quality", "High", "", "high", "low", False)
+        summary.add("a", [low, high])
+        summary.add("b", [low, high])
+        summary.add("c", [low])
+
+        self.assertEqual(summary.rank(), [("high", 2, 6), ("low", 3, 3)])
+        self.assertEqual(summary.rank(top=1), [("high", 2, 6)])
+        self.assertEqual(summary.to_dict()["suggestions"]["low"]["projects"], ["a", "b", "c"])
+
+    def test_descriptions_kept_per_project(self):
+        """Test each project keeps its own description of a shared suggestion"""
+        summary = FleetSummary()
+        for name, count in (("a", 3), ("b", 7)):
+            summary.add(name, [Suggestion("labels", "a11y", "Labels", f"Found {count} entries", "high", "low", True)])
+
+        self.assertEqual(summary.details["labels"].description, "")
+        entry = summary.to_dict()["suggestions"]["labels"]
+        self.assertEqual(entry["descriptions"], {"a": "Found 3 entries", "b": "Found 7 entries"})
+        self.assertEqual(entry["description"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
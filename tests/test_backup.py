@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Tests for project snapshot backups"""
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.backup import (  # noqa: E402
+    RetentionPolicy,
+    create_backup,
+    get_store,
+    list_backups,
+    load_manifest,
+    restore_backup,
+)
+
+
+class TestSnapshotBackups(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.project = self.temp_dir / "app"
+        (self.project / "assets").mkdir(parents=True)
+        (self.project / "app.ui").write_text("<interface />")
+        (self.project / "app.py").write_text("print('hi')\n")
+        (self.project / "assets" / "logo.txt").write_text("logo")
+        (self.project / ".git").mkdir()
+        (self.project / ".git" / "HEAD").write_text("ref: refs/heads/main")
+
+    def objects(self):
+        return sorted(p.name for p in get_store(self.project).objects_dir.rglob("*") if p.is_file())
+
+    def test_snapshots_share_unchanged_content(self):
+        """Test unchanged files are stored once and VCS metadata is skipped"""
+        first = create_backup(self.project)
+        self.assertEqual(len(self.objects()), 3)
+        self.assertNotIn(".git/HEAD", load_manifest(first)["files"])
+
+        (self.project / "app.py").write_text("print('bye')\n")
+        second = create_backup(self.project)
+        self.assertEqual(len(self.objects()), 4)
+        self.assertEqual(
+            load_manifest(first)["files"]["app.ui"]["hash"], load_manifest(second)["files"]["app.ui"]["hash"]
+        )
+
+    def test_restore_only_touches_differences(self):
+        """Test restore rewrites changed files and removes files added since"""
+        manifest = create_backup(self.project)
+        (self.project / "app.py").write_text("broken")
+        (self.project / "assets" / "logo.txt").unlink()
+        (self.project / "notes.txt").write_text("scratch")
+
+        store = get_store(self.project)
+        stats = store.restore(manifest, self.project)
+        self.assertEqual(stats, {"restored": 2, "unchanged": 1, "removed": 1})
+        self.assertEqual((self.project / "app.py").read_text(), "print('hi')\n")
+        self.assertEqual((self.project / "assets" / "logo.txt").read_text(), "logo")
+        self.assertFalse((self.project / "notes.txt").exists())
+        self.assertTrue((self.project / ".git" / "HEAD").exists())
+
+        self.assertTrue(restore_backup(manifest, self.temp_dir / "copy"))
+        self.assertEqual((self.temp_dir / "copy" / "app.ui").read_text(), "<interface />")
+
+    def test_list_backups_newest_first(self):
+        """Test listing matches the project exactly, newest first"""
+        other = self.temp_dir / "app_two"
+        other.mkdir()
+        (other / "x.ui").write_text("<interface />")
+        create_backup(other)
+        first = create_backup(self.project)
+        second = create_backup(self.project)
+
+        backups = list_backups("app", self.temp_dir / ".pygubuai_backups")
+        self.assertEqual(backups, [second, first])
+
+
+class TestBackupCatalog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.project = self.temp_dir / "app"
+        self.project.mkdir()
+        (self.project / "shared.txt").write_text("same in every snapshot")
+        self.store = get_store(self.project)
+        self.keep_all = RetentionPolicy(keep_last=100)
+
+    def count_objects(self):
+        return sum(1 for p in self.store.objects_dir.rglob("*") if p.is_file())
+
+    def snapshot(self, version):
+        (self.project / "app.ui").write_text(f"<interface version='{version}' />")
+        return self.store.create(self.project, policy=self.keep_all)
+
+    def test_retention_thinning(self):
+        """Test keep-last plus newest-per-hour/day selection"""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        entries = [
+            {"id": f"s{i:03d}", "created": (start + timedelta(minutes=30 * i)).isoformat()} for i in range(240)
+        ]
+        keep = RetentionPolicy(keep_last=2, hourly=3, daily=3, weekly=0).select(entries)
+        # Newest two, newest of the last three hours, newest of the last three days
+        self.assertEqual(keep, {"s239", "s238", "s237", "s235", "s191", "s143"})
+
+    def test_prune_releases_unreferenced_objects(self):
+        """Test pruning removes old manifests and only their unique objects"""
+        first = self.snapshot(1)
+        self.snapshot(2)
+        third = self.snapshot(3)
+        self.assertEqual(self.count_objects(), 4)
+
+        removed = self.store.prune("app", RetentionPolicy(keep_last=1, hourly=0, daily=0, weekly=0))
+        self.assertEqual(len(removed), 2)
+        self.assertFalse(first.exists())
+        self.assertEqual(self.count_objects(), 2)
+        catalog = self.store.catalog("app")
+        self.assertEqual([(e["id"], e["parent"]) for e in catalog], [(third.stem, None)])
+        self.assertTrue(restore_backup(third, self.temp_dir / "restored"))
+        self.assertEqual((self.temp_dir / "restored" / "shared.txt").read_text(), "same in every snapshot")
+
+    def test_catalog_rebuilt_for_existing_store(self):
+        """Test stores without a catalog, including legacy copies, are indexed once"""
+        self.snapshot(1)
+        second = self.snapshot(2)
+        shutil.rmtree(self.store.catalog_dir)
+        self.store.refs_file.unlink()
+        shutil.copytree(self.project, self.store.root / "app_20250101_120000")
+
+        catalog = self.store.catalog("app")
+        self.assertEqual([e.get("legacy", False) for e in catalog], [True, False, False])
+        self.assertEqual(catalog[-1]["id"], second.stem)
+        self.assertEqual(catalog[-1]["files"], 2)
+        self.assertEqual(self.store._load_refs()[load_manifest(second)["files"]["shared.txt"]["hash"]], 2)
+
+    def test_legacy_copies_survive_automatic_retention(self):
+        """Test only an explicit prune removes legacy full copies"""
+        legacy = self.store.root / "app_20250101_120000"
+        shutil.copytree(self.project, legacy)
+        only_latest = RetentionPolicy(keep_last=1, hourly=0, daily=0, weekly=0)
+        self.store.create(self.project, policy=only_latest)
+        latest = self.store.create(self.project, policy=only_latest)
+
+        self.assertEqual([e["id"] for e in self.store.catalog("app")], [legacy.name, latest.stem])
+        self.assertTrue(legacy.exists())
+
+        removed = self.store.prune("app", only_latest, include_legacy=True)
+        self.assertEqual([e["id"] for e in removed], [legacy.name])
+        self.assertFalse(legacy.exists())
+
+    def test_create_restores_object_pruned_concurrently(self):
+        """Test an object deleted between reuse and recording refs is stored again"""
+        first = self.snapshot(1)
+        digest = load_manifest(first)["files"]["shared.txt"]["hash"]
+        locked = self.store._locked
+
+        def prune_then_lock():
+            # What a concurrent prune of the only other reference would do
+            self.store.object_path(digest).unlink(missing_ok=True)
+            return locked()
+
+        with mock.patch.object(self.store, "_locked", side_effect=prune_then_lock):
+            second = self.store.create(self.project, policy=self.keep_all)
+
+        self.assertEqual(load_manifest(second)["files"]["shared.txt"]["hash"], digest)
+        self.assertTrue(self.store.object_path(digest).exists())
+        self.assertTrue(restore_backup(second, self.temp_dir / "restored"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Tests for the tkinter-to-pygubu converter"""
+import pathlib
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.converter import convert_directory, convert_source  # noqa: E402
+
+SAMPLE = textwrap.dedent(
+    """
+    import tkinter as tk
+    from tkinter import ttk
+
+    root = tk.Tk()
+    root.title("Login & more")
+    name = tk.StringVar()
+    frame = ttk.Frame(root, padding=10)
+    frame.pack(fill=tk.BOTH, expand=True)
+    ttk.Label(frame, text="Name:").grid(row=0, column=0)
+    entry = ttk.Entry(frame, textvariable=name)
+    entry.grid(row=0, column=1, padx=(5, 0))
+    ok = tk.Button(frame, text="OK", command=on_ok)
+    ok.grid(row=1, column=1)
+    ok.config(width=8)
+    """
+)
+
+
+class TestConvertSource(unittest.TestCase):
+    def test_widget_tree(self):
+        """Test constructors, layout calls and commands become a widget tree"""
+        result = convert_source(SAMPLE)
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["callbacks"], ["on_ok"])
+
+        (window,) = result["widgets"]
+        self.assertEqual((window["class"], window["id"]), ("tk.Toplevel", "root"))
+        self.assertEqual(window["properties"]["title"], "Login & more")
+        (frame,) = window["children"]
+        self.assertEqual(frame["layout"], {"manager": "pack", "properties": {"fill": "both", "expand": "true"}})
+        label, entry, ok = frame["children"]
+        self.assertEqual((label["class"], label["id"]), ("ttk.Label", "label1"))
+        self.assertEqual(entry["properties"]["textvariable"], "string:name")
+        self.assertEqual(entry["layout"]["properties"]["padx"], "5 0")
+        self.assertEqual(ok["properties"], {"text": "OK", "command": "on_ok", "width": "8"})
+
+    def test_orphans_and_errors(self):
+        """Test widgets with unknown parents get a main window; bad source is reported"""
+        source = "from tkinter import *\nButton(self, text='Go', command=self.go).pack(side=LEFT)\n"
+        (window,) = convert_source(source)["widgets"]
+        self.assertEqual(window["id"], "mainwindow")
+        self.assertEqual(window["children"][0]["layout"]["properties"], {"side": "left"})
+
+        self.assertIn("SyntaxError", convert_source("def (:")["error"])
+        self.assertEqual(convert_source("import os\n")["widgets"], [])
+
+
+class TestConvertDirectory(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.src = self.temp_dir / "legacy"
+        (self.src / "screens").mkdir(parents=True)
+        for i in range(4):
+            (self.src / "screens" / f"screen{i}.py").write_text(SAMPLE.replace("OK", f"OK {i}"))
+        (self.src / "util.py").write_text("import os\n")
+        self.out = self.temp_dir / "ui"
+        self.cache = self.temp_dir / "cache"
+
+    def test_parallel_conversion_with_cache(self):
+        """Test a directory converts in a pool and unchanged sources come from the cache"""
+        first = convert_directory(self.src, self.out, jobs=2, cache_dir=self.cache)
+        self.assertEqual(len(first.converted), 4)
+        self.assertEqual(first.no_widgets, [self.src / "util.py"])
+        self.assertEqual(first.cached, 0)
+        root = ET.parse(self.out / "screens" / "screen3.ui").getroot()
+        self.assertEqual(root.find(".//object[@id='ok']/property[@name='text']").text, "OK 3")
+
+        (self.src / "screens" / "screen0.py").write_text(SAMPLE.replace("OK", "Submit"))
+        second = convert_directory(self.src, self.out, jobs=2, cache_dir=self.cache)
+        self.assertEqual(second.cached, 4)
+        self.assertEqual(second.converted, [self.out / "screens" / "screen0.ui"])
+        self.assertEqual(len(second.unchanged), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
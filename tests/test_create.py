@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """Tests for pygubu-create functionality"""
+import json
 import unittest
 import tempfile
 import pathlib
@@ -43,5 +44,56 @@ class TestProjectCreation(unittest.TestCase):
         self.assertTrue(len(xml) > 0)
 
 
+class TestBulkCreation(unittest.TestCase):
+    def setUp(self):
+        import shutil
+
+        from pygubuai.registry import Registry
+
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        Registry.REGISTRY_FILE = self.temp_dir / "registry.json"
+        self.addCleanup(setattr, Registry, "REGISTRY_FILE", None)
+        Registry()
+
+    def test_manifest_projects_created_and_registered_once(self):
+        """Test a manifest creates every project, registers them in one write and reports timing"""
+        from unittest import mock
+
+        from pygubuai.create import create_projects_bulk, load_manifest
+        from pygubuai.registry import Registry
+
+        manifest = self.temp_dir / "fleet.jsonl"
+        lines = [json.dumps({"name": f"app{i}", "description": "form with entry and button"}) for i in range(8)]
+        lines += ["", json.dumps({"name": "login_app", "template": "login", "tags": ["auth"]})]
+        lines.append(json.dumps({"name": "app0", "description": "duplicate"}))
+        manifest.write_text("\n".join(lines))
+
+        specs = load_manifest(manifest)
+        out = self.temp_dir / "projects"
+        with mock.patch.object(Registry, "_write", autospec=True, side_effect=Registry._write) as write:
+            results = create_projects_bulk(specs, parent=out, jobs=4, skip_validation=True)
+        self.assertEqual(write.call_count, 1)
+
+        self.assertEqual([r.ok for r in results], [True] * 9 + [False])
+        self.assertIn("duplicate", results[-1].error)
+        self.assertTrue(all(r.seconds > 0 for r in results[:9]))
+        self.assertTrue((out / "app7" / "app7.ui").exists())
+        self.assertIn("on_login", (out / "login_app" / "login_app.py").read_text())
+
+        projects = Registry().list_projects_with_metadata()
+        self.assertEqual(len(projects), 9)
+        self.assertEqual(projects["login_app"]["tags"], ["auth"])
+
+    def test_manifest_errors(self):
+        """Test malformed manifest lines are reported with their line number"""
+        from pygubuai.create import load_manifest
+
+        manifest = self.temp_dir / "bad.jsonl"
+        manifest.write_text('{"name": "ok", "description": "x"}\n{"name": "missing"}\n')
+        with self.assertRaisesRegex(ValueError, "bad.jsonl:2"):
+            load_manifest(manifest)
+
+
 if __name__ == "__main__":
     unittest.main()
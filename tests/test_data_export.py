@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Tests for generated data export code"""
+import csv
+import json
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+from collections import deque
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.data_export import (  # noqa: E402
+    PYARROW_AVAILABLE,
+    _create_export_method,
+    add_export_capability,
+    insert_export_code,
+)
+from pygubuai.generator import generate_python_app_structure  # noqa: E402
+
+ROWS = 5000
+
+
+class FakeTree:
+    def __getitem__(self, key):
+        return ("id", "name")
+
+    def get_children(self):
+        return tuple(range(ROWS))
+
+    def item(self, item, option):
+        return (item, f"row {item}")
+
+
+class FakeMainwindow:
+    """Runs after() callbacks from a queue instead of a Tk mainloop"""
+
+    def __init__(self):
+        self.pending = deque()
+        self.turns = 0
+
+    def after(self, ms, func, *args):
+        self.pending.append((func, args))
+
+    def after_idle(self, func, *args):
+        self.pending.append((func, args))
+
+    def mainloop(self):
+        while self.pending:
+            func, args = self.pending.popleft()
+            self.turns += 1
+            func(*args)
+
+
+class FakeBuilder:
+    def __init__(self):
+        self.objects = {"table": FakeTree(), "export_progress": {}}
+
+    def get_object(self, object_id):
+        return self.objects[object_id]
+
+
+def generated_app(formats, background=False):
+    """Class built from the generated export code, wired to fakes"""
+    source = "class App:\n" + _create_export_method(formats, "table", background, chunk_size=1000) + "\n"
+    namespace = {}
+    exec(compile(source, "<generated>", "exec"), namespace)
+
+    class App(namespace["App"]):
+        def __init__(self):
+            self.builder = FakeBuilder()
+            self.mainwindow = FakeMainwindow()
+            self.outcome = None
+
+        def _on_export_done(self, filename, rows, error):
+            self.outcome = (rows, error)
+
+    return App()
+
+
+class TestGeneratedExport(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def export(self, filename, background=False):
+        app = generated_app(["csv", "json", "jsonl"], background)
+        app.start_export(str(self.temp_dir / filename))
+        app.mainwindow.mainloop()
+        self.assertEqual(app.outcome, (ROWS, None))
+        # One event-loop turn per chunk, plus starting and finishing
+        self.assertGreaterEqual(app.mainwindow.turns, ROWS // app.EXPORT_CHUNK_SIZE)
+        self.assertEqual(app.builder.objects["export_progress"], {"maximum": ROWS, "value": ROWS})
+        return self.temp_dir / filename
+
+    def test_csv_streams_in_chunks(self):
+        """Test CSV export writes the header and every row"""
+        with open(self.export("rows.csv"), newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["id", "name"])
+        self.assertEqual(rows[-1], [str(ROWS - 1), f"row {ROWS - 1}"])
+        self.assertEqual(len(rows), ROWS + 1)
+
+    def test_json_formats_in_background(self):
+        """Test JSON and JSON-lines written from the writer thread"""
+        records = json.loads(self.export("rows.json", background=True).read_text())
+        self.assertEqual(records[1], {"id": 1, "name": "row 1"})
+        self.assertEqual(len(records), ROWS)
+
+        lines = self.export("rows.jsonl", background=True).read_text().splitlines()
+        self.assertEqual(len(lines), ROWS)
+        self.assertEqual(json.loads(lines[-1]), {"id": ROWS - 1, "name": f"row {ROWS - 1}"})
+
+    def test_unsupported_extension_reports_error(self):
+        """Test formats that were not generated fail cleanly"""
+        app = generated_app(["csv"])
+        app.start_export(str(self.temp_dir / "rows.jsonl"))
+        self.assertEqual(app.outcome[0], 0)
+        self.assertIsInstance(app.outcome[1], ValueError)
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_parquet(self):
+        """Test Parquet export through pyarrow"""
+        import pyarrow.parquet as pq
+
+        app = generated_app(["parquet"])
+        app.start_export(str(self.temp_dir / "rows.parquet"))
+        app.mainwindow.mainloop()
+        self.assertEqual(pq.read_table(self.temp_dir / "rows.parquet").num_rows, ROWS)
+
+
+class TestInsertExportCode(unittest.TestCase):
+    def test_inserted_before_run_and_replaced(self):
+        """Test export code lands in the app class and regenerating replaces it"""
+        code = generate_python_app_structure("demo", ["on_click"])
+        first = insert_export_code(code, _create_export_method(["csv", "jsonl"], "table", True))
+        compile(first, "demo.py", "exec")
+        self.assertLess(first.index("def on_export"), first.index("def run(self)"))
+        self.assertIn("EXPORT_IN_BACKGROUND = True", first)
+
+        second = insert_export_code(first, _create_export_method(["csv"], None))
+        self.assertEqual(second.count("def on_export"), 1)
+        self.assertNotIn("EXPORT_IN_BACKGROUND = True", second)
+        self.assertEqual(insert_export_code(second, _create_export_method(["csv", "jsonl"], "table", True)), first)
+
+    def test_unknown_format_rejected(self):
+        """Test unknown formats are rejected before touching the project"""
+        with self.assertRaises(ValueError):
+            add_export_capability("missing", ["xlsx"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""Tests for the SQLAlchemy database layer"""
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai import db  # noqa: E402
+
+try:
+    from sqlalchemy import text
+except ImportError:
+    text = None
+
+
+@unittest.skipUnless(db.SQLALCHEMY_AVAILABLE, "SQLAlchemy not installed")
+class DatabaseTestCase(unittest.TestCase):
+    """Points the database at a temporary file"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = pathlib.Path(self.temp_dir) / "test.db"
+        self._old_env = os.environ.get("PYGUBUAI_DB_PATH")
+        os.environ["PYGUBUAI_DB_PATH"] = str(self.db_path)
+        db.close_db()
+
+    def tearDown(self):
+        db.close_db()
+        if self._old_env is None:
+            os.environ.pop("PYGUBUAI_DB_PATH", None)
+        else:
+            os.environ["PYGUBUAI_DB_PATH"] = self._old_env
+
+
+class TestEngine(DatabaseTestCase):
+    def test_session_initializes_lazily(self):
+        """Test get_session creates the database on first use"""
+        session = db.get_session()
+        self.assertIsNotNone(session)
+        session.close()
+        self.assertTrue(self.db_path.exists())
+
+    def test_concurrent_first_use_initializes_once(self):
+        """Test threads racing for the first session share one engine"""
+        import threading
+        from unittest import mock
+
+        barrier = threading.Barrier(8)
+        sessions = []
+
+        def first_use():
+            barrier.wait()
+            session = db.get_session()
+            sessions.append(session)
+            session.close()
+
+        with mock.patch("pygubuai.db.create_engine", wraps=db.create_engine) as create_engine:
+            threads = [threading.Thread(target=first_use) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(create_engine.call_count, 1)
+        self.assertEqual({id(session.bind) for session in sessions}, {id(db.get_engine())})
+
+    def test_connections_use_wal(self):
+        """Test every connection gets the WAL pragmas"""
+        with db.get_engine().connect() as conn:
+            self.assertEqual(conn.execute(text("PRAGMA journal_mode")).scalar(), "wal")
+            self.assertEqual(conn.execute(text("PRAGMA busy_timeout")).scalar(), 5000)
+            self.assertEqual(conn.execute(text("PRAGMA synchronous")).scalar(), 1)
+
+    def test_session_scope_commits_and_rolls_back(self):
+        """Test a unit of work is committed, or discarded on error"""
+        from pygubuai.db.models import Project
+
+        with db.session_scope() as session:
+            session.add(Project(name="kept", path="/tmp/kept"))
+
+        with self.assertRaises(RuntimeError):
+            with db.session_scope() as session:
+                session.add(Project(name="dropped", path="/tmp/dropped"))
+                session.flush()
+                raise RuntimeError("boom")
+
+        with db.session_scope() as session:
+            names = [p.name for p in session.query(Project).all()]
+        self.assertEqual(names, ["kept"])
+
+
+class TestBulkOperations(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        from pygubuai.db.operations import create_project
+
+        with db.session_scope() as session:
+            create_project(session, "alpha", "/tmp/alpha")
+            create_project(session, "beta", "/tmp/beta")
+
+    def test_workflow_events_bulk(self):
+        """Test events are inserted in one batch and unknown projects skipped"""
+        from pygubuai.db.operations import add_workflow_events_bulk, get_workflow_events
+
+        events = [{"project_name": "alpha", "action": "file_changed", "description": f"edit {i}"} for i in range(50)]
+        events.append({"project_name": "beta", "action": "created"})
+        events.append({"project_name": "missing", "action": "created"})
+
+        with db.session_scope() as session:
+            self.assertEqual(add_workflow_events_bulk(session, events), 51)
+            self.assertEqual(len(get_workflow_events(session, "alpha", limit=100)), 50)
+            self.assertEqual(get_workflow_events(session, "beta")[0].description, "")
+
+    def test_record_analytics_bulk(self):
+        """Test analytics samples keep project and metadata"""
+        from pygubuai.db.models import Analytics
+        from pygubuai.db.operations import record_analytics_bulk
+
+        samples = [
+            {"metric_name": "latency", "metric_value": 12, "project_name": "alpha", "metadata": {"cmd": "create"}},
+            {"metric_name": "latency", "metric_value": 3.5},
+        ]
+        with db.session_scope() as session:
+            self.assertEqual(record_analytics_bulk(session, samples), 2)
+            rows = session.query(Analytics).order_by(Analytics.id).all()
+            self.assertEqual(rows[0].meta_data, {"cmd": "create"})
+            self.assertIsNotNone(rows[0].project_id)
+            self.assertIsNone(rows[1].project_id)
+            self.assertEqual(rows[1].metric_value, 3.5)
+
+
+class TestMetricsStore(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        from pygubuai.db.metrics import MetricsStore
+
+        self.store = MetricsStore(batch_size=1000, retention_days={"raw": 7, "minute": 2, "hour": 90})
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None, minute=0, second=0, microsecond=0)
+
+    def test_rollups_across_flushes(self):
+        """Test each flush merges into the minute, hour and day buckets"""
+        from pygubuai.db.metrics import query_metric
+
+        for i in range(1, 101):
+            self.store.record("latency", i, recorded_at=self.now + timedelta(seconds=i))
+            if i == 50:
+                self.assertEqual(self.store.flush(), 50)
+        self.store.flush()
+
+        hours = query_metric("latency", self.now, self.now + timedelta(days=1), resolution="hour")
+        self.assertEqual(len(hours), 1)
+        self.assertEqual(hours[0]["count"], 100)
+        self.assertEqual((hours[0]["min"], hours[0]["max"], hours[0]["sum"]), (1, 100, 5050))
+        self.assertAlmostEqual(hours[0]["p95"], 95, delta=95 * 0.02)
+
+        minutes = query_metric("latency", self.now, self.now + timedelta(hours=1))
+        self.assertEqual([m["count"] for m in minutes], [59, 41])
+
+    def test_retention_keeps_coarse_rollups(self):
+        """Test old raw samples expire while day rollups still answer queries"""
+        from pygubuai.db.metrics import summarize_metric
+        from pygubuai.db.models import Analytics, AnalyticsRollup
+
+        old = self.now - timedelta(days=30)
+        self.store.record("watch_events", 3, recorded_at=old)
+        self.store.record("watch_events", 5, recorded_at=self.now)
+        self.store.flush()
+
+        with db.session_scope() as session:
+            self.assertEqual(session.query(Analytics).count(), 1)
+            resolutions = sorted(r.resolution for r in session.query(AnalyticsRollup))
+        self.assertEqual(resolutions, ["day", "day", "hour", "hour", "minute"])
+        self.assertEqual(self.store.apply_retention(), {"raw": 0, "minute": 0, "hour": 0})
+
+        summary = summarize_metric("watch_events", old - timedelta(days=1), self.now + timedelta(days=1))
+        self.assertEqual(summary["count"], 2)
+        self.assertEqual(summary["sum"], 8)
+
+    def test_failed_flush_keeps_samples(self):
+        """Test samples survive a failed write, newest kept when the buffer is full"""
+        from unittest import mock
+
+        from pygubuai.db.metrics import MetricsStore
+
+        store = MetricsStore(batch_size=100, retention_days={}, max_buffer=250)
+        with mock.patch("pygubuai.db.metrics.session_scope", side_effect=RuntimeError("database is locked")):
+            for i in range(400):
+                store.record("latency", i, recorded_at=self.now)
+            self.assertEqual(store.flush(), 0)
+        self.assertEqual(len(store._buffer), 250)
+        self.assertEqual(store._buffer[0]["metric_value"], 150)
+        self.assertEqual(store.flush(), 250)
+
+    def test_resolution_falls_back_past_retention(self):
+        """Test short windows older than the minute retention are read from hour rollups"""
+        from pygubuai.db.metrics import choose_resolution, query_metric
+
+        retention = {"minute": 2, "hour": 90}
+        old = self.now - timedelta(days=3)
+        self.assertEqual(choose_resolution(self.now, self.now + timedelta(hours=1), retention, self.now), "minute")
+        self.assertEqual(choose_resolution(old, old + timedelta(hours=1), retention, self.now), "hour")
+        ancient = self.now - timedelta(days=120)
+        self.assertEqual(choose_resolution(ancient, ancient + timedelta(hours=1), retention, self.now), "day")
+
+        self.store.record("latency", 7, recorded_at=old + timedelta(minutes=5))
+        self.store.flush()
+        buckets = query_metric("latency", old, old + timedelta(hours=1))
+        self.assertEqual([(b["start"], b["count"]) for b in buckets], [(old.isoformat(), 1)])
+
+
+class TestEventWriter(DatabaseTestCase):
+    def make_writer(self, **kwargs):
+        from pygubuai.event_writer import EventWriter
+
+        writer = EventWriter(flush_interval=0.05, **kwargs)
+        self.addCleanup(writer.close)
+        return writer
+
+    def stall(self, writer):
+        """Hold the writer thread on its first event so the queue fills up"""
+        writer._write_lock.acquire()
+        writer.submit_event("app", self.temp_dir, "file_changed", "e0")
+        deadline = time.monotonic() + 5
+        while not writer._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def recorded(self):
+        from pygubuai.db.operations import get_workflow_events
+
+        with db.session_scope() as session:
+            return sorted(e.description for e in get_workflow_events(session, "app"))
+
+    def test_events_batched_into_database(self):
+        """Test queued events reach the database, creating the project row"""
+        writer = self.make_writer()
+        for i in range(25):
+            writer.submit_event("app", self.temp_dir, "file_changed", f"e{i:02d}", "2026-01-01T10:00:00+00:00")
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(len(self.recorded()), 25)
+        self.assertEqual(writer.written, 25)
+
+    def test_drop_oldest_policy(self):
+        """Test a full queue evicts the oldest waiting event"""
+        writer = self.make_writer(max_queue=2, batch_size=1, policy="drop_oldest")
+        self.stall(writer)
+        for name in ("e1", "e2", "e3"):
+            self.assertTrue(writer.submit_event("app", self.temp_dir, "file_changed", name))
+        writer._write_lock.release()
+        writer.flush(timeout=5)
+        self.assertEqual(writer.dropped, 1)
+        self.assertEqual(self.recorded(), ["e0", "e2", "e3"])
+
+    def test_drop_newest_policy(self):
+        """Test a full queue rejects new events"""
+        writer = self.make_writer(max_queue=2, batch_size=1, policy="drop_newest")
+        self.stall(writer)
+        results = [writer.submit_event("app", self.temp_dir, "file_changed", name) for name in ("e1", "e2", "e3")]
+        writer._write_lock.release()
+        writer.flush(timeout=5)
+        self.assertEqual(results, [True, True, False])
+        self.assertEqual(self.recorded(), ["e0", "e1", "e2"])
+
+    def test_flush_timeout_leaves_no_thread(self):
+        """Test a flush that times out returns without leaving a waiter running"""
+        writer = self.make_writer()
+        self.stall(writer)
+        writer.submit_event("app", self.temp_dir, "file_changed", "e1")
+        threads = threading.active_count()
+        self.assertFalse(writer.flush(timeout=0.05))
+        self.assertEqual(threading.active_count(), threads)
+        writer._write_lock.release()
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(self.recorded(), ["e0", "e1"])
+
+    def test_database_recording_is_opt_in(self):
+        """Test no writer thread starts unless record_events_to_db is enabled"""
+        from unittest import mock
+
+        from pygubuai import event_writer
+        from pygubuai.workflow import WorkflowTracker
+
+        def configured(key, default=None):
+            return default
+
+        event_writer.shutdown_event_writer()
+        with mock.patch("pygubuai.config.Config.get", side_effect=configured):
+            WorkflowTracker(self.temp_dir).add_event("file_changed", "edited")
+            self.assertIsNone(event_writer.get_event_writer())
+        self.assertNotIn("pygubuai-event-writer", [t.name for t in threading.enumerate()])
+
+    def test_workflow_saves_coalesce(self):
+        """Test only the latest pending workflow snapshot is written"""
+        import json
+
+        writer = self.make_writer()
+        writer._write_lock.acquire()
+        writer.save_workflow(self.temp_dir, {"project": "app", "file_hashes": {"a.ui": "1"}, "history": []})
+        writer.save_workflow(self.temp_dir, {"project": "app", "file_hashes": {"a.ui": "2"}, "history": []})
+        writer._write_lock.release()
+        writer.close()
+
+        data = json.loads((pathlib.Path(self.temp_dir) / ".pygubu-workflow.json").read_text())
+        self.assertEqual(data["file_hashes"], {"a.ui": "2"})
+
+
+class TestTemplateSearch(DatabaseTestCase):
+    def add(self, session, name, description, downloads=0, rating=0.0):
+        from pygubuai.db.operations import create_template
+
+        return create_template(
+            session, name, "{}", description=description, downloads=downloads, rating=rating, meta_data={}
+        )
+
+    def names(self, query):
+        from pygubuai.db.operations import search_templates
+
+        with db.session_scope() as session:
+            return [t.name for t in search_templates(session, query)]
+
+    def test_index_follows_table_changes(self):
+        """Test inserts, updates and deletes are reflected by the triggers"""
+        from pygubuai.db.models import Template
+
+        with db.session_scope() as session:
+            self.add(session, "invoice", "Billing form with totals")
+            self.add(session, "contacts", "Address book")
+
+        self.assertEqual(self.names("bill"), ["invoice"])
+        with db.session_scope() as session:
+            session.query(Template).filter_by(name="contacts").one().description = "Billing contacts"
+        self.assertEqual(sorted(self.names("billing")), ["contacts", "invoice"])
+        with db.session_scope() as session:
+            session.delete(session.query(Template).filter_by(name="invoice").one())
+        self.assertEqual(self.names("billing"), ["contacts"])
+
+    def test_ranking_blends_relevance_and_popularity(self):
+        """Test name matches rank first and popularity breaks near ties"""
+        with db.session_scope() as session:
+            self.add(session, "dashboard", "Charts and stats", downloads=10)
+            self.add(session, "stats_panel", "Summary statistics", downloads=0)
+            self.add(session, "report", "Report with a dashboard link", downloads=5)
+            self.add(session, "dashboard_pro", "Dashboard with charts", downloads=50000, rating=4.8)
+
+        self.assertEqual(self.names("dashboard"), ["dashboard_pro", "dashboard", "report"])
+        self.assertEqual(self.names("dash charts"), ["dashboard_pro", "dashboard"])
+        self.assertEqual(self.names("!!"), [])
+
+    def test_registry_templates_are_indexed(self):
+        """Test TemplateRegistry searches built-in and registered templates"""
+        from pygubuai.template_discovery import TemplateRegistry
+
+        registry = TemplateRegistry()
+        registry.register_template(
+            "survey",
+            {"description": "Questionnaire form", "widgets": [{"type": "checkbutton", "id": "agree"}]},
+        )
+        self.assertEqual(registry.search("login")[0][:1], ("login",))
+        self.assertEqual(registry.search("questionnaire"), [("survey", "Questionnaire form", "user")])
+        self.assertIn("survey", [name for name, _, _ in registry.search("checkbutton")])
+
+
+class TestDatabaseBackup(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        from pygubuai.db.operations import create_project
+
+        with db.session_scope() as session:
+            create_project(session, "kept", "/tmp/kept")
+
+    def project_names(self):
+        from pygubuai.db.models import Project
+
+        with db.session_scope() as session:
+            return sorted(p.name for p in session.query(Project))
+
+    def test_backup_during_open_write_transaction(self):
+        """Test a backup captures committed data without waiting for writers"""
+        import gzip
+        import sqlite3
+        from pygubuai.db.backup import backup_database
+
+        writer = sqlite3.connect(str(self.db_path))
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("INSERT INTO projects (name, path, description) VALUES ('pending', '/tmp/p', '')")
+
+        steps = []
+        output = pathlib.Path(self.temp_dir) / "backup.db.gz"
+        backup_database(self.db_path, output, progress=lambda done, total: steps.append((done, total)))
+        writer.commit()
+        writer.close()
+
+        self.assertEqual(steps[-1][0], steps[-1][1])
+        restored = pathlib.Path(self.temp_dir) / "plain.db"
+        restored.write_bytes(gzip.decompress(output.read_bytes()))
+        conn = sqlite3.connect(str(restored))
+        self.assertEqual([r[0] for r in conn.execute("SELECT name FROM projects")], ["kept"])
+        conn.close()
+
+    def test_restore_round_trip(self):
+        """Test restore replaces the live database and sessions keep working"""
+        from pygubuai.db.backup import backup_database, restore_database
+        from pygubuai.db.operations import create_project
+
+        output = backup_database(self.db_path, pathlib.Path(self.temp_dir) / "backup.db", compression="gzip")
+        with db.session_scope() as session:
+            create_project(session, "later", "/tmp/later")
+
+        restore_database(output, self.db_path)
+        self.assertEqual(self.project_names(), ["kept"])
+
+    def test_corrupt_backup_is_rejected(self):
+        """Test a damaged backup fails the integrity check and leaves the database alone"""
+        from pygubuai.db.backup import restore_database
+        from pygubuai.errors import DatabaseError
+
+        bad = pathlib.Path(self.temp_dir) / "bad.db"
+        bad.write_bytes(b"SQLite format 3\x00" + b"\x00" * 200)
+        with self.assertRaises(DatabaseError):
+            restore_database(bad, self.db_path)
+        self.assertEqual(self.project_names(), ["kept"])
+
+    def test_failed_write_raises_database_error(self):
+        """Test an I/O error while compressing is reported as DatabaseError and leaves no files"""
+        from unittest import mock
+
+        from pygubuai.db.backup import backup_database
+        from pygubuai.errors import DatabaseError
+
+        out_dir = pathlib.Path(self.temp_dir) / "backups"
+        with mock.patch("pygubuai.db.backup._compress", side_effect=OSError(28, "No space left on device")):
+            with self.assertRaises(DatabaseError):
+                backup_database(self.db_path, out_dir / "backup.db.gz")
+        self.assertEqual(list(out_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Tests for standalone project export"""
+import os
+import pathlib
+import runpy
+import shutil
+import sys
+import tempfile
+import json
+import types
+import unittest
+import zipfile
+from unittest import mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.export import EXPORT_MANIFEST, export_all, export_standalone, extract_code  # noqa: E402
+from pygubuai.registry import Registry  # noqa: E402
+
+APP_PY = '''#!/usr/bin/env python3
+import json
+import pathlib
+import tkinter as tk
+import pygubu
+
+PROJECT_PATH = pathlib.Path(__file__).parent
+PROJECT_UI = PROJECT_PATH / "demo.ui"
+LIMITS = {"rows": 10}
+
+
+def double(value):
+    return value * 2
+
+
+class DemoApp:
+    def __init__(self, master=None):
+        self.builder = pygubu.Builder()
+        self.builder.add_from_file(PROJECT_UI)
+        self.mainwindow = self.builder.get_object('mainwindow', master)
+        self.builder.connect_callbacks(self)
+        self.clicks = 0
+
+    def on_click(self):
+        self.clicks += 1
+        print(json.dumps({"clicks": self.clicks}))
+
+    @staticmethod
+    def format_row(row):
+        return "{}: {}".format(*row)
+
+    def run(self):
+        self.mainwindow.mainloop()
+
+
+if __name__ == '__main__':
+    DemoApp().run()
+'''
+
+APP_UI = """<?xml version='1.0' encoding='utf-8'?>
+<interface version="1.2">
+  <object class="tk.Toplevel" id="mainwindow">
+    <property name="title">Demo "quoted" \\\\ title</property>
+    <child>
+      <object class="ttk.Label" id="logo">
+        <property name="image">logo.png</property>
+        <property name="text">Hello</property>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+
+DESIGNER_PY = '''#!/usr/bin/python3
+import pathlib
+import tkinter as tk
+import pygubu
+
+PROJECT_PATH = pathlib.Path(__file__).parent
+PROJECT_UI = PROJECT_PATH / "demo.ui"
+
+
+class DemoApp:
+    def __init__(self, master=None):
+        self.builder = builder = pygubu.Builder()
+        builder.add_resource_path(PROJECT_PATH)
+        builder.add_from_file(PROJECT_UI)
+        # Main widget
+        self.mainwindow = builder.get_object("toplevel1", master)
+        self.table = builder.get_object("table", master)
+        self.name_var = None
+        builder.import_variables(self, ["name_var"])
+        self.source = PROJECT_UI.name
+        builder.connect_callbacks(self)
+
+    def run(self):
+        self.mainwindow.mainloop()
+
+    def on_save(self):
+        pass
+
+
+if __name__ == "__main__":
+    app = DemoApp()
+    app.run()
+'''
+
+
+class TestExtractCode(unittest.TestCase):
+    def test_extracts_methods_helpers_and_init(self):
+        """Test callbacks, helpers and extra __init__ code survive extraction"""
+        code = extract_code(APP_PY)
+        self.assertEqual(list(code.methods), ["on_click", "format_row", "run"])
+        self.assertTrue(code.methods["format_row"].startswith("    @staticmethod\n    def format_row"))
+        self.assertEqual(code.init, ["self.clicks = 0"])
+        self.assertEqual(code.imports, ["import json"])
+        self.assertEqual(
+            code.helpers,
+            [
+                'PROJECT_UI = PROJECT_PATH / "demo.ui"',
+                'LIMITS = {"rows": 10}',
+                "def double(value):\n    return value * 2",
+            ],
+        )
+
+        with self.assertRaises(ValueError):
+            extract_code("def broken(:\n")
+
+
+class FakeBuilder:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append(name) or name
+
+
+class TestExportStandalone(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.old_home = os.environ.get("HOME")
+        os.environ["HOME"] = str(self.temp_dir)
+        self.addCleanup(os.environ.__setitem__, "HOME", self.old_home or "")
+
+        self.project = self.temp_dir / "demo"
+        (self.project / "images").mkdir(parents=True)
+        (self.project / "demo.py").write_text(APP_PY)
+        (self.project / "demo.ui").write_text(APP_UI)
+        (self.project / "images" / "logo.png").write_bytes(b"\x89PNG not really")
+        Registry().add_project("demo", str(self.project))
+
+    def test_standalone_embeds_compressed_ui(self):
+        """Test the UI is embedded compressed and restored exactly"""
+        output = pathlib.Path(export_standalone("demo"))
+        source = output.read_text()
+        self.assertNotIn("<interface", source)
+        self.assertIn("def on_click(self):", source)
+        self.assertIn("        self.clicks = 0\n", source)
+
+        module = runpy.run_path(str(output), run_name="standalone")
+        self.assertEqual(module["ui_definition"](), APP_UI)
+        self.assertEqual(module["double"](4), 8)
+        self.assertEqual(module["resource_dir"](), self.project)
+
+    def test_designer_layout_runs(self):
+        """Test exports of pygubu-designer code resolve the builder alias"""
+        (self.project / "demo.py").write_text(DESIGNER_PY)
+        output = export_standalone("demo")
+        fake_pygubu = types.SimpleNamespace(Builder=FakeBuilder)
+        with mock.patch.dict(sys.modules, {"pygubu": fake_pygubu}):
+            module = runpy.run_path(output, run_name="standalone")
+        app = module["DemoApp"]()
+        self.assertEqual(app.table, "get_object")
+        self.assertEqual(app.source, "demo.ui")
+        expected = ["add_resource_path", "add_from_string", "get_object", "get_object", "import_variables"]
+        self.assertEqual(app.builder.calls, expected + ["connect_callbacks"])
+
+    def test_zipapp_bundles_assets_reproducibly(self):
+        """Test .pyz archives carry referenced images and are byte-identical"""
+        first = pathlib.Path(export_standalone("demo", str(self.temp_dir / "a.pyz"), zipapp=True))
+        second = pathlib.Path(export_standalone("demo", str(self.temp_dir / "b.pyz"), zipapp=True))
+        self.assertEqual(first.read_bytes(), second.read_bytes())
+        with zipfile.ZipFile(first) as archive:
+            self.assertEqual(archive.namelist(), ["__main__.py", "assets/logo.png"])
+
+        module = runpy.run_path(str(first), run_name="standalone")
+        assets = module["resource_dir"]()
+        self.addCleanup(shutil.rmtree, assets.parent, ignore_errors=True)
+        self.assertEqual((assets / "logo.png").read_bytes(), b"\x89PNG not really")
+        self.assertEqual(module["ui_definition"](), APP_UI)
+
+
+class TestExportAll(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.out = self.temp_dir / "dist"
+        self.projects = {}
+        for name in ("alpha", "beta"):
+            project = self.temp_dir / name
+            project.mkdir()
+            (project / f"{name}.py").write_text(APP_PY.replace("demo.ui", f"{name}.ui"))
+            (project / f"{name}.ui").write_text(APP_UI.replace("logo.png", "none"))
+            self.projects[name] = str(project)
+
+    def statuses(self, **kwargs):
+        results = export_all(str(self.out), self.projects, jobs=2, **kwargs)
+        return {r.name: r.status for r in results}
+
+    def test_skips_unchanged_projects(self):
+        """Test only projects whose inputs changed are rebuilt"""
+        self.assertEqual(self.statuses(), {"alpha": "exported", "beta": "exported"})
+        artifact = (self.out / "alpha.py").read_bytes()
+        manifest = json.loads((self.out / EXPORT_MANIFEST).read_text())
+        self.assertEqual(sorted(manifest["projects"]), ["alpha", "beta"])
+
+        self.assertEqual(self.statuses(), {"alpha": "unchanged", "beta": "unchanged"})
+        pathlib.Path(self.projects["beta"], "beta.py").write_text(APP_PY + "\n# changed\n")
+        self.assertEqual(self.statuses(), {"alpha": "unchanged", "beta": "exported"})
+
+        (self.out / "alpha.py").unlink()
+        self.assertEqual(self.statuses(force=True), {"alpha": "exported", "beta": "exported"})
+        self.assertEqual((self.out / "alpha.py").read_bytes(), artifact)
+
+    def test_failed_projects_are_reported(self):
+        """Test a broken project fails alone and is retried next time"""
+        pathlib.Path(self.projects["beta"], "beta.py").write_text("def broken(:\n")
+        self.assertEqual(self.statuses(zipapp=True), {"alpha": "exported", "beta": "failed"})
+        self.assertTrue(zipfile.is_zipfile(self.out / "alpha.pyz"))
+        manifest = json.loads((self.out / EXPORT_MANIFEST).read_text())
+        self.assertEqual(list(manifest["projects"]), ["alpha"])
+        self.assertEqual(self.statuses(zipapp=True), {"alpha": "unchanged", "beta": "failed"})
+
+    def test_extractor_version_invalidates_manifest(self):
+        """Test a new extractor version rebuilds everything and the manifest is replaced cleanly"""
+        export_all(str(self.out), self.projects, jobs=1)
+        with mock.patch("pygubuai.export.EXTRACTOR_VERSION", -1):
+            results = export_all(str(self.out), self.projects, jobs=1)
+        self.assertEqual({r.status for r in results}, {"exported"})
+        self.assertEqual(sorted(p.name for p in self.out.iterdir()), ["alpha.py", "beta.py", EXPORT_MANIFEST])
+
+
+if __name__ == "__main__":
+    unittest.main()
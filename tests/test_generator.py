@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for streaming UI generation"""
+import io
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.generator import UIWriter, generate_base_ui_xml_structure, write_base_ui, write_ui_tree  # noqa: E402
+
+
+class TestUIWriter(unittest.TestCase):
+    def test_escaping(self):
+        """Test property values and attributes are escaped and invalid characters dropped"""
+        widgets = [("label", {"class": "ttk.Label", "id": 'a"b', "properties": {"text": "<b> & 'x'\x01\nnext"}})]
+        root = ET.fromstring(generate_base_ui_xml_structure("R&D <tool>", widgets))
+        self.assertEqual(root.find(".//property[@name='title']").text, "R&D <Tool>")
+        label = root.find(".//object[@class='ttk.Label']")
+        self.assertEqual(label.get("id"), 'a"b')
+        self.assertEqual(label.find("property[@name='text']").text, "<b> & 'x'\nnext")
+
+    def test_nesting_and_indent(self):
+        """Test nested objects get child wrappers, layouts and the requested indentation"""
+        buffer = io.StringIO()
+        tree = [
+            {
+                "class": "tk.Toplevel",
+                "id": "main",
+                "children": [
+                    {
+                        "class": "ttk.Frame",
+                        "id": "frame",
+                        "layout": {"manager": "grid", "properties": {"row": 0}},
+                        "children": [{"class": "ttk.Button", "id": "ok", "properties": {"text": "OK"}}],
+                    }
+                ],
+            }
+        ]
+        write_ui_tree(buffer, tree, indent="\t")
+        lines = buffer.getvalue().splitlines()
+        self.assertIn('\t\t\t\t\t<object class="ttk.Button" id="ok">', lines)
+        root = ET.fromstring(buffer.getvalue())
+        self.assertEqual(root.find("./object/child/object/layout/property[@name='row']").text, "0")
+        self.assertEqual(root.find("./object/child/object/child/object").get("id"), "ok")
+
+        ui = UIWriter(io.StringIO())
+        ui.start_interface()
+        with self.assertRaises(ValueError):
+            ui.end_object()
+
+    def test_large_scaffold_from_generator(self):
+        """Test 10k widgets stream from a generator straight to a file"""
+        temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        widgets = (("button", {"class": "ttk.Button", "properties": {"text": f"B{i}"}}) for i in range(10000))
+        ui_file = temp_dir / "load.ui"
+        with open(ui_file, "w", encoding="utf-8") as f:
+            write_base_ui(f, "load", widgets)
+
+        buttons = ET.parse(ui_file).getroot().findall(".//object[@class='ttk.Button']")
+        self.assertEqual(len(buttons), 10000)
+        self.assertEqual(buttons[-1].get("id"), "button10000")
+
+
+if __name__ == "__main__":
+    unittest.main()
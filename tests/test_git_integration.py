@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for batched git operations"""
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai import git_integration  # noqa: E402
+from pygubuai.git_integration import (  # noqa: E402
+    GitBatch,
+    commit_files,
+    find_repo_root,
+    init_git_repos,
+    is_git_available,
+)
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Test",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+@unittest.skipUnless(is_git_available(), "git not installed")
+class TestGitBatch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        patcher = mock.patch.dict(os.environ, GIT_ENV)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mono = self.init_repo("mono")
+        self.single = self.init_repo("single")
+
+    def init_repo(self, name):
+        root = self.temp_dir / name
+        root.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+        return root
+
+    def log(self, root):
+        args = ["git", "log", "--format=%s", "--name-status"]
+        return subprocess.run(args, cwd=root, capture_output=True, text=True).stdout
+
+    def test_find_repo_root(self):
+        """Test repository roots are found from nested files"""
+        nested = self.mono / "apps" / "one"
+        nested.mkdir(parents=True)
+        self.assertEqual(find_repo_root(nested / "one.ui"), self.mono.resolve())
+        self.assertIsNone(find_repo_root(pathlib.Path("/")))
+
+    def test_one_commit_per_repository(self):
+        """Test files from many projects cost two git processes per repository"""
+        files = []
+        for i in range(20):
+            project = self.mono / f"app{i}"
+            project.mkdir()
+            (project / f"app{i}.ui").write_text("<interface />")
+            files.append(project / f"app{i}.ui")
+        (self.single / "single.ui").write_text("<interface />")
+        files.append(self.single / "single.ui")
+
+        with mock.patch.object(git_integration.subprocess, "run", wraps=subprocess.run) as run:
+            results = commit_files(files, "Apply clam theme")
+        self.assertEqual(results, {self.mono.resolve(): True, self.single.resolve(): True})
+        self.assertEqual(run.call_count, 4)
+        self.assertEqual(self.log(self.mono).count("Apply clam theme"), 1)
+        self.assertIn("A\tapp19/app19.ui", self.log(self.mono))
+
+    def test_deletions_and_unchanged(self):
+        """Test deleted files are staged and unchanged repositories are not errors"""
+        (self.single / "a.ui").write_text("<interface />")
+        (self.single / "b.ui").write_text("<interface />")
+        commit_files([self.single / "a.ui", self.single / "b.ui"], "Initial")
+
+        (self.single / "b.ui").unlink()
+        batch = GitBatch()
+        batch.add(self.single / "a.ui", self.single / "b.ui", self.temp_dir / "outside.ui")
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.skipped, [(self.temp_dir / "outside.ui").resolve()])
+        self.assertEqual(batch.commit("Remove b"), {self.single.resolve(): True})
+        self.assertIn("D\tb.ui", self.log(self.single))
+
+        self.assertEqual(commit_files([self.single / "a.ui"], "No change"), {self.single.resolve(): False})
+
+    def test_init_repos_respects_gitignore(self):
+        """Test initial commits leave out files the generated .gitignore excludes"""
+        project = self.temp_dir / "fresh"
+        (project / "__pycache__").mkdir(parents=True)
+        (project / "fresh.ui").write_text("<interface />")
+        (project / "__pycache__" / "fresh.cpython-311.pyc").write_bytes(b"\0")
+        (project / ".pygubu-workflow.json").write_text("{}")
+
+        self.assertEqual(init_git_repos([project]), {project.resolve(): True})
+        tracked = subprocess.run(["git", "ls-files"], cwd=project, capture_output=True, text=True).stdout
+        self.assertEqual(tracked.split(), [".gitignore", "fresh.ui"])
+
+
+if __name__ == "__main__":
+    unittest.main()
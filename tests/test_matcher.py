@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Tests for the Aho-Corasick keyword matcher"""
+import pathlib
+import random
+import re
+import sys
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.matcher import KeywordMatcher  # noqa: E402
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    def test_overlapping_keywords(self):
+        """Test keywords sharing prefixes and suffixes are all reported with positions"""
+        matcher = KeywordMatcher({"a": ["he", "she", "his", "hers"], "b": ["she sells"]})
+        found = [(m.keyword, m.start, m.end) for m in matcher.find_all("ushers, she sells")]
+        self.assertEqual(found, [("she", 8, 11), ("she sells", 8, 17)])
+
+        # Without word boundaries the automaton still sees every embedded keyword
+        self.assertEqual({m.keyword for m in matcher.find_all("he hers his")}, {"he", "hers", "his"})
+
+    def test_whole_words_and_plurals(self):
+        """Test substrings inside words are ignored but simple plurals match"""
+        matcher = KeywordMatcher({"button": ["click", "button"], "list": ["list"]})
+        self.assertEqual(matcher.labels("user clicked it"), set())
+        self.assertEqual(matcher.labels("Clicks on BUTTONS"), {"button"})
+        self.assertEqual(matcher.labels("a checklist, listing"), set())
+        self.assertEqual(matcher.labels("lists."), {"list"})
+
+    def test_matches_naive_scan(self):
+        """Test the automaton agrees with a regex scan on random text"""
+        rng = random.Random(7)
+        words = ["ab", "abc", "bca", "c", "cab", "b a"]
+        matcher = KeywordMatcher({word: [word] for word in words})
+        for _ in range(200):
+            text = "".join(rng.choice("abc ") for _ in range(30))
+            expected = {
+                (word, m.start())
+                for word in words
+                for m in re.finditer(rf"(?=(?<!\w){re.escape(word)}(?:e?s)?(?!\w))", text)
+            }
+            self.assertEqual({(m.keyword, m.start) for m in matcher.find_all(text)}, expected, text)
+
+    def test_extend_and_unicode_positions(self):
+        """Test added keywords take effect and positions refer to the original text"""
+        matcher = KeywordMatcher()
+        matcher.add("slider", "slider", "range")
+        text = "İİ slider"
+        (match,) = matcher.find_all(text)
+        self.assertEqual(text[match.start : match.end], "slider")
+        self.assertEqual(len(matcher), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
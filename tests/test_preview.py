@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for incremental preview reloads"""
+import pathlib
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.preview import _apply_ui_changes, _can_patch  # noqa: E402
+from pygubuai.uidiff import diff_trees, parse_ui  # noqa: E402
+
+BASE_UI = """<?xml version='1.0' encoding='utf-8'?>
+<interface version="1.2">
+  <object class="tk.Toplevel" id="mainwindow">
+    <child>
+      <object class="ttk.Frame" id="mainframe">
+        <layout manager="pack"><property name="fill">both</property></layout>
+        <child>
+          <object class="ttk.Label" id="title">
+            <property name="text">Hello</property>
+            <layout manager="pack"><property name="pady">5</property></layout>
+          </object>
+        </child>
+        <child>
+          <object class="ttk.Button" id="submit">
+            <property name="text">Go</property>
+            <layout manager="pack" />
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+
+class FakeObject:
+    """Stands in for a pygubu BuilderObject, recording what is patched"""
+
+    def __init__(self, node):
+        self.wmeta = SimpleNamespace(properties=dict(node.properties), layout_properties=dict(node.layout or {}))
+        self.widget = SimpleNamespace(destroyed=False)
+        self.widget.destroy = lambda: setattr(self.widget, "destroyed", True)
+        self.set_calls = []
+        self.layouts = 0
+
+    def _set_property(self, widget, name, value):
+        self.set_calls.append((name, value))
+
+    def layout(self):
+        self.layouts += 1
+
+
+class TestPreviewPatching(unittest.TestCase):
+    def setUp(self):
+        self.old = parse_ui(BASE_UI)
+        self.objects = {widget_id: FakeObject(node) for widget_id, node in self.old.items()}
+
+    def change(self, before, after):
+        new = parse_ui(BASE_UI.replace(before, after))
+        return diff_trees(self.old, new), new
+
+    def test_property_and_layout_edits_patch_live_widgets(self):
+        """Test text and pack option edits are applied without a rebuild"""
+        diff, new = self.change('<property name="text">Hello</property>', '<property name="text">Hi</property>')
+        self.assertTrue(_can_patch(diff, new))
+        _apply_ui_changes(self.objects, diff, self.old, new)
+        self.assertEqual(self.objects["title"].set_calls, [("text", "Hi")])
+        self.assertEqual(self.objects["title"].wmeta.properties["text"], "Hi")
+
+        diff, new = self.change('<property name="pady">5</property>', '<property name="pady">9</property>')
+        self.assertTrue(_can_patch(diff, new))
+        _apply_ui_changes(self.objects, diff, self.old, new)
+        self.assertEqual(self.objects["title"].wmeta.layout_properties["pady"], "9")
+        self.assertEqual(self.objects["title"].layouts, 1)
+
+    def test_removed_widget_is_destroyed(self):
+        """Test removing a widget destroys it and forgets it"""
+        start = BASE_UI.index('        <child>\n          <object class="ttk.Button"')
+        end = BASE_UI.index("        </child>", start) + len("        </child>\n")
+        new = parse_ui(BASE_UI[:start] + BASE_UI[end:])
+        diff = diff_trees(self.old, new)
+        button = self.objects["submit"].widget
+
+        self.assertTrue(_can_patch(diff, new))
+        _apply_ui_changes(self.objects, diff, self.old, new)
+        self.assertTrue(button.destroyed)
+        self.assertNotIn("submit", self.objects)
+
+    def test_unpatchable_changes_need_rebuild(self):
+        """Test builder-resolved properties and layout manager swaps force a rebuild"""
+        diff, new = self.change('<property name="text">Go</property>', '<property name="command">go</property>')
+        self.assertFalse(_can_patch(diff, new))
+
+        diff, new = self.change('<layout manager="pack" />', '<layout manager="grid" />')
+        self.assertFalse(_can_patch(diff, new))
+
+        diff, new = self.change('class="ttk.Label"', 'class="tk.Label"')
+        self.assertFalse(_can_patch(diff, new))
+
+
+if __name__ == "__main__":
+    unittest.main()
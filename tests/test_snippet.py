@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for the snippet engine"""
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from defusedxml import ElementTree as ET  # noqa: E402
+
+from pygubuai.snippet import generate_snippet, insert_snippets, render_snippets  # noqa: E402
+
+UI = """<?xml version='1.0' encoding='utf-8'?>
+<interface version="1.2">
+  <object class="tk.Toplevel" id="mainwindow">
+    <child>
+      <object class="ttk.Frame" id="main_frame">
+        <child>
+          <object class="ttk.Button" id="button_1">
+            <property name="text">Existing</property>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+
+class TestSnippets(unittest.TestCase):
+    def test_single_snippet_escapes_values(self):
+        """Test values are escaped and defaults still apply"""
+        xml = generate_snippet("button", text='Save & "Quit" <now>')
+        self.assertIn("Save &amp; &quot;Quit&quot; &lt;now&gt;", xml)
+        self.assertIn("on_button_click", xml)
+        self.assertTrue(xml.startswith('    <object class="ttk.Button" id="button_1">'))
+        self.assertIn('id="a&quot;b"', generate_snippet("label", id='a"b'))
+        with self.assertRaises(ValueError):
+            generate_snippet("slider")
+
+    def test_composition_nests_and_numbers_ids(self):
+        """Test container children are nested and ids are unique"""
+        specs = [
+            {"type": "frame", "children": ["label", {"type": "button", "text": "OK"}]},
+            "button",
+            {"type": "label", "id": "label_1"},
+        ]
+        xml = render_snippets(specs, child=False)
+        root = ET.fromstring(f"<root>{xml}</root>")
+        frame = root.find("object")
+        self.assertEqual([o.get("id") for o in frame.iter("object")], ["frame_1", "label_2", "button_1"])
+        self.assertEqual([o.get("id") for o in root.findall("object")], ["frame_1", "button_2", "label_1"])
+        self.assertIn('\n    <object class="ttk.Label" id="label_2">', xml)
+
+        with self.assertRaises(ValueError):
+            render_snippets([{"type": "button", "children": ["label"]}])
+        with self.assertRaises(ValueError):
+            render_snippets([{"type": "label", "id": "x"}, {"type": "entry", "id": "x"}])
+
+
+class TestInsertSnippets(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.ui_file = self.temp_dir / "app.ui"
+        self.ui_file.write_text(UI)
+
+    def test_insert_under_parent(self):
+        """Test snippets land under the parent with fresh ids and indentation"""
+        ids = insert_snippets(self.ui_file, "main_frame", ["button", {"type": "frame", "children": ["entry"]}])
+        self.assertEqual(ids, ["button_2", "frame_1", "entry_1"])
+
+        root = ET.parse(self.ui_file).getroot()
+        frame = root.find(".//object[@id='main_frame']")
+        children = [c.find("object").get("id") for c in frame.findall("child")]
+        self.assertEqual(children, ["button_1", "button_2", "frame_1"])
+        text = self.ui_file.read_text()
+        self.assertIn('\n          <object class="ttk.Button" id="button_2">', text)
+        self.assertIn('\n              <object class="ttk.Entry" id="entry_1">', text)
+        self.assertTrue(text.rstrip().endswith("  </object>\n</interface>"))
+
+    def test_insert_rejects_unknown_parent_and_taken_ids(self):
+        """Test the file is untouched when insertion fails"""
+        with self.assertRaises(ValueError):
+            insert_snippets(self.ui_file, "missing", ["button"])
+        with self.assertRaises(ValueError):
+            insert_snippets(self.ui_file, "main_frame", [{"type": "button", "id": "button_1"}])
+        self.assertEqual(self.ui_file.read_text(), UI)
+
+
+if __name__ == "__main__":
+    unittest.main()
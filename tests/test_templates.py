@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
 """Tests for template system"""
+import json
+import os
+import shutil
+import tempfile
 import unittest
 import sys
 import pathlib
+from unittest import mock
 
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
 from pygubuai import template_data as pygubuai_templates  # noqa: E402
+from pygubuai import template_discovery  # noqa: E402
+from pygubuai.generator import (  # noqa: E402
+    generate_base_ui_xml_structure,
+    generate_python_app_structure,
+    generate_readme_content,
+)
+from pygubuai.template import compile_template, create_many_from_template  # noqa: E402
 
 
 class TestTemplates(unittest.TestCase):
@@ -79,5 +91,57 @@ class TestTemplates(unittest.TestCase):
         self.assertIn("pass", callbacks)
 
 
+class TestCompiledTemplates(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        patcher = mock.patch.dict(os.environ, {"HOME": str(self.temp_dir)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, template_discovery, "_registry", None)
+        template_discovery._registry = None
+
+    def test_render_matches_direct_generation(self):
+        """Test compiled skeletons render exactly what the generators produce"""
+        files = compile_template("login").render("my_login_app")
+        widgets, code = pygubuai_templates.get_template_widgets_and_callbacks("login")
+        description = pygubuai_templates.get_template("login")["description"]
+        self.assertEqual(files["my_login_app.ui"], generate_base_ui_xml_structure("my_login_app", widgets))
+        self.assertEqual(files["my_login_app.py"], generate_python_app_structure("my_login_app", [], code))
+        self.assertEqual(
+            files["README.md"], generate_readme_content("my_login_app", description, "my_login_app.ui", "login")
+        )
+        self.assertIs(compile_template("login"), compile_template("login"))
+
+    def test_user_template_change_recompiles(self):
+        """Test editing a user template file invalidates its compiled skeleton"""
+        template_dir = self.temp_dir / ".pygubuai" / "templates"
+        template_dir.mkdir(parents=True)
+        template_file = template_dir / "greeter.json"
+        template = {"description": "Greeter", "widgets": [{"type": "label", "text": "Hello", "id": "greeting"}]}
+        template_file.write_text(json.dumps(template))
+        first = compile_template("greeter")
+        self.assertIn(">Hello<", first.ui)
+
+        template["widgets"][0]["text"] = "Welcome"
+        template_file.write_text(json.dumps(template))
+        os.utime(template_file, ns=(1, 1))
+        second = compile_template("greeter")
+        self.assertIsNot(first, second)
+        self.assertIn(">Welcome<", second.ui)
+
+    def test_create_many(self):
+        """Test --count style bulk creation from one compiled template"""
+        created = create_many_from_template("fleet", "settings", 12, parent=self.temp_dir, skip_validation=True)
+        self.assertEqual([p.name for p in created[:2]], ["fleet_001", "fleet_002"])
+        self.assertEqual(len(created), 12)
+        py_file = created[-1] / "fleet_012.py"
+        self.assertIn("class Fleet012App:", py_file.read_text())
+        self.assertIn('PROJECT_UI = PROJECT_PATH / "fleet_012.ui"', py_file.read_text())
+        self.assertTrue(os.access(py_file, os.X_OK))
+        with self.assertRaises(ValueError):
+            create_many_from_template("fleet", "settings", 0, skip_validation=True)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for UI structural diff"""
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai.uidiff import diff_trees, format_diff, parse_ui  # noqa: E402
+
+BASE_UI = """<?xml version='1.0' encoding='utf-8'?>
+<interface version="1.2">
+  <object class="tk.Toplevel" id="mainwindow">
+    <child>
+      <object class="ttk.Frame" id="mainframe">
+        <layout manager="pack"><property name="fill">both</property></layout>
+        <child>
+          <object class="ttk.Label" id="title">
+            <property name="text">Hello</property>
+            <layout manager="pack"><property name="pady">5</property></layout>
+          </object>
+        </child>
+        <child>
+          <object class="ttk.Entry" id="name" />
+        </child>
+        <child>
+          <object class="ttk.Button" id="submit">
+            <property name="text">Go</property>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+
+class TestUIDiff(unittest.TestCase):
+    def setUp(self):
+        self.old = parse_ui(BASE_UI)
+
+    def diff(self, new_xml):
+        return diff_trees(self.old, parse_ui(new_xml))
+
+    def test_parse_indexes_by_id(self):
+        """Test every object is indexed with parent and position"""
+        self.assertEqual(list(self.old), ["mainwindow", "mainframe", "title", "name", "submit"])
+        self.assertEqual(self.old["submit"].parent, "mainframe")
+        self.assertEqual(self.old["submit"].index, 2)
+        self.assertEqual(self.old["mainframe"].children, ["title", "name", "submit"])
+        self.assertEqual(self.old["title"].layout, {"manager": "pack", "pady": "5"})
+
+    def test_identical_trees(self):
+        """Test identical files produce an empty diff"""
+        diff = self.diff(BASE_UI)
+        self.assertTrue(diff.is_empty())
+        self.assertEqual(format_diff(diff), "No widget changes")
+
+    def test_property_and_layout_changes(self):
+        """Test property and layout changes are reported as (old, new)"""
+        diff = self.diff(BASE_UI.replace(">Hello<", ">Hi<").replace('"pady">5', '"pady">8'))
+        self.assertEqual(diff.properties, {"title": {"text": ("Hello", "Hi")}})
+        self.assertEqual(diff.layout, {"title": {"pady": ("5", "8")}})
+        self.assertEqual(diff.to_dict()["modified"], ["title"])
+
+    def test_added_and_removed_report_topmost(self):
+        """Test only the root of an added or removed subtree is listed"""
+        new_xml = BASE_UI.replace(
+            '<object class="ttk.Entry" id="name" />',
+            '<object class="ttk.Frame" id="row"><child><object class="ttk.Entry" id="name2" /></child></object>',
+        )
+        diff = self.diff(new_xml)
+        self.assertEqual(diff.added, ["row"])
+        self.assertEqual(diff.removed, ["name"])
+
+        reverse = diff_trees(parse_ui(new_xml), self.old)
+        self.assertEqual(reverse.removed, ["row"])
+
+    def test_reorder_marks_minimal_moves(self):
+        """Test a reorder only flags widgets that left their relative order"""
+        frame = '<object class="ttk.Frame" id="f">{}</object>'
+        child = '<child><object class="ttk.Label" id="{}" /></child>'
+        old = parse_ui(frame.format("".join(child.format(w) for w in "abcd")))
+        new = parse_ui(frame.format("".join(child.format(w) for w in "bcda")))
+        diff = diff_trees(old, new)
+        self.assertEqual(diff.moved, ["a"])
+        self.assertFalse(diff.added or diff.removed)
+
+    def test_reparent_and_class_change(self):
+        """Test reparented widgets are moved and class changes are flagged"""
+        new_xml = BASE_UI.replace('class="ttk.Entry" id="name"', 'class="ttk.Combobox" id="name"')
+        self.assertEqual(self.diff(new_xml).class_changed, ["name"])
+
+        nested = BASE_UI.replace(
+            '<object class="ttk.Entry" id="name" />',
+            '<object class="ttk.Frame" id="row"><child><object class="ttk.Entry" id="name" /></child></object>',
+        )
+        diff = self.diff(nested)
+        self.assertEqual(diff.added, ["row"])
+        self.assertEqual(diff.moved, ["name"])
+
+
+class TestWorkflowDiff(unittest.TestCase):
+    def test_change_event_records_widget_diff(self):
+        """Test watch history describes which widgets changed"""
+        from pygubuai.workflow import _check_ui_changes, load_workflow
+
+        project_dir = pathlib.Path(tempfile.mkdtemp())
+        ui_file = project_dir / "app.ui"
+        ui_file.write_text(BASE_UI)
+        workflow = load_workflow(project_dir)
+
+        _check_ui_changes([ui_file], workflow, project_dir, "app")
+        ui_file.write_text(BASE_UI.replace(">Go<", ">Send<"))
+        workflow["file_mtimes"] = {}
+        _check_ui_changes([ui_file], workflow, project_dir, "app")
+
+        event = workflow["history"][-1]
+        self.assertIn("1 properties changed", event["description"])
+        self.assertEqual(event["changes"]["modified"], ["submit"])
+
+    def test_edit_between_sessions_has_no_false_diff(self):
+        """Test a change made while not watching is not reported as 'no widget changes'"""
+        from pygubuai import workflow as workflow_module
+
+        project_dir = pathlib.Path(tempfile.mkdtemp())
+        ui_file = project_dir / "app.ui"
+        ui_file.write_text(BASE_UI)
+        workflow = workflow_module.load_workflow(project_dir)
+        workflow_module._check_ui_changes([ui_file], workflow, project_dir, "app")
+
+        # A new session: the tree cache is gone and the file was edited meanwhile
+        workflow_module._ui_trees.clear()
+        ui_file.write_text(BASE_UI.replace(">Go<", ">Send<"))
+        workflow["file_mtimes"] = {}
+        workflow_module._check_ui_changes([ui_file], workflow, project_dir, "app")
+        event = workflow["history"][-1]
+        self.assertNotIn("changes", event)
+        self.assertIn("previous version unavailable", event["description"])
+
+        # The edited version is the baseline for the next change
+        ui_file.write_text(BASE_UI.replace(">Go<", ">Stop<"))
+        workflow["file_mtimes"] = {}
+        workflow_module._check_ui_changes([ui_file], workflow, project_dir, "app")
+        self.assertEqual(workflow["history"][-1]["changes"]["modified"], ["submit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
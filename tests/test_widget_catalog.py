@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for the indexed widget catalog"""
+import pathlib
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from pygubuai import widgets as pygubuai_widgets  # noqa: E402
+from pygubuai.widget_catalog import WidgetCatalog  # noqa: E402
+from pygubuai.widget_data import WIDGET_LIBRARY  # noqa: E402
+
+PACK = {
+    "customtkinter.CTkButton": {
+        "category": "action",
+        "description": "Rounded modern button",
+        "properties": ["corner_radius", "fg_color"],
+        "use_cases": ["Modern UIs"],
+    },
+    "tkcalendar.DateEntry": {"category": "dates", "description": "Entry with a calendar dropdown"},
+}
+
+
+class TestWidgetCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = WidgetCatalog()
+
+    def test_category_buckets(self):
+        """Test category buckets agree with the library"""
+        expected = {name for name, info in WIDGET_LIBRARY.items() if info["category"] == "input"}
+        self.assertEqual(set(self.catalog.by_category("input")), expected)
+        self.assertEqual(sum(self.catalog.category_counts().values()), len(WIDGET_LIBRARY))
+        self.assertEqual(self.catalog.by_category("missing"), {})
+
+    def test_ranked_prefix_and_fuzzy_search(self):
+        """Test completion of partial words, typo tolerance and ranking"""
+        self.assertEqual(self.catalog.search("entr")[0].name, "ttk.Entry")
+        self.assertEqual(self.catalog.search("ttk.Prog")[0].name, "ttk.Progressbar")
+        self.assertEqual(self.catalog.search("progresbar")[0].name, "ttk.Progressbar")
+        self.assertIn("ttk.Combobox", [r.name for r in self.catalog.search("dropdwn")])
+        self.assertEqual(self.catalog.search("text input")[0].name, "tk.Text")
+        self.assertEqual(self.catalog.search("volume", category="display"), [])
+        self.assertEqual(self.catalog.search("zzzz"), [])
+
+    def test_register_pack(self):
+        """Test runtime widget packs are bucketed, indexed and replaceable"""
+        self.catalog.register_pack("extras", PACK, {"dates": "Date Widgets"})
+        self.assertIn("customtkinter.CTkButton", self.catalog.by_category("action"))
+        self.assertEqual(self.catalog.search("rounded")[0].name, "customtkinter.CTkButton")
+        self.assertEqual(self.catalog.category_counts()["dates"], 1)
+
+        self.catalog.register_pack("extras", {"tkcalendar.DateEntry": PACK["tkcalendar.DateEntry"]})
+        self.assertNotIn("customtkinter.CTkButton", self.catalog)
+        self.assertEqual(self.catalog.search("rounded"), [])
+        with self.assertRaises(ValueError):
+            self.catalog.register("bad.Widget", {"description": "no category"})
+
+    def test_entry_point_packs_on_every_python(self):
+        """Test packs load from both entry_points() APIs (dict of groups on 3.9)"""
+        entry_point = mock.Mock()
+        entry_point.name = "extras"
+        entry_point.load.return_value = {"widgets": PACK, "categories": {"dates": "Date Widgets"}}
+
+        selectable = mock.Mock(spec=["select"])
+        selectable.select.return_value = [entry_point]
+        for installed in ({"pygubuai.widget_packs": [entry_point]}, selectable):
+            catalog = WidgetCatalog()
+            with mock.patch("importlib.metadata.entry_points", return_value=installed):
+                self.assertEqual(catalog.load_entry_point_packs(), 1)
+            self.assertIn("tkcalendar.DateEntry", catalog)
+
+    def test_search_is_uncapped_by_default(self):
+        """Test every match is returned unless a limit is given"""
+        library = {f"x.Widget{i}": {"category": "input", "description": "sample widget"} for i in range(30)}
+        catalog = WidgetCatalog(library)
+        self.assertEqual(len(catalog.search("sample")), 30)
+        self.assertEqual(len(catalog.search("sample", limit=5)), 5)
+
+    def test_widgets_module_uses_catalog(self):
+        """Test list/search/info helpers answer from the catalog"""
+        self.assertEqual(len(pygubuai_widgets.list_widgets()), len(WIDGET_LIBRARY))
+        self.assertEqual(list(pygubuai_widgets.search_widgets("button"))[0], "ttk.Button")
+        self.assertEqual(pygubuai_widgets.get_widget_info("ttk.Entry")["category"], "input")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,6 +35,37 @@ class TestWidgetDetection(unittest.TestCase):
         self.assertIn("combobox", widget_types)
         self.assertIn("checkbutton", widget_types)
 
+    def test_word_boundaries(self):
+        """Test keywords only match whole words"""
+        widget_types = [w[0] for w in pygubuai_widgets.detect_widgets("show when the user clicked, with two buttons")]
+        self.assertEqual(widget_types, ["button"])
+        self.assertNotIn("treeview", [w[0] for w in pygubuai_widgets.detect_widgets("a checklist of buttons")])
+
+    def test_widget_class_names(self):
+        """Test Tk class names are detected as their widgets"""
+        detect = pygubuai_widgets.detect_widgets
+        self.assertEqual([w[0] for w in detect("app with a combobox and a treeview")], ["treeview", "combobox"])
+        self.assertEqual([w[0] for w in detect("settings with listbox")], ["treeview"])
+        self.assertEqual([w[0] for w in detect("two checkbuttons")], ["checkbutton"])
+
+    def test_keyword_positions(self):
+        """Test every matched keyword is reported with its position"""
+        matches = pygubuai_widgets.find_widget_keywords("Search page: table and dropdown")
+        self.assertEqual(
+            [(m.label, m.start) for m in matches],
+            [(("context", "search"), 0), (("widget", "treeview"), 13), (("widget", "combobox"), 23)],
+        )
+
+    def test_register_keywords(self):
+        """Test user keywords and widget types extend detection"""
+        self.addCleanup(pygubuai_widgets.WIDGET_PATTERNS.pop, "scale", None)
+        pygubuai_widgets.register_widget_keywords(
+            "scale", ["slider"], {"class": "ttk.Scale", "properties": {"orient": "horizontal"}}
+        )
+        self.assertEqual([w[0] for w in pygubuai_widgets.detect_widgets("volume slider")], ["scale"])
+        with self.assertRaises(ValueError):
+            pygubuai_widgets.register_widget_keywords("knob", ["dial"])
+
     def test_callback_extraction(self):
         """Test callback method extraction"""
         widgets = pygubuai_widgets.detect_widgets("app with button")
@@ -50,5 +81,46 @@ class TestWidgetDetection(unittest.TestCase):
         self.assertIn("btn1", xml_str)
 
 
+class TestBatchDetection(unittest.TestCase):
+    def test_detailed_detections(self):
+        """Test detections carry spans, keywords and confidence by source"""
+        text = "Orders table, another table and a dropdown"
+        treeview, combobox = pygubuai_widgets.detect_widgets_detailed(text)
+        self.assertEqual((treeview.widget_type, treeview.start, treeview.end), ("treeview", 7, 12))
+        self.assertGreater(treeview.confidence, combobox.confidence)
+        self.assertEqual(combobox.source, "keyword")
+
+        sources = {d.source for d in pygubuai_widgets.detect_widgets_detailed("login")}
+        self.assertEqual(sources, {"context"})
+        self.assertEqual(pygubuai_widgets.detect_widgets_detailed("nothing here")[0].source, "default")
+
+    def test_batch_matches_single_and_dedupes(self):
+        """Test batch results keep input order, match single detection and reuse duplicates"""
+        descriptions = [f"form {i % 5}" if i % 2 else f"table with checkbox {i % 7}" for i in range(600)]
+        detector = pygubuai_widgets.BatchDetector(jobs=2, chunk_size=2)
+        results = list(detector.detect(iter(descriptions)))
+        self.assertEqual(results, [pygubuai_widgets.detect_widgets_detailed(d) for d in descriptions])
+        self.assertEqual((detector.total, detector.computed), (600, 12))
+
+    def test_small_memo_keeps_block_hits(self):
+        """Test memo hits survive misses in the same block evicting them"""
+        descriptions = ["x", "y", "x", "z", "y", "w", "x"]
+        detector = pygubuai_widgets.BatchDetector(jobs=1, chunk_size=2, memo_size=2)
+        results = list(detector.detect(descriptions))
+        self.assertEqual(results, [pygubuai_widgets.detect_widgets_detailed(d) for d in descriptions])
+        self.assertLessEqual(len(detector._memo), 2)
+
+    def test_read_corpus(self):
+        """Test corpus lines may be strings or objects and bad lines are skipped"""
+        import io
+        from contextlib import redirect_stderr
+
+        lines = ['"a button"', '{"id": "x", "description": "a table"}', "not json", '{"text": "missing"}', ""]
+        with redirect_stderr(io.StringIO()) as err:
+            records = list(pygubuai_widgets.read_corpus(io.StringIO("\n".join(lines))))
+        self.assertEqual(records, [(1, "a button"), ("x", "a table")])
+        self.assertEqual(err.getvalue().count("Warning"), 2)
+
+
 if __name__ == "__main__":
     unittest.main()